@@ -2,12 +2,14 @@
 Flask 애플리케이션 팩토리
 """
 
+import gc
 import os
 import time
 import logging
 from flask import Flask, send_from_directory
 from flask_cors import CORS
 from app.config import get_config
+from app.utils.json_encoder import get_json_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,9 @@ def create_app(config_name: str = None) -> Flask:
     # 설정 초기화
     config_class.init_app(app)
 
+    # JSON 인코더 설정 검증 (알 수 없는 이름이면 요청 처리 전에 실패)
+    get_json_encoder(app.config["JSON_ENCODER"])
+
     # CORS 설정
     CORS(app, origins=app.config["CORS_ORIGINS"])
 
@@ -40,6 +45,31 @@ def create_app(config_name: str = None) -> Flask:
     # 에러 핸들러 등록
     register_error_handlers(app)
 
+    # 레시피 이미지 디렉토리 설정
+    configure_recipe_images(app)
+
+    # 카탈로그 스냅샷 로드
+    load_catalog_snapshot(app)
+
+    # 카탈로그 데이터 및 인덱스 사전 로드
+    preload_catalog(app)
+
+    # 이미지 파일 목록 로드 (응답 캐시 버전에 이미지 fingerprint가 포함되므로 미리 채우기 전에 로드)
+    load_image_manifest(app)
+
+    # 전체 카탈로그 응답 캐시 미리 채우기
+    warm_response_cache(app)
+
+    # 추천 결과/페르소나 캐시 설정
+    configure_recommendation_cache(app)
+    configure_persona_cache(app)
+
+    # LLM/임베딩 요청 병합 설정
+    configure_single_flight(app)
+
+    # 카탈로그 파일 감시 (핫 리로드)
+    start_catalog_watcher(app)
+
     # RAG 벡터 DB 자동 초기화
     initialize_rag(app)
 
@@ -84,6 +114,201 @@ def register_error_handlers(app: Flask):
         return response_helper.error_response(message="잘못된 요청입니다.", status_code=400, error_code="BAD_REQUEST")
 
 
+def configure_recipe_images(app: Flask):
+    """레시피 이미지 매핑이 사용할 이미지 디렉토리를 설정합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - 카탈로그를 로드하기 전에 실행 (매핑을 만들 때 디렉토리 목록으로 이미지 존재 여부 확인)
+    """
+    from app.utils.recipe_images import RecipeImageMap
+
+    RecipeImageMap.default_directory = os.path.join(app.static_folder, "recipes")
+
+
+def load_catalog_snapshot(app: Flask):
+    """미리 컴파일된 카탈로그 스냅샷이 있으면 로드합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - USE_CATALOG_SNAPSHOT 설정이 True인 경우에만 로드
+        - 스냅샷이 없거나 원본 JSON이 바뀐 경우 JSON 원본을 그대로 사용
+        - 스냅샷 생성: python scripts/build_catalog_snapshot.py
+    """
+    if not app.config.get("USE_CATALOG_SNAPSHOT"):
+        return
+
+    from app.utils.data_loader import data_loader
+
+    data_loader.load_snapshot(app.config["CATALOG_SNAPSHOT_PATH"])
+
+
+def preload_catalog(app: Flask):
+    """카탈로그 JSON과 모든 인덱스를 미리 로드합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - PRELOAD_CATALOG 설정이 True인 경우에만 로드
+        - gunicorn preload_app 사용 시 마스터에서 한 번만 로드되고 워커는 copy-on-write로 공유
+        - 로드 후 gc.collect()로 임시 객체를 정리해 공유 페이지에 빈 공간이 남지 않도록 함
+        - gc.freeze()는 gunicorn.conf.py의 pre_fork 훅에서 호출
+    """
+    if not app.config.get("PRELOAD_CATALOG"):
+        return
+
+    from app.utils.catalog import catalog
+    from app.utils.data_loader import data_loader
+
+    start_time = time.time()
+    loaded = data_loader.preload()
+    catalog.warm(data_loader)
+    gc.collect()
+
+    elapsed_time = time.time() - start_time
+    logger.info(f"카탈로그 사전 로드 완료: {len(loaded)}개 파일 (소요 시간: {elapsed_time:.2f}초)")
+
+
+# 앱 시작 시 응답 캐시를 미리 채울 전체 카탈로그 엔드포인트
+RESPONSE_CACHE_WARM_PATHS = ("/", "/drink/all", "/drink/types", "/recipe/all", "/recipe/categories", "/ingredient/all")
+
+
+def warm_response_cache(app: Flask):
+    """전체 카탈로그 엔드포인트의 응답 바이트를 미리 만들어 캐싱합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - RESPONSE_CACHE_ENABLED와 PRELOAD_CATALOG 설정이 모두 True인 경우에만 실행
+        - gunicorn preload 시 마스터에서 만든 응답 바이트와 br/gzip 압축본을 워커들이 공유
+          (미리 채우는 요청은 압축본을 최대 압축률로 함께 만들므로 인코딩별 요청은 필요 없음)
+        - 데이터가 다시 로드되면 첫 요청 시 새 버전으로 다시 캐싱
+    """
+    if not (app.config.get("RESPONSE_CACHE_ENABLED") and app.config.get("PRELOAD_CATALOG")):
+        return
+
+    from app.utils.response_cache import WARM_ENVIRON_KEY
+
+    with app.test_client() as client:
+        for path in RESPONSE_CACHE_WARM_PATHS:
+            response = client.get(path, environ_base={WARM_ENVIRON_KEY: True})
+            if response.status_code != 200:
+                logger.warning(f"응답 캐시 미리 채우기 실패: {path} ({response.status_code})")
+
+
+def load_image_manifest(app: Flask):
+    """이미지 디렉토리의 파일 목록을 만들고 이미지 캐시 크기를 설정합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - IMAGE_CACHE_ENABLED 설정이 True인 경우에만 실행
+        - 없는 이미지 요청은 파일 목록으로 바로 404 응답 (디스크 확인 없음)
+        - 이미지 바이트는 처음 요청될 때 캐싱 (IMAGE_CACHE_MAX_BYTES까지 LRU)
+    """
+    if not app.config.get("IMAGE_CACHE_ENABLED"):
+        return
+
+    from app.utils.image_cache import IMAGE_DIRS, image_cache
+
+    image_cache.max_bytes = app.config["IMAGE_CACHE_MAX_BYTES"]
+    count = sum(len(image_cache.load_manifest(os.path.join(app.static_folder, name))) for name in IMAGE_DIRS)
+    logger.info(f"이미지 파일 목록 로드 완료: {count}개")
+
+
+def configure_recommendation_cache(app: Flask):
+    """추천 결과 캐시의 pool 크기와 보관 시간을 설정합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - RECOMMENDATION_CACHE_ENABLED 설정이 True인 경우에만 실행
+        - 결과는 워커별 메모리에 보관하며 처음 요청될 때 채움
+    """
+    if not app.config.get("RECOMMENDATION_CACHE_ENABLED"):
+        return
+
+    from app.utils.recommendation_cache import recommendation_cache
+
+    recommendation_cache.pool_size = app.config["RECOMMENDATION_POOL_SIZE"]
+    recommendation_cache.ttl = app.config["RECOMMENDATION_CACHE_TTL"]
+
+
+def configure_persona_cache(app: Flask):
+    """페르소나 캐시의 최대 항목 수와 갱신 한도를 설정합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - PERSONA_CACHE_ENABLED 설정이 True인 경우에만 실행
+        - 요약은 워커별 메모리에 보관
+    """
+    if not app.config.get("PERSONA_CACHE_ENABLED"):
+        return
+
+    from app.utils.persona_cache import persona_cache
+
+    persona_cache.max_entries = app.config["PERSONA_CACHE_MAX_ENTRIES"]
+    persona_cache.max_incremental = app.config["PERSONA_MAX_INCREMENTAL_TASTINGS"]
+
+
+def configure_single_flight(app: Flask):
+    """요청 병합의 대기 제한 시간과 프로세스 간 잠금 디렉토리를 설정합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - 프로세스 안의 병합은 항상 사용
+        - SINGLE_FLIGHT_LOCK_DIR이 설정된 경우에만 키별 잠금 파일로 워커 프로세스 간에도 병합
+    """
+    from app.utils.single_flight import single_flight
+
+    single_flight.timeout = app.config["SINGLE_FLIGHT_TIMEOUT"]
+
+    lock_dir = app.config.get("SINGLE_FLIGHT_LOCK_DIR")
+    if not lock_dir:
+        return
+
+    single_flight.lock_dir = lock_dir
+    logger.info(f"프로세스 간 요청 병합 사용 (잠금 디렉토리: {lock_dir})")
+
+
+def start_catalog_watcher(app: Flask):
+    """카탈로그 JSON 파일 변경을 감시해 자동으로 다시 로드합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Note:
+        - CATALOG_WATCH_INTERVAL이 0보다 큰 경우에만 감시 (프로덕션 기본값 30초)
+        - 새 데이터와 인덱스를 모두 만든 뒤 참조만 교체하므로 요청이 블로킹되지 않음
+        - gunicorn preload 시 감시 스레드는 각 워커에서 다시 시작
+    """
+    interval = app.config.get("CATALOG_WATCH_INTERVAL", 0)
+    if interval <= 0:
+        return
+
+    from app.utils.catalog_watcher import CatalogWatcher
+    from app.utils.data_loader import data_loader
+
+    watcher = app.extensions.get("catalog_watcher")
+    if watcher is None:
+        watcher = CatalogWatcher(data_loader, interval)
+        app.extensions["catalog_watcher"] = watcher
+    watcher.start()
+    logger.info(f"카탈로그 파일 감시 시작 (주기: {interval}초)")
+
+
 def initialize_rag(app: Flask):
     """RAG 벡터 DB를 자동 초기화합니다.
 
@@ -115,6 +340,10 @@ def initialize_rag(app: Flask):
         elapsed_time = time.time() - start_time
         logger.info(f"RAG 벡터 DB 초기화 완료 (소요 시간: {elapsed_time:.2f}초)")
 
+        # 워커는 첫 RAG 요청 시 자신의 ChromaDB 클라이언트를 새로 엽니다.
+        del rag_service
+        release_vector_db_clients()
+
     except Exception as e:
         elapsed_time = time.time() - start_time
         logger.warning(f"RAG 벡터 DB 초기화 실패 (소요 시간: {elapsed_time:.2f}초): {e}")
@@ -122,3 +351,16 @@ def initialize_rag(app: Flask):
         logger.warning("RAG 초기화를 수동으로 실행하려면: python scripts/initialize_vector_db.py")
 
 
+def release_vector_db_clients():
+    """현재 프로세스에서 연 ChromaDB 클라이언트를 해제합니다.
+
+    Note:
+        - ChromaDB 클라이언트는 SQLite 연결과 백그라운드 스레드를 가지므로 fork 후 공유하면 안 됨
+        - gunicorn preload 시 마스터에서 초기화에 사용한 클라이언트를 fork 전에 정리
+    """
+    try:
+        from chromadb.api.client import SharedSystemClient
+
+        SharedSystemClient.clear_system_cache()
+    except Exception as e:
+        logger.warning(f"ChromaDB 클라이언트 해제 실패: {e}")
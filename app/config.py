@@ -19,6 +19,31 @@ class Config:
     DATA_DIR = os.path.join(BASE_DIR, "data")
     STATIC_DIR = os.path.join(BASE_DIR, "static")
 
+    # 이미지 변형(?w=) 저장 디렉토리 (scripts/build_image_variants.py로 미리 생성, 없으면 요청 시 생성)
+    IMAGE_VARIANT_DIR = os.environ.get("IMAGE_VARIANT_DIR") or os.path.join(BASE_DIR, "static", "variants")
+
+    # 이미지 캐시 설정: 시작 시 이미지 파일 목록(manifest)을 만들고 자주 요청되는 이미지 바이트를 메모리에 보관
+    # IMAGE_CACHE_MAX_BYTES는 워커별 한도 (전체 메모리 사용량은 워커 수 × 한도)
+    IMAGE_CACHE_ENABLED = os.environ.get("IMAGE_CACHE_ENABLED", "false").lower() == "true"
+    IMAGE_CACHE_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    # 카탈로그 스냅샷 설정 (스냅샷이 없거나 오래되면 JSON 원본 사용)
+    USE_CATALOG_SNAPSHOT = os.environ.get("USE_CATALOG_SNAPSHOT", "true").lower() == "true"
+    CATALOG_SNAPSHOT_PATH = os.environ.get("CATALOG_SNAPSHOT_PATH") or os.path.join(DATA_DIR, "catalog.snapshot")
+
+    # 카탈로그 사전 로드 설정 (gunicorn --preload 시 마스터에서 로드해 워커 간 공유)
+    PRELOAD_CATALOG = os.environ.get("PRELOAD_CATALOG", "true").lower() == "true"
+
+    # 카탈로그 파일 감시 주기(초). 0이면 감시하지 않음 (변경 시 워커 재시작 없이 핫 리로드)
+    CATALOG_WATCH_INTERVAL = float(os.environ.get("CATALOG_WATCH_INTERVAL", "0"))
+
+    # 응답 설정: JSON_COMPACT는 들여쓰기 없는 JSON 출력, RESPONSE_CACHE_ENABLED는 카탈로그 응답 바이트 캐싱
+    JSON_COMPACT = os.environ.get("JSON_COMPACT", "false").lower() == "true"
+    RESPONSE_CACHE_ENABLED = os.environ.get("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+
+    # JSON 인코더: auto(orjson이 설치되어 있으면 orjson, 없으면 표준 json), orjson, stdlib
+    JSON_ENCODER = os.environ.get("JSON_ENCODER", "auto").lower()
+
     # API 설정
     API_HOST = os.environ.get("API_HOST") or "0.0.0.0"
     SERVER_PORT = int(os.environ.get("SERVER_PORT") or os.environ.get("API_PORT") or 8080)
@@ -42,6 +67,22 @@ class Config:
     EMBEDDING_MODEL = os.environ.get("EMBEDDING_MODEL", "text-embedding-3-small")
     RAG_TOP_K = int(os.environ.get("RAG_TOP_K", "10"))
 
+    # 추천 결과 캐시: 같은 입력의 서로 다른 추천 결과를 POOL_SIZE개까지 TTL초 동안 보관하고 차례로 응답
+    RECOMMENDATION_CACHE_ENABLED = os.environ.get("RECOMMENDATION_CACHE_ENABLED", "false").lower() == "true"
+    RECOMMENDATION_POOL_SIZE = int(os.environ.get("RECOMMENDATION_POOL_SIZE", "3"))
+    RECOMMENDATION_CACHE_TTL = float(os.environ.get("RECOMMENDATION_CACHE_TTL", "3600"))
+
+    # 페르소나 캐시: 사용자 정보+테이스팅 이력 해시별 요약을 보관하고, 테이스팅이 추가되면 기존 요약을 갱신
+    PERSONA_CACHE_ENABLED = os.environ.get("PERSONA_CACHE_ENABLED", "false").lower() == "true"
+    PERSONA_CACHE_MAX_ENTRIES = int(os.environ.get("PERSONA_CACHE_MAX_ENTRIES", "4096"))
+    # 전체 생성 없이 갱신으로만 반영할 최대 테이스팅 수 (넘으면 전체 이력으로 다시 생성해 요약이 멀어지지 않도록 함)
+    PERSONA_MAX_INCREMENTAL_TASTINGS = int(os.environ.get("PERSONA_MAX_INCREMENTAL_TASTINGS", "10"))
+
+    # 요청 병합: 같은 LLM/임베딩 호출이 동시에 들어오면 하나만 실행 (디렉토리를 지정하면 워커 프로세스 간에도 병합)
+    SINGLE_FLIGHT_LOCK_DIR = os.environ.get("SINGLE_FLIGHT_LOCK_DIR", "")
+    # 병합된 요청이 다른 호출의 완료를 기다리는 최대 시간 (초, LLM_TIMEOUT보다 길게)
+    SINGLE_FLIGHT_TIMEOUT = float(os.environ.get("SINGLE_FLIGHT_TIMEOUT", "120"))
+
     # 파일 업로드 설정
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif"}
@@ -64,6 +105,12 @@ class ProductionConfig(Config):
 
     DEBUG = False
     LOG_LEVEL = "WARNING"
+    CATALOG_WATCH_INTERVAL = float(os.environ.get("CATALOG_WATCH_INTERVAL", "30"))
+    JSON_COMPACT = os.environ.get("JSON_COMPACT", "true").lower() == "true"
+    RESPONSE_CACHE_ENABLED = os.environ.get("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    IMAGE_CACHE_ENABLED = os.environ.get("IMAGE_CACHE_ENABLED", "true").lower() == "true"
+    RECOMMENDATION_CACHE_ENABLED = os.environ.get("RECOMMENDATION_CACHE_ENABLED", "true").lower() == "true"
+    PERSONA_CACHE_ENABLED = os.environ.get("PERSONA_CACHE_ENABLED", "true").lower() == "true"
 
     @staticmethod
     def init_app(app):
@@ -3,6 +3,7 @@
 """
 
 from flask import Blueprint
+from app.utils.response_cache import cache_response
 from app.utils.response_helper import response_helper
 from app.utils.data_loader import data_loader
 
@@ -10,6 +11,7 @@ default_bp = Blueprint("default", __name__)
 
 
 @default_bp.route("/")
+@cache_response
 def index():
     """
     API 문서 엔드포인트
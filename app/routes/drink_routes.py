@@ -2,35 +2,68 @@
 음료 관련 API 라우트
 """
 
-from flask import Blueprint, send_from_directory, current_app
+from flask import Blueprint, current_app, request
 from app.services.drink_service import drink_service
+from app.utils.pagination import parse_fields, parse_page_request
+from app.utils.response_cache import cache_response
 from app.utils.response_helper import response_helper
 from app.utils.validators import validator
+import math
 import os
 
 # Blueprint 생성
 drink_bp = Blueprint("drinks", __name__, url_prefix="/drink")
 
+# 일괄 조회에서 한 번에 요청할 수 있는 최대 코드 수
+MAX_BATCH_SIZE = 200
+
+
+def _with_image_url(drink: dict) -> dict:
+    """음료에 해시 이미지 URL(image_url, 이미지가 없으면 null)을 추가한 사본을 반환합니다."""
+    image_dir = os.path.join(current_app.static_folder, "drinks")
+    code = drink.get("code")
+    image_url = response_helper.image_url("drinks.get_drink_image", image_dir, f"{code}.png", code=code)
+    return {**drink, "image_url": image_url}
+
 
 @drink_bp.route("/all")
+@cache_response
 def get_all_drinks():
-    """모든 음료 데이터를 반환합니다."""
+    """
+    모든 음료 데이터를 반환합니다.
+
+    Query Parameters:
+        limit: 페이지 크기 (지정하면 total_count/results/next_cursor 형식으로 반환)
+        cursor: 이전 응답의 next_cursor
+        fields: 반환할 필드 (쉼표로 구분, 예: code,name)
+    """
     try:
+        page, errors = parse_page_request(request.args)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
         drinks = drink_service.get_all_drinks()
-        return response_helper.json_response(drinks)
+        columns = drink_service.get_field_columns() if page.fields else None
+        return response_helper.page_response(drinks, page, columns, envelope=False)
     except Exception as e:
         return response_helper.error_response(message="음료 데이터를 가져오는 중 오류가 발생했습니다.", status_code=500)
 
 
 @drink_bp.route("/image=<code>")
 def get_drink_image(code):
-    """음료 이미지를 반환합니다."""
+    """
+    음료 이미지를 반환합니다.
+
+    Query Parameters:
+        w: 너비(px). 지정하면 64/128/256/512 중 가장 가까운 크기 변형을 반환 (Accept에 image/webp가 있으면 WebP)
+        v: 원본 이미지의 ETag. 현재 이미지와 같으면 Cache-Control: immutable로 응답
+    """
     try:
-        static_dir = current_app.static_folder
-        image_path = os.path.join(static_dir, "drinks", f"{code}.png")
+        image_dir = os.path.join(current_app.static_folder, "drinks")
 
-        if os.path.exists(image_path):
-            return send_from_directory(os.path.join(static_dir, "drinks"), f"{code}.png")
+        if response_helper.image_exists(image_dir, f"{code}.png"):
+            # 내용 해시 ETag로 304 처리
+            return response_helper.image_response(image_dir, f"{code}.png", request.args.get("w"))
         else:
             return response_helper.not_found_response("이미지")
     except Exception as e:
@@ -38,8 +71,9 @@ def get_drink_image(code):
 
 
 @drink_bp.route("/code=<code>")
+@cache_response
 def get_drink_by_code(code):
-    """코드로 음료를 검색합니다."""
+    """코드로 음료를 검색합니다 (image_url에 해시 이미지 URL 포함)."""
     try:
         # 입력 검증
         validation_errors = validator.validate_code(code, "음료 코드")
@@ -51,14 +85,62 @@ def get_drink_by_code(code):
 
         drink = drink_service.search_by_code(sanitized_code)
         if drink:
-            return response_helper.json_response(drink)
+            return response_helper.json_response(_with_image_url(drink))
         else:
             return response_helper.not_found_response("음료")
     except Exception as e:
         return response_helper.error_response(message="음료 검색 중 오류가 발생했습니다.", status_code=500)
 
 
+@drink_bp.route("/batch", methods=["POST"])
+def get_drinks_by_codes():
+    """
+    여러 코드로 음료를 한 번에 조회합니다.
+
+    Request Body:
+    {
+        "codes": ["8801234000111", "0000088001159"]
+    }
+
+    Query Parameters:
+        fields: 반환할 필드 (쉼표로 구분, 예: code,name)
+    """
+    try:
+        data = request.get_json(silent=True)
+        if data is None:
+            return response_helper.error_response("잘못된 JSON 형식입니다. JSON 문법을 확인해주세요.", 400)
+
+        codes = data.get("codes") if isinstance(data, dict) else None
+        validation_errors = validator.validate_code_list(codes, max_items=MAX_BATCH_SIZE)
+        if validation_errors:
+            return response_helper.validation_error_response(validation_errors)
+
+        items = drink_service.lookup_by_codes(codes)
+        fields = parse_fields(request.args)
+        columns = drink_service.get_field_columns() if fields else None
+        return response_helper.batch_response(codes, items, fields, columns)
+    except Exception as e:
+        return response_helper.error_response(message="음료 일괄 조회 중 오류가 발생했습니다.", status_code=500)
+
+
+@drink_bp.route("/prefix=<prefix>")
+@cache_response
+def get_drinks_by_code_prefix(prefix):
+    """바코드 prefix로 음료를 검색합니다."""
+    try:
+        # 입력 검증
+        validation_errors = validator.validate_code(prefix, "바코드 prefix")
+        if validation_errors:
+            return response_helper.validation_error_response(validation_errors)
+
+        drinks = drink_service.search_by_code_prefix(prefix)
+        return response_helper.search_response(results=drinks, query=prefix)
+    except Exception as e:
+        return response_helper.error_response(message="음료 검색 중 오류가 발생했습니다.", status_code=500)
+
+
 @drink_bp.route("/name=<name>")
+@cache_response
 def get_drink_by_name(name):
     """이름으로 음료를 검색합니다."""
     try:
@@ -77,16 +159,107 @@ def get_drink_by_name(name):
 
 
 @drink_bp.route("/type=<drink_type>")
+@cache_response
 def get_drink_by_type(drink_type):
-    """타입으로 음료를 검색합니다."""
+    """타입으로 음료를 검색합니다 (limit/cursor/fields 지원)."""
     try:
+        page, errors = parse_page_request(request.args)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
         drinks = drink_service.search_by_type(drink_type)
-        return response_helper.search_response(results=drinks, query=drink_type)
+        columns = drink_service.get_field_columns() if page.fields else None
+        return response_helper.page_response(drinks, page, columns, query=drink_type)
     except Exception as e:
         return response_helper.error_response(message="음료 검색 중 오류가 발생했습니다.", status_code=500)
 
 
+def _parse_float_arg(name: str, errors: list):
+    """쿼리 파라미터를 실수로 변환합니다 (없으면 None, 형식 오류는 errors에 추가)."""
+    value = request.args.get(name)
+    if value is None or value.strip() == "":
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        errors.append(f"{name}은(는) 숫자여야 합니다.")
+        return None
+    return number
+
+
+def _parse_list_arg(name: str):
+    """쉼표로 구분된 쿼리 파라미터를 리스트로 변환합니다 (없으면 None)."""
+    values = [value.strip() for value in request.args.get(name, "").split(",") if value.strip()]
+    return values or None
+
+
+def _parse_filter_args(errors: list) -> dict:
+    """필터 쿼리 파라미터를 DrinkService.filter_drinks 인자로 변환합니다 (형식 오류는 errors에 추가)."""
+    return {
+        "types": _parse_list_arg("type"),
+        "bases": _parse_list_arg("base"),
+        "abv_min": _parse_float_arg("abv_min", errors),
+        "abv_max": _parse_float_arg("abv_max", errors),
+        "volume_min": _parse_float_arg("volume_min", errors),
+        "volume_max": _parse_float_arg("volume_max", errors),
+    }
+
+
+@drink_bp.route("/filter")
+@cache_response
+def filter_drinks():
+    """
+    타입, 베이스, 도수 범위, 용량 범위로 음료를 필터링하고 패싯 개수를 함께 반환합니다.
+
+    Query Parameters:
+        type: 타입 (쉼표로 여러 개 지정, 예: 위스키,진)
+        base: 베이스 코드 (쉼표로 여러 개 지정, 예: 100,600)
+        abv_min, abv_max: 도수 범위
+        volume_min, volume_max: 용량 범위 (ml)
+    """
+    try:
+        errors = []
+        filters = _parse_filter_args(errors)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
+        drinks, facets = drink_service.filter_drinks(**filters)
+        return response_helper.search_response(results=drinks, facets=facets)
+    except Exception as e:
+        return response_helper.error_response(message="음료 필터링 중 오류가 발생했습니다.", status_code=500)
+
+
+@drink_bp.route("/export")
+def export_drinks():
+    """
+    음료 카탈로그를 NDJSON(한 줄에 음료 하나)으로 스트리밍합니다.
+
+    Query Parameters:
+        type, base, abv_min, abv_max, volume_min, volume_max: /drink/filter와 같은 필터 (없으면 전체)
+        fields: 내보낼 필드 (쉼표로 구분)
+    """
+    try:
+        errors = []
+        filters = _parse_filter_args(errors)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
+        if any(value is not None for value in filters.values()):
+            drinks, _ = drink_service.filter_drinks(**filters)
+        else:
+            drinks = drink_service.get_all_drinks()
+
+        fields = parse_fields(request.args)
+        columns = drink_service.get_field_columns() if fields else None
+        return response_helper.ndjson_response(drinks, fields, columns)
+    except Exception as e:
+        return response_helper.error_response(message="음료 데이터를 내보내는 중 오류가 발생했습니다.", status_code=500)
+
+
 @drink_bp.route("/types")
+@cache_response
 def get_drink_types():
     """사용 가능한 모든 음료 타입을 반환합니다."""
     try:
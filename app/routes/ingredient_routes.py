@@ -2,37 +2,32 @@
 재료 관련 라우트
 """
 
-import json
-import os
-from flask import Blueprint
+from flask import Blueprint, request
+from app.services.ingredient_service import ingredient_service
+from app.utils.data_loader import data_loader
+from app.utils.pagination import parse_fields
+from app.utils.response_cache import cache_response
 from app.utils.response_helper import response_helper
+from app.utils.validators import validator
 
 ingredient_bp = Blueprint("ingredient", __name__)
 
+# 일괄 조회에서 한 번에 요청할 수 있는 최대 코드 수
+MAX_BATCH_SIZE = 200
+
 
 def load_ingredients():
     """
-    allIngredients.json 파일에서 재료 데이터를 로드합니다.
+    allIngredients.json 재료 데이터를 반환합니다 (DataLoader 캐시 사용).
 
     Returns:
         list: 재료 목록
     """
-    json_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'data',
-        'allIngredients.json'
-    )
-
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"재료 데이터 파일을 찾을 수 없습니다: {json_path}")
-    except json.JSONDecodeError:
-        raise ValueError("재료 데이터 파일의 형식이 올바르지 않습니다.")
+    return data_loader.get_all_ingredients()
 
 
 @ingredient_bp.route("/ingredient/")
+@cache_response
 def get_ingredients():
     """
     모든 재료 목록을 반환합니다.
@@ -55,6 +50,7 @@ def get_ingredients():
 
 
 @ingredient_bp.route("/ingredient/all")
+@cache_response
 def get_all_ingredients():
     """
     모든 재료 목록을 반환합니다. (/ingredient/와 동일)
@@ -74,3 +70,38 @@ def get_all_ingredients():
             status_code=500,
             error_code="INGREDIENT_LOAD_ERROR"
         )
+
+
+@ingredient_bp.route("/ingredient/batch", methods=["POST"])
+def get_ingredients_by_codes():
+    """
+    여러 코드로 재료를 한 번에 조회합니다.
+
+    Request Body:
+    {
+        "codes": ["300", "600"]
+    }
+
+    Query Parameters:
+        fields: 반환할 필드 (쉼표로 구분, 예: code,name)
+    """
+    try:
+        data = request.get_json(silent=True)
+        if data is None:
+            return response_helper.error_response("잘못된 JSON 형식입니다. JSON 문법을 확인해주세요.", 400)
+
+        codes = data.get("codes") if isinstance(data, dict) else None
+        validation_errors = validator.validate_code_list(codes, max_items=MAX_BATCH_SIZE)
+        if validation_errors:
+            return response_helper.validation_error_response(validation_errors)
+
+        items = ingredient_service.lookup_by_codes(codes)
+        fields = parse_fields(request.args)
+        columns = ingredient_service.get_field_columns() if fields else None
+        return response_helper.batch_response(codes, items, fields, columns)
+    except Exception as e:
+        return response_helper.error_response(
+            message=f"재료 일괄 조회 중 오류가 발생했습니다: {str(e)}",
+            status_code=500,
+            error_code="INGREDIENT_LOAD_ERROR"
+        )
@@ -2,21 +2,48 @@
 레시피 관련 API 라우트
 """
 
-from flask import Blueprint, send_from_directory, current_app
+from flask import Blueprint, request
 from app.services.recipe_service import recipe_service
+from app.utils.pagination import parse_fields, parse_page_request
+from app.utils.response_cache import cache_response
 from app.utils.response_helper import response_helper
-import os
+from app.utils.validators import validator
 
 # Blueprint 생성
 recipe_bp = Blueprint("recipes", __name__, url_prefix="/recipe")
 
+# 근접 레시피 검색에서 허용하는 부족 재료 최대 개수
+MAX_MISSING_INGREDIENTS = 5
+
+# 구매 재료 추천에서 허용하는 재료 최대 개수
+MAX_PURCHASE_COUNT = 5
+
+# 일괄 조회에서 한 번에 요청할 수 있는 최대 코드 수
+MAX_BATCH_SIZE = 200
+
+
+def _with_image_url(recipe: dict) -> dict:
+    """레시피에 해시 이미지 URL(image_url, 이미지가 없으면 null)을 추가한 사본을 반환합니다."""
+    image_map = recipe_service.get_image_map()
+    code = str(recipe.get("code"))
+    filename = image_map.filename(code)
+    image_url = None
+    if filename is not None:
+        image_url = response_helper.image_url(
+            "recipes.get_recipe_image_by_code", image_map.directory, filename, code=code
+        )
+    return {**recipe, "image_url": image_url}
+
 
 def _send_recipe_image(name):
     """
-    레시피 코드로 이미지 파일을 반환하는 내부 헬퍼 함수
+    레시피 코드 또는 이름으로 이미지 파일을 반환하는 내부 헬퍼 함수
+
+    카탈로그 로드 시 만든 코드/이름 → 이미지 파일 매핑에서 찾고,
+    정확히 일치하는 코드/이름이 없으면 부분 일치하는 첫 번째 레시피를 사용합니다.
     
     Args:
-        code: 레시피 코드
+        name: 레시피 코드, 한국어 이름 또는 영어 이름
         
     Returns:
         이미지 파일 또는 에러 응답
@@ -30,32 +57,27 @@ def _send_recipe_image(name):
                 error_code="INVALID_INPUT"
             )
         
-        # 레시피 존재 여부 확인
-        recipes = recipe_service.search_by_name(name)
-        if not recipes or len(recipes) == 0:
+        # 레시피 코드 찾기 (매핑에 없으면 부분 일치 검색)
+        image_map = recipe_service.get_image_map()
+        code = image_map.resolve(name) or recipe_service.get_code_by_name(name)
+        if code is None:
             return response_helper.error_response(
                 message=f"레시피 코드 '{name}'에 해당하는 레시피를 찾을 수 없습니다.",
                 status_code=404,
                 error_code="RECIPE_NOT_FOUND"
             )
         
-        # 첫 번째 검색 결과 사용
-        recipe = recipes[0]
-        name = recipe.get("english_name", "")
-        # static 디렉토리 경로 가져오기
-        static_dir = current_app.static_folder
-        image_path = os.path.join(static_dir, "recipes", f"{name}.png")
-        
-        # 이미지 파일 존재 여부 확인
-        if not os.path.exists(image_path):
+        # 이미지 파일 존재 여부 확인 (매핑을 만들 때 확인한 결과 사용)
+        filename = image_map.filename(code)
+        if filename is None:
             return response_helper.error_response(
                 message=f"레시피 '{name}'의 이미지 파일이 존재하지 않습니다.",
                 status_code=404,
                 error_code="IMAGE_FILE_NOT_FOUND"
             )
         
-        # 이미지 파일 반환
-        return send_from_directory(os.path.join(static_dir, "recipes"), f"{name}.png")
+        # 이미지 파일 반환 (내용 해시 ETag로 304 처리, ?w=이면 크기 변형)
+        return response_helper.image_response(image_map.directory, filename, request.args.get("w"))
         
     except PermissionError as e:
         return response_helper.error_response(
@@ -78,17 +100,55 @@ def _send_recipe_image(name):
 
 
 @recipe_bp.route("/all")
+@cache_response
 def get_all_recipes():
-    """모든 레시피 데이터를 반환합니다."""
+    """
+    모든 레시피 데이터를 반환합니다.
+
+    Query Parameters:
+        limit: 페이지 크기 (지정하면 total_count/results/next_cursor 형식으로 반환)
+        cursor: 이전 응답의 next_cursor
+        fields: 반환할 필드 (쉼표로 구분, 예: code,korean_name)
+    """
     try:
+        page, errors = parse_page_request(request.args)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
         recipes = recipe_service.get_all_recipes()
-        return response_helper.json_response(recipes)
+        columns = recipe_service.get_field_columns() if page.fields else None
+        return response_helper.page_response(recipes, page, columns, envelope=False)
     except Exception as e:
         return response_helper.error_response(
             message="레시피 데이터를 가져오는 중 오류가 발생했습니다.", status_code=500
         )
 
 
+@recipe_bp.route("/export")
+def export_recipes():
+    """
+    레시피 카탈로그를 NDJSON(한 줄에 레시피 하나)으로 스트리밍합니다.
+
+    Query Parameters:
+        name: 이름 검색어
+        difficulty: 난이도 (easy, medium, hard)
+        fields: 내보낼 필드 (쉼표로 구분)
+    """
+    try:
+        recipes = recipe_service.filter_recipes(
+            name=request.args.get("name", "").strip() or None,
+            difficulty=request.args.get("difficulty", "").strip() or None,
+        )
+
+        fields = parse_fields(request.args)
+        columns = recipe_service.get_field_columns() if fields else None
+        return response_helper.ndjson_response(recipes, fields, columns)
+    except Exception as e:
+        return response_helper.error_response(
+            message="레시피 데이터를 내보내는 중 오류가 발생했습니다.", status_code=500
+        )
+
+
 @recipe_bp.route("/image/code=<code>")
 def get_recipe_image_by_code(code):
     """레시피 코드로 이미지를 반환합니다."""
@@ -101,7 +161,7 @@ def get_recipe_image_by_code(code):
                 error_code="INVALID_INPUT"
             )
         
-        # 코드로 레시피 이름 찾기
+        # 코드로 레시피 찾기
         recipe = recipe_service.search_by_code(code)
 
         if not recipe:
@@ -111,7 +171,7 @@ def get_recipe_image_by_code(code):
                 error_code="RECIPE_NOT_FOUND"
             )
 
-        return _send_recipe_image(recipe.get("english_name", ""))
+        return _send_recipe_image(str(recipe.get("code")))
 
     except Exception as e:
         return response_helper.error_response(
@@ -142,29 +202,68 @@ def get_recipe_image_by_name(name):
 
 
 @recipe_bp.route("/name=<name>")
+@cache_response
 def get_recipe_by_name(name):
-    """이름으로 레시피를 검색합니다."""
+    """이름으로 레시피를 검색합니다 (limit/cursor/fields 지원)."""
     try:
+        page, errors = parse_page_request(request.args)
+        if errors:
+            return response_helper.validation_error_response(errors)
+
         recipes = recipe_service.search_by_name(name)
-        return response_helper.search_response(results=recipes, query=name)
+        columns = recipe_service.get_field_columns() if page.fields else None
+        return response_helper.page_response(recipes, page, columns, query=name)
     except Exception as e:
         return response_helper.error_response(message="레시피 검색 중 오류가 발생했습니다.", status_code=500)
 
 
 @recipe_bp.route("/code=<code>")
+@cache_response
 def get_recipe_by_code(code):
-    """코드로 레시피를 검색합니다."""
+    """코드로 레시피를 검색합니다 (image_url에 해시 이미지 URL 포함)."""
     try:
         recipe = recipe_service.search_by_code(code)
         if recipe:
-            return response_helper.json_response(recipe)
+            return response_helper.json_response(_with_image_url(recipe))
         else:
             return response_helper.not_found_response("레시피")
     except Exception as e:
         return response_helper.error_response(message="레시피 검색 중 오류가 발생했습니다.", status_code=500)
 
 
+@recipe_bp.route("/batch", methods=["POST"])
+def get_recipes_by_codes():
+    """
+    여러 코드로 레시피를 한 번에 조회합니다.
+
+    Request Body:
+    {
+        "codes": ["301", "600207019"]
+    }
+
+    Query Parameters:
+        fields: 반환할 필드 (쉼표로 구분, 예: code,korean_name)
+    """
+    try:
+        data = request.get_json(silent=True)
+        if data is None:
+            return response_helper.error_response("잘못된 JSON 형식입니다. JSON 문법을 확인해주세요.", 400)
+
+        codes = data.get("codes") if isinstance(data, dict) else None
+        validation_errors = validator.validate_code_list(codes, max_items=MAX_BATCH_SIZE)
+        if validation_errors:
+            return response_helper.validation_error_response(validation_errors)
+
+        items = recipe_service.lookup_by_codes(codes)
+        fields = parse_fields(request.args)
+        columns = recipe_service.get_field_columns() if fields else None
+        return response_helper.batch_response(codes, items, fields, columns)
+    except Exception as e:
+        return response_helper.error_response(message="레시피 일괄 조회 중 오류가 발생했습니다.", status_code=500)
+
+
 @recipe_bp.route("/with=<codes>")
+@cache_response
 def get_recipes_with_ingredients(codes):
     """재료 코드들로 만들 수 있는 레시피를 검색합니다."""
     try:
@@ -174,13 +273,56 @@ def get_recipes_with_ingredients(codes):
         return response_helper.error_response(message="레시피 검색 중 오류가 발생했습니다.", status_code=500)
 
 
+@recipe_bp.route("/with=<codes>/missing=<int:max_missing>")
+@cache_response
+def get_recipes_missing_ingredients(codes, max_missing):
+    """재료 코드들에 최대 max_missing개의 재료만 더하면 만들 수 있는 레시피를 검색합니다."""
+    try:
+        if max_missing > MAX_MISSING_INGREDIENTS:
+            return response_helper.validation_error_response(
+                f"부족한 재료 수는 {MAX_MISSING_INGREDIENTS}개 이하여야 합니다."
+            )
+
+        recipes = recipe_service.search_by_missing_ingredients(codes, max_missing)
+        return response_helper.search_response(results=recipes, query=codes)
+    except Exception as e:
+        return response_helper.error_response(message="레시피 검색 중 오류가 발생했습니다.", status_code=500)
+
+
+@recipe_bp.route("/with=<codes>/next")
+@cache_response
+def get_next_ingredients(codes):
+    """보유 재료에 하나만 더하면 새로 만들 수 있는 레시피가 많은 순으로 재료를 추천합니다."""
+    try:
+        ingredients = recipe_service.rank_next_ingredients(codes)
+        return response_helper.search_response(results=ingredients, query=codes)
+    except Exception as e:
+        return response_helper.error_response(message="재료 추천 중 오류가 발생했습니다.", status_code=500)
+
+
+@recipe_bp.route("/with=<codes>/next=<int:count>")
+@cache_response
+def get_ingredient_purchase_plan(codes, count):
+    """새로 만들 수 있는 레시피 수를 최대화하는 count개의 구매 재료 조합을 추천합니다."""
+    try:
+        if count < 1 or count > MAX_PURCHASE_COUNT:
+            return response_helper.validation_error_response(
+                f"추천 재료 수는 1개 이상 {MAX_PURCHASE_COUNT}개 이하여야 합니다."
+            )
+
+        ingredients = recipe_service.plan_ingredient_purchase(codes, count)
+        return response_helper.search_response(results=ingredients, query=codes)
+    except Exception as e:
+        return response_helper.error_response(message="재료 추천 중 오류가 발생했습니다.", status_code=500)
+
+
 @recipe_bp.route("/random")
 def get_random_recipe():
-    """무작위 레시피를 반환합니다."""
+    """무작위 레시피를 반환합니다 (image_url에 해시 이미지 URL 포함)."""
     try:
         recipe = recipe_service.get_random_recipe()
         if recipe:
-            return response_helper.json_response(recipe)
+            return response_helper.json_response(_with_image_url(recipe))
         else:
             return response_helper.error_response(message="사용 가능한 레시피가 없습니다.", status_code=404)
     except Exception as e:
@@ -190,6 +332,7 @@ def get_random_recipe():
 
 
 @recipe_bp.route("/categories")
+@cache_response
 def get_recipe_categories():
     """사용 가능한 모든 레시피 카테고리를 반환합니다."""
     try:
@@ -202,6 +345,7 @@ def get_recipe_categories():
 
 
 @recipe_bp.route("/difficulty=<difficulty>")
+@cache_response
 def get_recipes_by_difficulty(difficulty):
     """난이도별 레시피를 반환합니다."""
     try:
@@ -3,10 +3,14 @@
 """
 
 import json
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from app.services.persona_service import PersonaService
 from app.services.recommendation_service import RecommendationService
-from app.utils.response_helper import success_response, error_response
+from app.utils.persona_cache import persona_cache
+from app.utils.recommendation_cache import make_recommendation_key, recommendation_cache
+from app.utils.single_flight import make_key, single_flight
+from app.utils.response_helper import response_helper, success_response, error_response
+from app.utils.sse import SSE_MIMETYPE
 from app.utils.validators import validate_required_fields
 
 # 블루프린트 생성
@@ -17,6 +21,137 @@ persona_service = PersonaService()
 recommendation_service = RecommendationService()
 
 
+def _recommendation_call(endpoint, method, *args):
+    """
+    추천 캐시 키와, 같은 입력의 동시 요청을 병합하는 추천 호출 함수를 만듭니다.
+
+    호출 함수는 요청 컨텍스트 밖(캐시의 백그라운드 보충)에서도 사용할 수 있습니다.
+
+    Args:
+        endpoint: 추천 종류 (캐시 키에 포함)
+        method: 추천 서비스 메서드
+        *args: 메서드 인자 (persona, cocktail_list, 상황 정보)
+
+    Returns:
+        (캐시 키, 추천 결과를 반환하는 함수) 튜플
+    """
+    key = make_recommendation_key(endpoint, *args)
+
+    # 같은 입력으로 동시에 들어온 요청은 LLM 호출 하나의 결과를 함께 사용합니다.
+    def call():
+        return single_flight.do(f"recommendation:{key}", lambda: method(*args))
+
+    return key, call
+
+
+def _recommend(endpoint, method, *args):
+    """
+    추천 서비스 메서드를 호출합니다. RECOMMENDATION_CACHE_ENABLED이면 추천 결과 캐시의 pool에서 응답합니다.
+
+    Args:
+        endpoint: 추천 종류 (캐시 키에 포함)
+        method: 추천 서비스 메서드
+        *args: 메서드 인자 (persona, cocktail_list, 상황 정보)
+
+    Returns:
+        추천 결과 딕셔너리
+    """
+    key, call = _recommendation_call(endpoint, method, *args)
+    if not current_app.config.get("RECOMMENDATION_CACHE_ENABLED"):
+        return call()
+    return recommendation_cache.get_or_call(key, call)
+
+
+def _wants_stream() -> bool:
+    """?stream=true 또는 Accept: text/event-stream으로 SSE 응답을 요청했는지 확인합니다."""
+    if request.args.get("stream", "").lower() == "true":
+        return True
+    return any(mimetype == SSE_MIMETYPE and quality > 0 for mimetype, quality in request.accept_mimetypes)
+
+
+def _single_flight_stream(key, endpoint, *args):
+    """
+    같은 입력의 진행 중인 추천 호출과 병합해 추천 이벤트를 내보냅니다.
+
+    - 진행 중인 호출(JSON 요청 포함)이 없으면 LLM 스트리밍을 시작하고, 끝나면 기다리던 요청에 결과를 전달합니다.
+    - 진행 중인 호출이 있으면 LLM을 호출하지 않고, 그 결과를 기다렸다가 같은 이벤트로 내보냅니다.
+
+    Args:
+        key: 추천 캐시 키 (_recommendation_call의 병합 키와 같은 키 사용)
+        endpoint: 추천 종류
+        *args: 메서드 인자 (persona, cocktail_list, 상황 정보)
+
+    Yields:
+        stream_recommendation과 같은 (이벤트 이름, 데이터) 튜플
+    """
+    flight_key = f"recommendation:{key}"
+    flight, leader = single_flight.start(flight_key)
+    if not leader:
+        try:
+            result = single_flight.wait(flight_key, flight)
+        except Exception:
+            result = {"error": "추천 생성에 실패했습니다."}
+        yield from recommendation_service.result_events(result)
+        return
+
+    # 스트림이 끝나기 전에 연결이 끊기면 기다리던 요청에는 에러 결과를 전달합니다.
+    result = {"error": "추천 생성에 실패했습니다."}
+    try:
+        for event, data in recommendation_service.stream_recommendation(endpoint, *args):
+            if event in ("done", "error"):
+                result = data
+            yield event, data
+    finally:
+        single_flight.finish(flight_key, flight, result)
+
+
+def _stream_recommendation(endpoint, method, *args):
+    """
+    추천을 Server-Sent Events로 스트리밍합니다.
+
+    - 추천 항목이 완성될 때마다 recommendation 이벤트를, 마지막에 전체 결과로 done(실패 시 error) 이벤트를 보냅니다.
+    - 같은 입력으로 진행 중인 추천 호출이 있으면 그 결과를 함께 사용합니다 (_single_flight_stream 참고).
+    - RECOMMENDATION_CACHE_ENABLED이면 캐시 pool의 결과를 바로 보내고(보충 예약), 캐시가 없으면 스트리밍한 결과를
+      응답한 결과로 pool에 보관한 뒤 보충을 예약합니다.
+
+    Args:
+        endpoint: 추천 종류
+        method: 추천 서비스 메서드 (캐시 보충용)
+        *args: 메서드 인자 (persona, cocktail_list, 상황 정보)
+
+    Returns:
+        SSE Response 객체
+    """
+    key, call = _recommendation_call(endpoint, method, *args)
+    if not current_app.config.get("RECOMMENDATION_CACHE_ENABLED"):
+        return response_helper.sse_response(_single_flight_stream(key, endpoint, *args))
+
+    cached = recommendation_cache.next(key)
+    if cached is not None:
+        recommendation_cache.schedule_refill(key, call)
+        return response_helper.sse_response(recommendation_service.result_events(cached))
+
+    def events():
+        for event, data in _single_flight_stream(key, endpoint, *args):
+            if event == "done":
+                recommendation_cache.add(key, data, served=True)
+                recommendation_cache.schedule_refill(key, call)
+            yield event, data
+
+    return response_helper.sse_response(events())
+
+
+def _recommendation_response(endpoint, method, *args):
+    """추천 결과를 JSON으로 응답하거나, SSE를 요청한 경우 스트리밍합니다."""
+    if _wants_stream():
+        return _stream_recommendation(endpoint, method, *args)
+
+    recommendation = _recommend(endpoint, method, *args)
+    return success_response({
+        'recommendation': recommendation
+    })
+
+
 @recommendation_bp.route('/persona', methods=['POST'])
 def generate_persona():
     """
@@ -49,7 +184,13 @@ def generate_persona():
             return error_response("tasting_data는 리스트여야 합니다.", 400)
         
         # 페르소나 생성
-        persona = persona_service.generate_persona(user_data, tasting_data)
+        # PERSONA_CACHE_ENABLED이면 같은 이력은 캐시에서, 테이스팅이 추가된 이력은 기존 요약을 갱신해 생성
+        args = (user_data, tasting_data)
+        if current_app.config.get("PERSONA_CACHE_ENABLED"):
+            args += (persona_cache,)
+        persona = single_flight.do(
+            make_key("persona", user_data, tasting_data), lambda: persona_service.generate_persona(*args)
+        )
         
         return success_response({
             'persona': persona
@@ -72,6 +213,9 @@ def get_default_recommendation():
         "time": "저녁",
         "weather": "눈"
     }
+
+    ?stream=true 또는 Accept: text/event-stream이면 추천 항목을 Server-Sent Events로 스트리밍합니다
+    (항목마다 recommendation 이벤트, 마지막에 done 또는 error 이벤트).
     """
     try:
         data = request.get_json(silent=True)
@@ -94,15 +238,13 @@ def get_default_recommendation():
         if isinstance(cocktail_list, list):
             cocktail_list = json.dumps(cocktail_list)
 
-        # 추천 생성
-        recommendation = recommendation_service.get_default_recommendation(
+        # 추천 생성 (SSE 요청 시 스트리밍)
+        return _recommendation_response(
+            'default',
+            recommendation_service.get_default_recommendation,
             persona, cocktail_list, season, time, weather
         )
 
-        return success_response({
-            'recommendation': recommendation
-        })
-
     except Exception as e:
         return error_response(f"기본 추천 생성 중 오류가 발생했습니다: {str(e)}", 500)
 
@@ -117,6 +259,9 @@ def get_feeling_recommendation():
         "persona": "사용자 페르소나",
         "cocktail_list": ["칵테일1", "칵테일2", "칵테일3"] or "칵테일1, 칵테일2, 칵테일3"
     }
+
+    ?stream=true 또는 Accept: text/event-stream이면 추천 항목을 Server-Sent Events로 스트리밍합니다
+    (항목마다 recommendation 이벤트, 마지막에 done 또는 error 이벤트).
     """
     try:
         data = request.get_json(silent=True)
@@ -136,12 +281,12 @@ def get_feeling_recommendation():
         if isinstance(cocktail_list, list):
             cocktail_list = json.dumps(cocktail_list)
 
-        # 추천 생성
-        recommendation = recommendation_service.get_feeling_recommendation(persona, cocktail_list)
-
-        return success_response({
-            'recommendation': recommendation
-        })
+        # 추천 생성 (SSE 요청 시 스트리밍)
+        return _recommendation_response(
+            'feeling',
+            recommendation_service.get_feeling_recommendation,
+            persona, cocktail_list
+        )
 
     except Exception as e:
         return error_response(f"감정 기반 추천 생성 중 오류가 발생했습니다: {str(e)}", 500)
@@ -157,6 +302,9 @@ def get_situation_recommendation():
         "persona": "사용자 페르소나",
         "cocktail_list": ["칵테일1", "칵테일2", "칵테일3"] or "칵테일1, 칵테일2, 칵테일3"
     }
+
+    ?stream=true 또는 Accept: text/event-stream이면 추천 항목을 Server-Sent Events로 스트리밍합니다
+    (항목마다 recommendation 이벤트, 마지막에 done 또는 error 이벤트).
     """
     try:
         data = request.get_json(silent=True)
@@ -176,12 +324,12 @@ def get_situation_recommendation():
         if isinstance(cocktail_list, list):
             cocktail_list = json.dumps(cocktail_list)
 
-        # 추천 생성
-        recommendation = recommendation_service.get_situation_recommendation(persona, cocktail_list)
-
-        return success_response({
-            'recommendation': recommendation
-        })
+        # 추천 생성 (SSE 요청 시 스트리밍)
+        return _recommendation_response(
+            'situation',
+            recommendation_service.get_situation_recommendation,
+            persona, cocktail_list
+        )
 
     except Exception as e:
         return error_response(f"상황 기반 추천 생성 중 오류가 발생했습니다: {str(e)}", 500)
@@ -3,6 +3,7 @@
 """
 
 from typing import List, Dict, Optional, Any
+from app.utils.catalog import catalog, RecordIndex
 from app.utils.data_loader import data_loader
 
 
@@ -11,11 +12,16 @@ class ChallengeService:
 
     def __init__(self):
         self.data_loader = data_loader
+        self.catalog = catalog
 
     def get_all_challenges(self) -> List[Dict]:
         """모든 챌린지 데이터를 반환합니다."""
         return self.data_loader.get_all_challenges()
 
+    def _get_index(self) -> RecordIndex:
+        """챌린지 ID 인덱스를 반환합니다."""
+        return self.catalog.challenges(self.get_all_challenges())
+
     def get_challenge_by_id(self, challenge_id: str) -> Optional[Dict]:
         """
         ID로 챌린지를 검색합니다.
@@ -29,13 +35,7 @@ class ChallengeService:
         if not challenge_id or not challenge_id.strip():
             return None
 
-        all_challenges = self.get_all_challenges()
-
-        for challenge in all_challenges:
-            if str(challenge.get("id")) == str(challenge_id):
-                return challenge
-
-        return None
+        return self._get_index().get(challenge_id)
 
     def search_by_title(self, keyword: str) -> List[Dict]:
         """
@@ -50,17 +50,8 @@ class ChallengeService:
         if not keyword or not keyword.strip():
             return []
 
-        all_challenges = self.get_all_challenges()
-        results = []
-
-        for challenge in all_challenges:
-            # 'title' 또는 'name' 필드를 확인
-            title = challenge.get("title", challenge.get("name", "")).lower()
-            if keyword.lower() in title:
-                if challenge not in results:
-                    results.append(challenge)
-
-        return results
+        # 'title' 필드를 확인하고, 없으면 'name' 필드를 확인
+        return self._get_index().search(keyword)
 
     def search_by_difficulty(self, difficulty: str) -> List[Dict]:
         """
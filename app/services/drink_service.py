@@ -2,8 +2,12 @@
 음료 관련 비즈니스 로직을 처리하는 서비스 모듈
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from app.utils.barcode_index import BarcodeIndex
+from app.utils.catalog import catalog, RecordIndex
 from app.utils.data_loader import data_loader
+from app.utils.pagination import FieldColumns
+from app.utils.product_table import ProductTable
 
 
 class DrinkService:
@@ -11,11 +15,28 @@ class DrinkService:
 
     def __init__(self):
         self.data_loader = data_loader
+        self.catalog = catalog
 
     def get_all_drinks(self) -> List[Dict]:
         """모든 음료 데이터를 반환합니다."""
         return self.data_loader.get_all_drinks()
 
+    def _get_index(self) -> RecordIndex:
+        """음료 코드 인덱스를 반환합니다."""
+        return self.catalog.products(self.get_all_drinks())
+
+    def get_field_columns(self) -> FieldColumns:
+        """음료 필드 선택(fields)에 사용할 필드 컬럼을 반환합니다."""
+        return self._get_index().get_derived("fields", FieldColumns)
+
+    def _get_barcode_index(self) -> BarcodeIndex:
+        """음료 바코드 prefix 인덱스를 반환합니다."""
+        return self._get_index().get_derived("barcode", BarcodeIndex)
+
+    def _get_product_table(self) -> ProductTable:
+        """음료 컬럼형 테이블을 반환합니다."""
+        return self._get_index().get_derived("columns", ProductTable)
+
     def search_by_name(self, keyword: str) -> List[Dict]:
         """
         이름으로 음료를 검색합니다.
@@ -29,15 +50,7 @@ class DrinkService:
         if not keyword or not keyword.strip():
             return []
 
-        all_drinks = self.get_all_drinks()
-        results = []
-
-        for drink in all_drinks:
-            if keyword.lower() in drink.get("name", "").lower():
-                if drink not in results:
-                    results.append(drink)
-
-        return results
+        return self._get_index().search(keyword)
 
     def search_by_type(self, drink_type: str) -> List[Dict]:
         """
@@ -52,15 +65,39 @@ class DrinkService:
         if not drink_type or not drink_type.strip():
             return []
 
-        all_drinks = self.get_all_drinks()
-        results = []
+        return self._get_product_table().search_type(drink_type)
+
+    def filter_drinks(
+        self,
+        types: List[str] = None,
+        bases: List[str] = None,
+        abv_min: float = None,
+        abv_max: float = None,
+        volume_min: float = None,
+        volume_max: float = None,
+    ) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        타입, 베이스, 도수 범위, 용량 범위를 조합해 음료를 필터링합니다.
 
-        for drink in all_drinks:
-            if drink_type.lower() in drink.get("type", "").lower():
-                if drink not in results:
-                    results.append(drink)
+        Args:
+            types: 타입 목록 (정확히 일치)
+            bases: 베이스 코드 목록
+            abv_min: 최소 도수
+            abv_max: 최대 도수
+            volume_min: 최소 용량 (ml)
+            volume_max: 최대 용량 (ml)
 
-        return results
+        Returns:
+            (필터링된 음료 리스트, 타입/베이스별 개수와 도수/용량 범위를 담은 패싯) 튜플
+        """
+        return self._get_product_table().filter(
+            types=types,
+            bases=bases,
+            abv_min=abv_min,
+            abv_max=abv_max,
+            volume_min=volume_min,
+            volume_max=volume_max,
+        )
 
     def search_by_code(self, code: str) -> Optional[Dict]:
         """
@@ -83,34 +120,23 @@ class DrinkService:
         if not sanitized_code:
             return None
 
-        all_drinks = self.get_all_drinks()
-
-        # 정확히 일치하는 코드를 우선 반환
-        for drink in all_drinks:
-            drink_code = drink.get("code")
-            if isinstance(drink_code, str) and sanitized_code == drink_code.strip():
-                return drink
-
-        # 뒤 3자리를 제외한 코드(prefix)로 재검색
-        if len(sanitized_code) <= 3:
-            return None
-
-        code_prefix = sanitized_code[:-3]
+        # 정확히 일치하는 코드를 우선 반환하고, 없으면 뒤 3자리를 제외한 코드(prefix)로 재검색
+        return self._get_barcode_index().lookup(sanitized_code)
 
-        for drink in all_drinks:
-            drink_code = drink.get("code")
-            if not isinstance(drink_code, str):
-                continue
-
-            normalized_drink_code = drink_code.strip()
+    def search_by_code_prefix(self, prefix: str) -> List[Dict]:
+        """
+        바코드 prefix(예: 제조사 코드)로 음료를 검색합니다.
 
-            if len(normalized_drink_code) <= 3:
-                continue
+        Args:
+            prefix: 바코드 prefix
 
-            if normalized_drink_code[:-3] == code_prefix:
-                return drink
+        Returns:
+            검색 결과 리스트
+        """
+        if not prefix or not prefix.strip():
+            return []
 
-        return None
+        return self._get_barcode_index().search_prefix(prefix)
 
     def get_drink_by_codes(self, codes: List[str]) -> List[Dict]:
         """
@@ -125,16 +151,22 @@ class DrinkService:
         if not codes:
             return []
 
-        all_drinks = self.get_all_drinks()
-        results = []
+        return self._get_index().get_many(codes)
 
-        for code in codes:
-            for drink in all_drinks:
-                if code == drink.get("code"):
-                    results.append(drink)
-                    break
+    def lookup_by_codes(self, codes: List[Any]) -> List[Optional[Dict]]:
+        """
+        여러 코드로 음료를 일괄 조회합니다.
 
-        return results
+        코드마다 search_by_code와 같이 정확히 일치하는 코드를 우선 찾고, 없으면 바코드 prefix로 다시 찾습니다.
+
+        Args:
+            codes: 음료 코드 리스트
+
+        Returns:
+            입력 순서대로 찾은 음료 또는 None(없는 코드)의 리스트
+        """
+        index = self._get_barcode_index()
+        return [index.lookup(str(code).strip()) if str(code).strip() else None for code in codes]
 
     def get_drink_types(self) -> List[str]:
         """
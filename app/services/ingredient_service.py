@@ -3,7 +3,9 @@
 """
 
 from typing import List, Dict, Optional, Any
+from app.utils.catalog import catalog, RecordIndex
 from app.utils.data_loader import data_loader
+from app.utils.pagination import FieldColumns
 
 
 class IngredientService:
@@ -11,11 +13,20 @@ class IngredientService:
 
     def __init__(self):
         self.data_loader = data_loader
+        self.catalog = catalog
 
     def get_all_ingredients(self) -> List[Dict]:
         """모든 재료 데이터를 반환합니다."""
         return self.data_loader.get_all_ingredients()
 
+    def _get_index(self) -> RecordIndex:
+        """재료 코드 인덱스를 반환합니다."""
+        return self.catalog.ingredients(self.get_all_ingredients())
+
+    def get_field_columns(self) -> FieldColumns:
+        """재료 필드 선택(fields)에 사용할 필드 컬럼을 반환합니다."""
+        return self._get_index().get_derived("fields", FieldColumns)
+
     def get_ingredients_by_codes(self, codes: str) -> List[Dict]:
         """
         여러 코드로 재료들을 검색합니다.
@@ -35,16 +46,7 @@ class IngredientService:
         if not code_list:
             return []
 
-        all_ingredients = self.get_all_ingredients()
-        results = []
-
-        for code in code_list:
-            for ingredient in all_ingredients:
-                if code == ingredient.get("code"):
-                    results.append(ingredient)
-                    break
-
-        return results
+        return self._get_index().get_many(code_list)
 
     def search_by_name(self, keyword: str) -> List[Dict]:
         """
@@ -59,16 +61,7 @@ class IngredientService:
         if not keyword or not keyword.strip():
             return []
 
-        all_ingredients = self.get_all_ingredients()
-        results = []
-
-        for ingredient in all_ingredients:
-            name = ingredient.get("name", "").lower()
-            if keyword.lower() in name:
-                if ingredient not in results:
-                    results.append(ingredient)
-
-        return results
+        return self._get_index().search(keyword)
 
     def search_by_code(self, code: str) -> Optional[Dict]:
         """
@@ -83,13 +76,20 @@ class IngredientService:
         if not code or not code.strip():
             return None
 
-        all_ingredients = self.get_all_ingredients()
+        return self._get_index().get(code)
 
-        for ingredient in all_ingredients:
-            if code == ingredient.get("code"):
-                return ingredient
+    def lookup_by_codes(self, codes: List[Any]) -> List[Optional[Dict]]:
+        """
+        여러 코드로 재료를 일괄 조회합니다.
+
+        Args:
+            codes: 재료 코드 리스트
 
-        return None
+        Returns:
+            입력 순서대로 찾은 재료 또는 None(없는 코드)의 리스트
+        """
+        index = self._get_index()
+        return [index.get(str(code).strip()) for code in codes]
 
     def search_by_category(self, category: str) -> List[Dict]:
         """
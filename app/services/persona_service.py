@@ -4,30 +4,47 @@
 
 import os
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from openai import OpenAI
 from dotenv import load_dotenv
 from app.services.recipe_service import RecipeService
+from app.utils.persona_cache import PersonaCache, chain_keys
 
 load_dotenv()
 
+# OpenAI 요청 제한 시간 (초)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "90"))
+
+# 페르소나 생성 실패 시 반환하는 문자열
+PERSONA_FAILURE_MESSAGE = "페르소나 생성에 실패했습니다."
+
+# 페르소나 프롬프트 공통 설명 (사용자 정보와 칵테일 입력 형식)
+PERSONA_SYSTEM_PROMPT = ("당신은 전문 칵테일 소믈리에입니다.\n"
+                         "사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 요약하는 역할을 맡고 있습니다.\n"
+                         "사용자의 정보는 [이름, 나이, 선호하는 맛]로 입력됩니다.\n"
+                         "사용자가 먹은 칵테일은 [칵테일 이름, 사용자가 먹은 날짜, 칵테일 특징1, 칵테일 특징2, "
+                         "사용자의 해당 칵테일 선호도, 해당 칵테일 단맛 평가, 해당 칵테일 산미 평가, "
+                         "해당 칵테일 도수 평가]로 입력됩니다.\n")
+
 
 class PersonaService:
     """사용자 페르소나 생성을 담당하는 서비스 클래스"""
     
     def __init__(self):
         self.client = None
+        self._client_pid = None
         self.recipe_service = RecipeService()
     
     def _get_client(self):
-        """OpenAI 클라이언트를 지연 초기화합니다."""
-        if self.client is None:
+        """OpenAI 클라이언트를 지연 초기화합니다 (fork된 프로세스에서는 새로 생성)."""
+        if self.client is None or self._client_pid != os.getpid():
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, timeout=LLM_TIMEOUT)
+            self._client_pid = os.getpid()
         return self.client
-    
+
     def get_drink_list_string(self, tasting_data: List[Dict[str, Any]]) -> str:
         """
         테이스팅 데이터를 문자열로 변환합니다.
@@ -80,77 +97,165 @@ class PersonaService:
         }
         return eval_mapping.get(rating, str(rating))
     
+    def _completion_params(self, system_text: str, user_texts: List[str]) -> Dict[str, Any]:
+        """
+        페르소나 요청의 chat completion 파라미터를 만듭니다.
+
+        Args:
+            system_text: 시스템 프롬프트
+            user_texts: 사용자 메시지 목록
+
+        Returns:
+            chat.completions.create에 전달할 파라미터 딕셔너리
+        """
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "system", "content": [{"type": "text", "text": system_text}]}] + [
+                {"role": "user", "content": [{"type": "text", "text": text}]} for text in user_texts
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 1,
+            "max_tokens": 2048,
+            "top_p": 1,
+            "frequency_penalty": 0,
+            "presence_penalty": 0
+        }
+
+    def _describe_user(self, user_data: List[Dict[str, Any]]) -> str:
+        """사용자 정보를 프롬프트용 문자열로 변환합니다."""
+        user_info = user_data[0]
+        return f"{user_info.get('name', '')}, {user_info.get('gender', '')}, {user_info.get('favoriteTaste', '')}"
+
+    def _build_completion_params(self, user_data: List[Dict[str, Any]],
+                                 tasting_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        전체 테이스팅 이력으로 페르소나를 생성하는 요청 파라미터를 만듭니다.
+
+        Args:
+            user_data: 사용자 기본 정보
+            tasting_data: 사용자의 테이스팅 데이터
+
+        Returns:
+            chat.completions.create에 전달할 파라미터 딕셔너리
+
+        Raises:
+            ValueError: 사용자 데이터가 없는 경우
+        """
+        if not user_data:
+            raise ValueError("사용자 데이터가 필요합니다.")
+
+        return self._completion_params(
+            PERSONA_SYSTEM_PROMPT
+            + "사용자에 대한 정보와 먹어봤던 칵테일에 대한 설명을 보고 100자 정도로 사용자를 요약합니다.\n"
+              "요약에 대한 설명은 Json으로 반환하며 태그 이름은 \"summary\"입니다.\n"
+              "칵테일에 대한 특징을 반영한 요약을 제시합니다.",
+            [
+                f"사용자 정보는 다음과 같습니다: {self._describe_user(user_data)}",
+                f"지금까지 사용자가 먹은 칵테일을 다음과 같습니다: {self.get_drink_list_string(tasting_data)}",
+            ],
+        )
+
+    def _build_update_params(self, user_data: List[Dict[str, Any]], previous_summary: str,
+                             new_tasting_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        기존 요약과 새로 추가된 테이스팅만으로 페르소나를 갱신하는 요청 파라미터를 만듭니다.
+
+        Args:
+            user_data: 사용자 기본 정보
+            previous_summary: 이전 테이스팅 이력으로 만든 페르소나 요약
+            new_tasting_data: 요약 이후 추가된 테이스팅 데이터
+
+        Returns:
+            chat.completions.create에 전달할 파라미터 딕셔너리
+        """
+        return self._completion_params(
+            PERSONA_SYSTEM_PROMPT
+            + "이전까지의 테이스팅 이력으로 만든 사용자 요약과 그 이후 새로 먹은 칵테일이 주어집니다.\n"
+              "기존 요약의 내용을 유지하면서 새로 먹은 칵테일의 특징과 평가를 반영해 100자 정도로 요약을 갱신합니다.\n"
+              "요약에 대한 설명은 Json으로 반환하며 태그 이름은 \"summary\"입니다.",
+            [
+                f"사용자 정보는 다음과 같습니다: {self._describe_user(user_data)}",
+                f"기존 사용자 요약은 다음과 같습니다: {previous_summary}",
+                f"이후 새로 먹은 칵테일은 다음과 같습니다: {self.get_drink_list_string(new_tasting_data)}",
+            ],
+        )
+
+    def _prepare_persona(
+        self, user_data: List[Dict[str, Any]], tasting_data: List[Dict[str, Any]], cache: Optional[PersonaCache]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str], int]:
+        """
+        캐시를 확인하고 필요한 요청 파라미터를 만듭니다.
+
+        - 같은 이력의 요약이 있으면 그대로 사용합니다.
+        - 이력의 앞부분(prefix)에 대한 요약이 있으면 그 요약과 이후 추가된 테이스팅으로 갱신 요청을 만듭니다.
+          단, 마지막 전체 생성 이후 갱신으로만 반영한 테이스팅이 cache.max_incremental개를 넘게 되면
+          요약이 이력에서 멀어지지 않도록 전체 이력으로 다시 생성합니다.
+        - 없으면 전체 이력으로 생성 요청을 만듭니다.
+
+        Args:
+            user_data: 사용자 기본 정보
+            tasting_data: 사용자의 테이스팅 데이터
+            cache: 페르소나 캐시 (None이면 캐시를 사용하지 않음)
+
+        Returns:
+            (요청 파라미터 또는 None(캐시 적중), 결과를 저장할 캐시 키, 캐시된 요약,
+            결과에 함께 저장할 갱신 테이스팅 수) 튜플
+
+        Raises:
+            ValueError: 사용자 데이터가 없는 경우
+        """
+        if not user_data:
+            raise ValueError("사용자 데이터가 필요합니다.")
+        if cache is None:
+            return self._build_completion_params(user_data, tasting_data), None, None, 0
+
+        keys = chain_keys(user_data, tasting_data)
+        latest = cache.find_latest(keys)
+        if latest is None:
+            return self._build_completion_params(user_data, tasting_data), keys[-1], None, 0
+
+        count, summary, incremental = latest
+        if count == len(tasting_data):
+            return None, keys[-1], summary, incremental
+
+        incremental += len(tasting_data) - count
+        if incremental > cache.max_incremental:
+            return self._build_completion_params(user_data, tasting_data), keys[-1], None, 0
+        return self._build_update_params(user_data, summary, tasting_data[count:]), keys[-1], None, incremental
+
+    def _parse_summary(self, response_content: str, key: Optional[str], cache: Optional[PersonaCache],
+                       incremental: int = 0) -> str:
+        """응답에서 요약을 꺼내고, 생성에 성공했으면 캐시에 저장합니다."""
+        summary = json.loads(response_content).get("summary")
+        if summary is None:
+            return PERSONA_FAILURE_MESSAGE
+        if cache is not None and summary:
+            cache.put(key, summary, incremental)
+        return summary
+
     def generate_persona(self, user_data: List[Dict[str, Any]], 
-                        tasting_data: List[Dict[str, Any]]) -> str:
+                        tasting_data: List[Dict[str, Any]], cache: Optional[PersonaCache] = None) -> str:
         """
         사용자 데이터와 테이스팅 데이터를 바탕으로 페르소나를 생성합니다.
         
         Args:
             user_data: 사용자 기본 정보
             tasting_data: 사용자의 테이스팅 데이터
+            cache: 페르소나 캐시 (있으면 같은 이력은 재사용하고, 추가된 테이스팅만 반영해 갱신)
             
         Returns:
             생성된 페르소나 문자열
         """
-        if not user_data:
-            raise ValueError("사용자 데이터가 필요합니다.")
-        
-        user_info = user_data[0]
-        user_description = f"{user_info.get('name', '')}, {user_info.get('gender', '')}, {user_info.get('favoriteTaste', '')}"
-        drink_list = self.get_drink_list_string(tasting_data)
+        params, key, cached, incremental = self._prepare_persona(user_data, tasting_data, cache)
+        if params is None:
+            return cached
         
         try:
             client = self._get_client()
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": ("당신은 전문 칵테일 소믈리에입니다.\n"
-                                        "사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 요약하는 역할을 맡고 있습니다.\n"
-                                        "사용자의 정보는 [이름, 나이, 선호하는 맛]로 입력됩니다.\n"
-                                        "사용자가 먹은 칵테일은 [칵테일 이름, 사용자가 먹은 날짜, 칵테일 특징1, 칵테일 특징2, 사용자의 해당 칵테일 선호도, 해당 칵테일 단맛 평가, 해당 칵테일 산미 평가, 해당 칵테일 도수 평가]로 입력됩니다.\n"
-                                        "사용자에 대한 정보와 먹어봤던 칵테일에 대한 설명을 보고 100자 정도로 사용자를 요약합니다.\n"
-                                        "요약에 대한 설명은 Json으로 반환하며 태그 이름은 \"summary\"입니다.\n"
-                                        "칵테일에 대한 특징을 반영한 요약을 제시합니다.")
-                            }
-                        ]
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"사용자 정보는 다음과 같습니다: {user_description}"
-                            }
-                        ]
-                    },
-                    {
-                        "role": "user", 
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"지금까지 사용자가 먹은 칵테일을 다음과 같습니다: {drink_list}"
-                            }
-                        ]
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=1,
-                max_tokens=2048,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0
-            )
-            
-            response_content = response.choices[0].message.content
-            parsed_response = json.loads(response_content)
+            response = client.chat.completions.create(**params)
             
-            return parsed_response.get("summary", "페르소나 생성에 실패했습니다.")
+            return self._parse_summary(response.choices[0].message.content, key, cache, incremental)
             
         except Exception as e:
             print(f"페르소나 생성 중 오류 발생: {e}")
-            return "페르소나 생성에 실패했습니다."
\ No newline at end of file
+            return PERSONA_FAILURE_MESSAGE
@@ -3,7 +3,11 @@
 """
 
 from typing import List, Dict, Optional, Any
+from app.utils.catalog import catalog, RecordIndex
 from app.utils.data_loader import data_loader
+from app.utils.pagination import FieldColumns
+from app.utils.recipe_bitset import RecipeBitset
+from app.utils.recipe_images import RecipeImageMap
 import random
 
 
@@ -12,11 +16,24 @@ class RecipeService:
 
     def __init__(self):
         self.data_loader = data_loader
+        self.catalog = catalog
 
     def get_all_recipes(self) -> List[Dict]:
         """모든 레시피 데이터를 반환합니다."""
         return self.data_loader.get_all_recipes()
 
+    def _get_index(self) -> RecordIndex:
+        """레시피 코드/이름 인덱스를 반환합니다."""
+        return self.catalog.recipes(self.get_all_recipes())
+
+    def get_field_columns(self) -> FieldColumns:
+        """레시피 필드 선택(fields)에 사용할 필드 컬럼을 반환합니다."""
+        return self._get_index().get_derived("fields", FieldColumns)
+
+    def get_image_map(self) -> RecipeImageMap:
+        """레시피 코드/이름에서 이미지 파일명으로의 매핑을 반환합니다."""
+        return self._get_index().get_derived("images", RecipeImageMap)
+
     def search_by_name(self, keyword: str) -> List[Dict]:
         """
         이름으로 레시피를 검색합니다.
@@ -30,19 +47,7 @@ class RecipeService:
         if not keyword or not keyword.strip():
             return []
 
-        all_recipes = self.get_all_recipes()
-        results = []
-
-        for recipe in all_recipes:
-            english_name = recipe.get("english_name", "").lower()
-            korean_name = recipe.get("korean_name", "").lower()
-            keyword_lower = keyword.lower()
-
-            if (keyword_lower in english_name or keyword_lower in korean_name):
-                if recipe not in results:
-                    results.append(recipe)
-
-        return results
+        return self._get_index().search(keyword)
 
     def search_by_code(self, code: str) -> Optional[Dict]:
         """
@@ -57,13 +62,20 @@ class RecipeService:
         if not code or not code.strip():
             return None
 
-        all_recipes = self.get_all_recipes()
+        return self._get_index().get(code)
 
-        for recipe in all_recipes:
-            if code == recipe.get("code"):
-                return recipe
+    def lookup_by_codes(self, codes: List[Any]) -> List[Optional[Dict]]:
+        """
+        여러 코드로 레시피를 일괄 조회합니다.
 
-        return None
+        Args:
+            codes: 레시피 코드 리스트
+
+        Returns:
+            입력 순서대로 찾은 레시피 또는 None(없는 코드)의 리스트
+        """
+        index = self._get_index()
+        return [index.get(str(code).strip()) for code in codes]
 
     def get_code_by_name(self, name: str) -> Optional[str]:
         """
@@ -82,19 +94,16 @@ class RecipeService:
         if not name or not name.strip():
             return None
 
-        all_recipes = self.get_all_recipes()
+        index = self._get_index()
         name_lower = name.strip().lower()
         
         # 1단계: 정확히 일치하는 이름 찾기 (대소문자 구분 없음)
-        for recipe in all_recipes:
-            korean_name = recipe.get("korean_name", "")
-            english_name = recipe.get("english_name", "")
-            
-            if korean_name.lower() == name_lower or english_name.lower() == name_lower:
-                return recipe.get("code")
+        recipe = index.get_by_name(name_lower)
+        if recipe is not None:
+            return recipe.get("code")
         
         # 2단계: 부분 일치하는 첫 번째 레시피 찾기
-        for recipe in all_recipes:
+        for recipe in index.records:
             korean_name = recipe.get("korean_name", "")
             english_name = recipe.get("english_name", "")
             
@@ -123,24 +132,96 @@ class RecipeService:
         if not available_codes:
             return []
 
-        all_recipes = self.get_all_recipes()
-        available_recipes = []
+        # 레시피의 모든 재료가 사용 가능한 재료에 포함되는지 비트마스크로 확인
+        bitset = self._get_index().get_derived("ingredient_bitset", RecipeBitset)
+        return bitset.find_makeable(available_codes)
 
-        for recipe in all_recipes:
-            recipe_ingredients = recipe.get("ingredients", [])
+    def search_by_missing_ingredients(self, ingredient_codes: str, max_missing: int) -> List[Dict]:
+        """
+        재료 코드들에 최대 max_missing개의 재료만 더하면 만들 수 있는 레시피를 검색합니다.
 
-            # 레시피의 모든 재료가 사용 가능한 재료에 포함되는지 확인
-            can_make = True
-            for ingredient in recipe_ingredients:
-                ingredient_code = ingredient.get("code")
-                if ingredient_code not in available_codes:
-                    can_make = False
-                    break
+        Args:
+            ingredient_codes: 쉼표로 구분된 재료 코드 문자열
+            max_missing: 허용할 부족 재료 최대 개수
 
-            if can_make:
-                available_recipes.append(recipe)
+        Returns:
+            레시피, 부족한 재료 수, 부족한 재료 코드를 담은 딕셔너리 리스트 (부족한 재료 수 오름차순)
+        """
+        if not ingredient_codes or not ingredient_codes.strip():
+            return []
 
-        return available_recipes
+        available_codes = [code.strip() for code in ingredient_codes.split(",") if code.strip()]
+
+        if not available_codes or max_missing < 0:
+            return []
+
+        bitset = self._get_index().get_derived("ingredient_bitset", RecipeBitset)
+        return [
+            {"recipe": recipe, "missing_count": len(missing_codes), "missing_codes": missing_codes}
+            for recipe, missing_codes in bitset.find_near_misses(available_codes, max_missing)
+        ]
+
+    def rank_next_ingredients(self, ingredient_codes: str, limit: int = 10) -> List[Dict]:
+        """
+        재료 하나를 추가로 구매했을 때 새로 만들 수 있는 레시피가 많은 순으로 재료를 추천합니다.
+
+        Args:
+            ingredient_codes: 쉼표로 구분된 보유 재료 코드 문자열
+            limit: 반환할 최대 재료 수
+
+        Returns:
+            추천 재료 정보 딕셔너리 리스트
+        """
+        if not ingredient_codes or not ingredient_codes.strip():
+            return []
+
+        available_codes = [code.strip() for code in ingredient_codes.split(",") if code.strip()]
+
+        if not available_codes:
+            return []
+
+        bitset = self._get_index().get_derived("ingredient_bitset", RecipeBitset)
+        ranking = bitset.rank_next_ingredients(available_codes)[:limit]
+        return [self._to_purchase_item(bitset, bit, recipes) for bit, recipes in ranking]
+
+    def plan_ingredient_purchase(self, ingredient_codes: str, count: int) -> List[Dict]:
+        """
+        새로 만들 수 있는 레시피 수를 최대화하는 count개의 구매 재료 조합을 탐욕적으로 구합니다.
+
+        Args:
+            ingredient_codes: 쉼표로 구분된 보유 재료 코드 문자열
+            count: 구매할 재료 개수
+
+        Returns:
+            구매 순서대로 정렬된 추천 재료 정보 딕셔너리 리스트
+        """
+        if not ingredient_codes or not ingredient_codes.strip():
+            return []
+
+        available_codes = [code.strip() for code in ingredient_codes.split(",") if code.strip()]
+
+        if not available_codes or count <= 0:
+            return []
+
+        bitset = self._get_index().get_derived("ingredient_bitset", RecipeBitset)
+        steps = bitset.plan_purchase(available_codes, count)
+        return [self._to_purchase_item(bitset, bit, recipes) for bit, recipes in steps]
+
+    def _to_purchase_item(self, bitset: RecipeBitset, bit: int, recipes: List[Dict]) -> Dict:
+        """구매 추천 결과를 응답용 딕셔너리로 변환합니다."""
+        return {
+            "code": bitset.code_of[bit],
+            "name": bitset.name_of[bit],
+            "unlocked_count": len(recipes),
+            "unlocked_recipes": [
+                {
+                    "code": recipe.get("code"),
+                    "korean_name": recipe.get("korean_name", ""),
+                    "english_name": recipe.get("english_name", ""),
+                }
+                for recipe in recipes
+            ],
+        }
 
     def get_random_recipe(self) -> Optional[Dict]:
         """
@@ -196,6 +277,24 @@ class RecipeService:
 
         return results
 
+    def filter_recipes(self, name: str = None, difficulty: str = None) -> List[Dict]:
+        """
+        이름 검색어와 난이도를 조합해 레시피를 필터링합니다.
+
+        Args:
+            name: 이름 검색어 (없으면 전체 레시피)
+            difficulty: 난이도 (easy, medium, hard)
+
+        Returns:
+            카탈로그 순서를 유지한 레시피 리스트
+        """
+        recipes = self.search_by_name(name) if name else self.get_all_recipes()
+        if not difficulty:
+            return recipes
+
+        difficulty = difficulty.lower()
+        return [recipe for recipe in recipes if recipe.get("difficulty", "").lower() == difficulty]
+
     def validate_recipe_data(self, recipe_data: Dict) -> List[str]:
         """
         레시피 데이터의 유효성을 검증합니다.
@@ -7,14 +7,18 @@ import json
 import logging
 import random
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 from openai import OpenAI
 from dotenv import load_dotenv
-from app.utils.cocktail_matcher import match_cocktail_in_json
+from app.utils.cocktail_matcher import match_cocktail_in_json, match_recommendation_item, parse_available_cocktails
+from app.utils.json_stream import JsonArrayStream
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# OpenAI 요청 제한 시간 (초)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "90"))
+
 # 추천 다양성을 위한 관점/스타일 목록
 RECOMMENDATION_PERSPECTIVES = [
     "새로운 맛의 발견을 위해",
@@ -46,23 +50,41 @@ class RecommendationService:
 
     def __init__(self):
         self.client = None
-        self.rag_service = None
+        self._client_pid = None
+        self._rag_service = None
+        self._rag_service_pid = None
         use_rag_env = os.getenv("USE_RAG", "false")
         self.use_rag = use_rag_env.lower() == "true" if use_rag_env else False
 
-        # RAG 사용 설정일 때만 초기화
-        if self.use_rag:
+    @property
+    def rag_service(self):
+        """RAG 서비스를 지연 초기화합니다.
+
+        ChromaDB 클라이언트는 fork 후 공유할 수 없으므로, 모듈 import 시점(gunicorn 마스터)이 아니라
+        각 워커 프로세스에서 처음 사용할 때 생성합니다.
+        """
+        if not self.use_rag:
+            return None
+        if self._rag_service is None or self._rag_service_pid != os.getpid():
             from app.services.rag_service import RAGService
 
-            self.rag_service = RAGService()
+            self._rag_service = RAGService()
+            self._rag_service_pid = os.getpid()
+        return self._rag_service
+
+    @rag_service.setter
+    def rag_service(self, value):
+        self._rag_service = value
+        self._rag_service_pid = os.getpid()
 
     def _get_client(self):
-        """OpenAI 클라이언트를 지연 초기화합니다."""
-        if self.client is None:
+        """OpenAI 클라이언트를 지연 초기화합니다 (fork된 프로세스에서는 새로 생성)."""
+        if self.client is None or self._client_pid != os.getpid():
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, timeout=LLM_TIMEOUT)
+            self._client_pid = os.getpid()
         return self.client
 
     def _get_diversity_hint(self) -> str:
@@ -72,8 +94,171 @@ class RecommendationService:
         seed = int(time.time() * 1000) % 10000
         return f"[추천 #{seed}] 이번 추천은 '{perspective}' {mood} 느낌의 칵테일을 우선적으로 고려해주세요."
     
+    def _search_rag_contexts(self, cocktail_codes: List[str], searches: List[Tuple[str, str]]) -> str:
+        """
+        요소별로 RAG 검색을 수행해 프롬프트에 넣을 추천 가능 칵테일 목록을 만듭니다.
+
+        Args:
+            cocktail_codes: 보유한 칵테일 code 리스트
+            searches: (검색어, 목록 제목) 튜플 리스트 (요소 순서대로)
+
+        Returns:
+            요소별 칵테일 목록 문자열
+        """
+        rag_contexts = []
+        selected_cocktail_codes = set()  # 이미 선택된 칵테일 추적
+
+        for query, title in searches:
+            # 이미 선택된 칵테일을 제외한 목록으로 검색
+            available_codes = [code for code in cocktail_codes if code not in selected_cocktail_codes]
+
+            # 사용 가능한 칵테일이 없으면 전체 목록 사용
+            search_codes = available_codes if available_codes else cocktail_codes
+
+            # 더 많은 후보를 가져와서 다양성 확보 (10개 검색)
+            relevant_cocktails = self.rag_service.search_cocktails(
+                query=query, n_results=10, cocktail_list=search_codes
+            )
+
+            if relevant_cocktails:
+                # 랜덤으로 섞어서 매번 다른 추천이 가능하도록
+                shuffled_cocktails = relevant_cocktails.copy()
+                random.shuffle(shuffled_cocktails)
+
+                context = f"\n[{title}]\n"
+                for cocktail in shuffled_cocktails[:10]:  # 상위 10개로 확대
+                    context += f"- {cocktail.get('english_name', '')}\n"
+                    # 첫 번째 칵테일을 선택된 것으로 표시 (다음 검색에서 제외)
+                    if cocktail.get('code'):
+                        selected_cocktail_codes.add(str(cocktail.get('code')))
+                        break  # 요소마다 1개만 선택
+                rag_contexts.append(context)
+
+        return "\n".join(rag_contexts)
+
+    def _get_rag_codes(self, cocktail_list: str) -> List[str]:
+        """이 요청에서 RAG를 사용하면 보유한 칵테일 code 리스트를, 사용하지 않으면 빈 리스트를 반환합니다."""
+        if not (self.use_rag and self.rag_service):
+            return []
+
+        # cocktail_list를 파싱하여 code 리스트 추출
+        cocktail_codes = self._parse_cocktail_codes(cocktail_list)
+
+        # codes가 비어있으면 이 요청에서만 RAG 사용 안 함
+        if not cocktail_codes:
+            logger.warning("cocktail codes가 비어있어 이 요청에서는 RAG를 사용하지 않습니다")
+        return cocktail_codes
+
+    def _build_system_prompt(self, cocktail_codes: List[str], targets: str, searches: List[Tuple[str, str]],
+                             context_label: str, order_rule: str) -> str:
+        """
+        추천 시스템 프롬프트를 만듭니다.
+
+        Args:
+            cocktail_codes: RAG 검색에 사용할 칵테일 code 리스트 (비어있으면 RAG 미사용)
+            targets: 추천 대상 설명 (예: "[계절, 시간대, 날씨]를 입력 받고 각 요소에")
+            searches: 요소별 (검색어, 목록 제목) 튜플 리스트
+            context_label: RAG 목록 설명에 사용할 요소 이름 (예: "요소", "감정")
+            order_rule: 요소별 추천 순서 규칙
+
+        Returns:
+            시스템 프롬프트 문자열
+        """
+        if cocktail_codes:
+            # RAG 검색 결과를 프롬프트에 포함
+            rag_context_text = self._search_rag_contexts(cocktail_codes, searches)
+            diversity_hint = self._get_diversity_hint()
+            return (
+                "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
+                "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
+                "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
+                f"당신은 {targets} 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
+                "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
+                f"아래는 각 {context_label}에 추천 가능한 칵테일 목록입니다:\n{rag_context_text}\n"
+                "추천은 반드시 위 목록에 있는 칵테일의 영어 이름만 사용하세요. 다른 칵테일을 추천하지 마세요.\n"
+                "중요 규칙:\n"
+                "1. \"name\" 필드에는 반드시 위 목록의 영어 칵테일 이름만 정확히 입력하세요.\n"
+                "2. 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
+                f"3. {order_rule}\n"
+                f"4. {diversity_hint}"
+            )
+
+        # 기존 방식 (RAG 미사용)
+        diversity_hint = self._get_diversity_hint()
+        return (
+            "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
+            "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
+            "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
+            f"당신은 {targets} 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
+            "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
+            "추천은 항상 갖고 있는 칵테일에 포함된 칵테일만 작성합니다.\n"
+            "중요: 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
+            f"{diversity_hint}"
+        )
+
+    def _build_messages(self, system_prompt: str, persona: str, cocktail_list: str, *extra: str) -> List[Dict]:
+        """시스템 프롬프트, 페르소나, 보유 칵테일(과 추가 사용자 메시지)로 채팅 메시지 리스트를 만듭니다."""
+        texts = [
+            f"제공된 페르소나는 다음과 같습니다: {persona}",
+            f"당신이 갖고 있는 칵테일은 다음과 같습니다: {cocktail_list}",
+            *extra,
+        ]
+        return [{"role": "system", "content": [{"text": system_prompt, "type": "text"}]}] + [
+            {"role": "user", "content": [{"text": text, "type": "text"}]} for text in texts
+        ]
+
+    def _build_default_messages(self, persona: str, cocktail_list: str,
+                                season: str, time: str, weather: str) -> List[Dict]:
+        """기본 추천 (계절, 시간, 날씨 기반) 요청 메시지를 만듭니다 (RAG 검색 포함)."""
+        contexts = [("계절", season), ("시간대", time), ("날씨", weather)]
+        system_prompt = self._build_system_prompt(
+            self._get_rag_codes(cocktail_list),
+            "[계절, 시간대, 날씨]를 입력 받고 각 요소에",
+            [(f"{value}에 어울리는 칵테일", f"{name}: {value}에 어울리는 칵테일") for name, value in contexts],
+            "요소",
+            "첫 번째는 계절에 어울리는 칵테일, 두 번째는 시간대에 어울리는 칵테일, 세 번째는 날씨에 어울리는 칵테일을 각각 다르게 추천하세요.",
+        )
+        return self._build_messages(
+            system_prompt, persona, cocktail_list, f"당신은 [{season}, {time}, {weather}]에 대해서 추천합니다."
+        )
+
+    def _build_feeling_messages(self, persona: str, cocktail_list: str) -> List[Dict]:
+        """감정 기반 추천 (행복, 피곤, 화남) 요청 메시지를 만듭니다 (RAG 검색 포함)."""
+        system_prompt = self._build_system_prompt(
+            self._get_rag_codes(cocktail_list),
+            "[행복, 피곤, 화남] 상황에",
+            [(f"{feeling}한 감정에 어울리는 칵테일", f"{feeling}에 어울리는 칵테일") for feeling in ("행복", "피곤", "화남")],
+            "감정",
+            "첫 번째는 행복할 때, 두 번째는 피곤할 때, 세 번째는 화날 때 어울리는 칵테일을 각각 다르게 추천하세요.",
+        )
+        return self._build_messages(system_prompt, persona, cocktail_list)
+
+    def _build_situation_messages(self, persona: str, cocktail_list: str) -> List[Dict]:
+        """상황 기반 추천 (바쁨, 한가, 여행) 요청 메시지를 만듭니다 (RAG 검색 포함)."""
+        system_prompt = self._build_system_prompt(
+            self._get_rag_codes(cocktail_list),
+            "[바쁨, 한가, 여행] 상황에",
+            [(f"{situation} 상황에 어울리는 칵테일", f"{situation} 상황에 어울리는 칵테일") for situation in ("바쁨", "한가", "여행")],
+            "상황",
+            "첫 번째는 바쁠 때, 두 번째는 한가할 때, 세 번째는 여행 중일 때 어울리는 칵테일을 각각 다르게 추천하세요.",
+        )
+        return self._build_messages(system_prompt, persona, cocktail_list)
+
+    def _completion_params(self, messages: List[Dict]) -> Dict[str, Any]:
+        """추천 생성에 사용할 chat completion 파라미터를 반환합니다."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "temperature": 1,
+            "max_tokens": 2048,
+            "top_p": 1,
+            "frequency_penalty": 0,
+            "presence_penalty": 0,
+        }
+
     def get_default_recommendation(self, persona: str, cocktail_list: str,
-                                 season: str, time: str, weather: str) -> str:
+                                 season: str, time: str, weather: str) -> Dict[str, Any]:
         """
         기본 추천 (계절, 시간, 날씨 기반)을 생성합니다.
 
@@ -85,123 +270,23 @@ class RecommendationService:
             weather: 날씨
 
         Returns:
-            추천 결과 JSON 문자열
+            추천 결과 딕셔너리 (실패 시 {"error": ...})
         """
         try:
             client = self._get_client()
-
-            # RAG를 사용하는 경우
-            use_rag_for_request = self.use_rag and self.rag_service
-            if use_rag_for_request:
-                # cocktail_list를 파싱하여 code 리스트 추출
-                cocktail_codes = self._parse_cocktail_codes(cocktail_list)
-
-                # codes가 비어있으면 이 요청에서만 RAG 사용 안 함
-                if not cocktail_codes:
-                    logger.warning("cocktail codes가 비어있어 이 요청에서는 RAG를 사용하지 않습니다")
-                    use_rag_for_request = False
-
-            if use_rag_for_request:
-                # 계절, 시간, 날씨에 대해 RAG 검색 수행
-                contexts = [season, time, weather]
-                context_names = ["계절", "시간대", "날씨"]
-                rag_contexts = []
-                selected_cocktail_codes = set()  # 이미 선택된 칵테일 추적
-
-                for i, context in enumerate(contexts):
-                    query = f"{context}에 어울리는 칵테일"
-
-                    # 이미 선택된 칵테일을 제외한 목록으로 검색
-                    available_codes = [code for code in cocktail_codes if code not in selected_cocktail_codes]
-
-                    # 사용 가능한 칵테일이 없으면 전체 목록 사용
-                    search_codes = available_codes if available_codes else cocktail_codes
-
-                    # 더 많은 후보를 가져와서 다양성 확보 (10개 검색)
-                    relevant_cocktails = self.rag_service.search_cocktails(
-                        query=query, n_results=10, cocktail_list=search_codes
-                    )
-
-                    if relevant_cocktails:
-                        # 랜덤으로 섞어서 매번 다른 추천이 가능하도록
-                        shuffled_cocktails = relevant_cocktails.copy()
-                        random.shuffle(shuffled_cocktails)
-
-                        context_text = f"\n[{context_names[i]}: {context}에 어울리는 칵테일]\n"
-                        for cocktail in shuffled_cocktails[:10]:  # 상위 10개로 확대
-                            context_text += f"- {cocktail.get('english_name', '')}\n"
-                            # 첫 번째 칵테일을 선택된 것으로 표시 (다음 검색에서 제외)
-                            if cocktail.get('code'):
-                                selected_cocktail_codes.add(str(cocktail.get('code')))
-                                break  # 각 컨텍스트마다 1개만 선택
-                        rag_contexts.append(context_text)
-
-                # RAG 검색 결과를 프롬프트에 포함
-                rag_context_text = "\n".join(rag_contexts)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [계절, 시간대, 날씨]를 입력 받고 각 요소에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    f"아래는 각 요소에 추천 가능한 칵테일 목록입니다:\n{rag_context_text}\n"
-                    "추천은 반드시 위 목록에 있는 칵테일의 영어 이름만 사용하세요. 다른 칵테일을 추천하지 마세요.\n"
-                    "중요 규칙:\n"
-                    "1. \"name\" 필드에는 반드시 위 목록의 영어 칵테일 이름만 정확히 입력하세요.\n"
-                    "2. 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    "3. 첫 번째는 계절에 어울리는 칵테일, 두 번째는 시간대에 어울리는 칵테일, 세 번째는 날씨에 어울리는 칵테일을 각각 다르게 추천하세요.\n"
-                    f"4. {diversity_hint}"
-                )
-            else:
-                # 기존 방식 (RAG 미사용)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [계절, 시간대, 날씨]를 입력 받고 각 요소에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    "추천은 항상 갖고 있는 칵테일에 포함된 칵테일만 작성합니다.\n"
-                    "중요: 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    f"{diversity_hint}"
-                )
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": [{"text": system_prompt, "type": "text"}]},
-                    {
-                        "role": "user",
-                        "content": [{"text": f"제공된 페르소나는 다음과 같습니다: {persona}", "type": "text"}],
-                    },
-                    {
-                        "role": "user",
-                        "content": [{"text": f"당신이 갖고 있는 칵테일은 다음과 같습니다: {cocktail_list}", "type": "text"}],
-                    },
-                    {
-                        "role": "user",
-                        "content": [{"text": f"당신은 [{season}, {time}, {weather}]에 대해서 추천합니다.", "type": "text"}],
-                    },
-                ],
-                response_format={"type": "json_object"},
-                temperature=1,
-                max_tokens=2048,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-            )
+            messages = self._build_default_messages(persona, cocktail_list, season, time, weather)
+            response = client.chat.completions.create(**self._completion_params(messages))
 
             response_content = response.choices[0].message.content
             matched_response = match_cocktail_in_json(cocktail_list, response_content)
 
-            return json.dumps(matched_response, ensure_ascii=False, indent=4)
+            return matched_response
 
         except Exception as e:
             logger.error(f"기본 추천 생성 중 오류 발생: {e}", exc_info=True)
-            return json.dumps({"error": "추천 생성에 실패했습니다."}, ensure_ascii=False)
-    
-    def get_feeling_recommendation(self, persona: str, cocktail_list: str) -> str:
+            return {"error": "추천 생성에 실패했습니다."}
+
+    def get_feeling_recommendation(self, persona: str, cocktail_list: str) -> Dict[str, Any]:
         """
         감정 기반 추천 (행복, 피곤, 화남)을 생성합니다.
 
@@ -210,116 +295,21 @@ class RecommendationService:
             cocktail_list: 보유한 칵테일 목록
 
         Returns:
-            추천 결과 JSON 문자열
+            추천 결과 딕셔너리 (실패 시 {"error": ...})
         """
         try:
             client = self._get_client()
-
-            # RAG를 사용하는 경우
-            use_rag_for_request = self.use_rag and self.rag_service
-            if use_rag_for_request:
-                # cocktail_list를 파싱하여 code 리스트 추출
-                cocktail_codes = self._parse_cocktail_codes(cocktail_list)
-
-                # codes가 비어있으면 이 요청에서만 RAG 사용 안 함
-                if not cocktail_codes:
-                    logger.warning("cocktail codes가 비어있어 이 요청에서는 RAG를 사용하지 않습니다")
-                    use_rag_for_request = False
-
-            if use_rag_for_request:
-                # 각 감정에 대해 RAG 검색 수행
-                feelings = ["행복", "피곤", "화남"]
-                rag_contexts = []
-                selected_cocktail_codes = set()  # 이미 선택된 칵테일 추적
-
-                for feeling in feelings:
-                    query = f"{feeling}한 감정에 어울리는 칵테일"
-
-                    # 이미 선택된 칵테일을 제외한 목록으로 검색
-                    available_codes = [code for code in cocktail_codes if code not in selected_cocktail_codes]
-
-                    # 사용 가능한 칵테일이 없으면 전체 목록 사용
-                    search_codes = available_codes if available_codes else cocktail_codes
-
-                    # 더 많은 후보를 가져와서 다양성 확보 (10개 검색)
-                    relevant_cocktails = self.rag_service.search_cocktails(
-                        query=query, n_results=10, cocktail_list=search_codes
-                    )
-
-                    if relevant_cocktails:
-                        # 랜덤으로 섞어서 매번 다른 추천이 가능하도록
-                        shuffled_cocktails = relevant_cocktails.copy()
-                        random.shuffle(shuffled_cocktails)
-
-                        context = f"\n[{feeling}에 어울리는 칵테일]\n"
-                        for cocktail in shuffled_cocktails[:10]:  # 상위 10개로 확대
-                            context += f"- {cocktail.get('english_name', '')}\n"
-                            # 첫 번째 칵테일을 선택된 것으로 표시 (다음 검색에서 제외)
-                            if cocktail.get('code'):
-                                selected_cocktail_codes.add(str(cocktail.get('code')))
-                                break  # 각 감정마다 1개만 선택
-                        rag_contexts.append(context)
-
-                # RAG 검색 결과를 프롬프트에 포함
-                rag_context_text = "\n".join(rag_contexts)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [행복, 피곤, 화남] 상황에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    f"아래는 각 감정에 추천 가능한 칵테일 목록입니다:\n{rag_context_text}\n"
-                    "추천은 반드시 위 목록에 있는 칵테일의 영어 이름만 사용하세요. 다른 칵테일을 추천하지 마세요.\n"
-                    "중요 규칙:\n"
-                    "1. \"name\" 필드에는 반드시 위 목록의 영어 칵테일 이름만 정확히 입력하세요.\n"
-                    "2. 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    "3. 첫 번째는 행복할 때, 두 번째는 피곤할 때, 세 번째는 화날 때 어울리는 칵테일을 각각 다르게 추천하세요.\n"
-                    f"4. {diversity_hint}"
-                )
-            else:
-                # 기존 방식 (RAG 미사용)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [행복, 피곤, 화남] 상황에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    "추천은 항상 갖고 있는 칵테일에 포함된 칵테일만 작성합니다.\n"
-                    "중요: 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    f"{diversity_hint}"
-                )
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": [{"text": system_prompt, "type": "text"}]},
-                    {
-                        "role": "user",
-                        "content": [{"text": f"제공된 페르소나는 다음과 같습니다: {persona}", "type": "text"}],
-                    },
-                    {
-                        "role": "user",
-                        "content": [{"text": f"당신이 갖고 있는 칵테일은 다음과 같습니다: {cocktail_list}", "type": "text"}],
-                    },
-                ],
-                response_format={"type": "json_object"},
-                temperature=1,
-                max_tokens=2048,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-            )
+            messages = self._build_feeling_messages(persona, cocktail_list)
+            response = client.chat.completions.create(**self._completion_params(messages))
 
             response_content = response.choices[0].message.content
             matched_response = match_cocktail_in_json(cocktail_list, response_content)
 
-            return json.dumps(matched_response, ensure_ascii=False, indent=4)
+            return matched_response
 
         except Exception as e:
             print(f"감정 기반 추천 생성 중 오류 발생: {e}")
-            return json.dumps({"error": "추천 생성에 실패했습니다."}, ensure_ascii=False)
+            return {"error": "추천 생성에 실패했습니다."}
 
     def _parse_cocktail_codes(self, cocktail_list: str) -> List[str]:
         """칵테일 목록 문자열에서 code 리스트를 추출합니다.
@@ -376,7 +366,7 @@ class RecommendationService:
         logger.info(f"최종 파싱된 codes: {codes}")
         return codes
     
-    def get_situation_recommendation(self, persona: str, cocktail_list: str) -> str:
+    def get_situation_recommendation(self, persona: str, cocktail_list: str) -> Dict[str, Any]:
         """
         상황 기반 추천 (바쁨, 한가, 여행)을 생성합니다.
 
@@ -385,115 +375,83 @@ class RecommendationService:
             cocktail_list: 보유한 칵테일 목록
 
         Returns:
-            추천 결과 JSON 문자열
+            추천 결과 딕셔너리 (실패 시 {"error": ...})
         """
         try:
             client = self._get_client()
-
-            # RAG를 사용하는 경우
-            use_rag_for_request = self.use_rag and self.rag_service
-            if use_rag_for_request:
-                # cocktail_list를 파싱하여 code 리스트 추출
-                cocktail_codes = self._parse_cocktail_codes(cocktail_list)
-
-                # codes가 비어있으면 이 요청에서만 RAG 사용 안 함
-                if not cocktail_codes:
-                    logger.warning("cocktail codes가 비어있어 이 요청에서는 RAG를 사용하지 않습니다")
-                    use_rag_for_request = False
-
-            if use_rag_for_request:
-                # 각 상황에 대해 RAG 검색 수행
-                situations = ["바쁨", "한가", "여행"]
-                rag_contexts = []
-                selected_cocktail_codes = set()  # 이미 선택된 칵테일 추적
-
-                for situation in situations:
-                    query = f"{situation} 상황에 어울리는 칵테일"
-
-                    # 이미 선택된 칵테일을 제외한 목록으로 검색
-                    available_codes = [code for code in cocktail_codes if code not in selected_cocktail_codes]
-
-                    # 사용 가능한 칵테일이 없으면 전체 목록 사용
-                    search_codes = available_codes if available_codes else cocktail_codes
-
-                    # 더 많은 후보를 가져와서 다양성 확보 (10개 검색)
-                    relevant_cocktails = self.rag_service.search_cocktails(
-                        query=query, n_results=10, cocktail_list=search_codes
-                    )
-
-                    if relevant_cocktails:
-                        # 랜덤으로 섞어서 매번 다른 추천이 가능하도록
-                        shuffled_cocktails = relevant_cocktails.copy()
-                        random.shuffle(shuffled_cocktails)
-
-                        context = f"\n[{situation} 상황에 어울리는 칵테일]\n"
-                        for cocktail in shuffled_cocktails[:10]:  # 상위 10개로 확대
-                            context += f"- {cocktail.get('english_name', '')}\n"
-                            # 첫 번째 칵테일을 선택된 것으로 표시 (다음 검색에서 제외)
-                            if cocktail.get('code'):
-                                selected_cocktail_codes.add(str(cocktail.get('code')))
-                                break  # 각 상황마다 1개만 선택
-                        rag_contexts.append(context)
-
-                # RAG 검색 결과를 프롬프트에 포함
-                rag_context_text = "\n".join(rag_contexts)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [바쁨, 한가, 여행] 상황에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    f"아래는 각 상황에 추천 가능한 칵테일 목록입니다:\n{rag_context_text}\n"
-                    "추천은 반드시 위 목록에 있는 칵테일의 영어 이름만 사용하세요. 다른 칵테일을 추천하지 마세요.\n"
-                    "중요 규칙:\n"
-                    "1. \"name\" 필드에는 반드시 위 목록의 영어 칵테일 이름만 정확히 입력하세요.\n"
-                    "2. 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    "3. 첫 번째는 바쁠 때, 두 번째는 한가할 때, 세 번째는 여행 중일 때 어울리는 칵테일을 각각 다르게 추천하세요.\n"
-                    f"4. {diversity_hint}"
-                )
-
-            else:
-                # 기존 방식 (RAG 미사용)
-                diversity_hint = self._get_diversity_hint()
-                system_prompt = (
-                    "당신은 전문 칵테일 소믈리에입니다. 사용자에게 가장 적합한 칵테일을 추천하기 위해 사용자의 페르소나 정보를 바탕으로 추천을 제공합니다.\n"
-                    "당신은 20대 소믈리에이고 편안하고 부담없는 말투를 갖고 있습니다.\n"
-                    "칵테일은 \"name\" 태그, 추천 요소는 \"tag\"태그, 추천 이유는 \"reason\" 태그에 담아 \"recommendation\" 태그에 담긴 json으로 제시합니다.\n"
-                    "당신은 [바쁨, 한가, 여행] 상황에 대해 추천하는 칵테일 1종씩 총 3종을 반드시 순서대로 추천합니다.\n"
-                    "당신은 갖고 있는 칵테일 중 3종을 추천하고 그 이유를 50자 내로 설명합니다.\n"
-                    "추천은 항상 갖고 있는 칵테일에 포함된 칵테일만 작성합니다.\n"
-                    "중요: 3개의 추천은 반드시 서로 다른 칵테일이어야 합니다. 같은 칵테일을 중복으로 추천하지 마세요.\n"
-                    f"{diversity_hint}"
-                )
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": [{"text": system_prompt, "type": "text"}]},
-                    {
-                        "role": "user",
-                        "content": [{"text": f"제공된 페르소나는 다음과 같습니다: {persona}", "type": "text"}],
-                    },
-                    {
-                        "role": "user",
-                        "content": [{"text": f"당신이 갖고 있는 칵테일은 다음과 같습니다: {cocktail_list}", "type": "text"}],
-                    },
-                ],
-                response_format={"type": "json_object"},
-                temperature=1,
-                max_tokens=2048,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-            )
+            messages = self._build_situation_messages(persona, cocktail_list)
+            response = client.chat.completions.create(**self._completion_params(messages))
 
             response_content = response.choices[0].message.content
             
             matched_response = match_cocktail_in_json(cocktail_list, response_content)
 
-            return json.dumps(matched_response, ensure_ascii=False, indent=4)
+            return matched_response
 
         except Exception as e:
             print(f"상황 기반 추천 생성 중 오류 발생: {e}")
-            return json.dumps({"error": "추천 생성에 실패했습니다."}, ensure_ascii=False)
+            return {"error": "추천 생성에 실패했습니다."}
+
+    def stream_recommendation(self, kind: str, persona: str, cocktail_list: str,
+                              *context: str) -> Iterator[Tuple[str, Any]]:
+        """
+        OpenAI 스트리밍 응답으로 추천을 생성하며, 추천 항목이 완성될 때마다 이벤트를 내보냅니다.
+
+        Args:
+            kind: 추천 종류 ("default", "feeling", "situation")
+            persona: 사용자 페르소나
+            cocktail_list: 보유한 칵테일 목록
+            *context: 기본 추천의 계절, 시간대, 날씨
+
+        Yields:
+            ("recommendation", 이름이 매칭된 추천 항목) 튜플을 항목마다 하나씩,
+            마지막에 ("done", 전체 추천 결과) 또는 ("error", {"error": ...}) 튜플
+        """
+        builders = {
+            "default": self._build_default_messages,
+            "feeling": self._build_feeling_messages,
+            "situation": self._build_situation_messages,
+        }
+        try:
+            client = self._get_client()
+            messages = builders[kind](persona, cocktail_list, *context)
+            stream = client.chat.completions.create(**self._completion_params(messages), stream=True)
+
+            available_cocktails = parse_available_cocktails(cocktail_list)
+            parser = JsonArrayStream("recommendation")
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                for item in parser.feed(chunk.choices[0].delta.content):
+                    if isinstance(item, dict):
+                        yield "recommendation", match_recommendation_item(item, available_cocktails)
+
+            result = match_cocktail_in_json(cocktail_list, parser.text)
+        except Exception as e:
+            logger.error(f"추천 스트리밍 중 오류 발생: {e}", exc_info=True)
+            yield "error", {"error": "추천 생성에 실패했습니다."}
+            return
+
+        yield ("error", result) if "error" in result else ("done", result)
+
+    @staticmethod
+    def result_events(result: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """
+        이미 만들어진 추천 결과(캐시, 병합된 호출의 결과 등)를 stream_recommendation과 같은 이벤트로 내보냅니다.
+
+        Args:
+            result: 추천 결과 딕셔너리
+
+        Yields:
+            추천 항목별 ("recommendation", 항목) 튜플과 마지막 ("done", 결과) 튜플
+            (에러 결과이면 ("error", 결과) 튜플 하나)
+        """
+        if "error" in result:
+            yield "error", result
+            return
+
+        recommendations = result.get("recommendation")
+        if isinstance(recommendations, list):
+            for item in recommendations:
+                yield "recommendation", item
+        yield "done", result
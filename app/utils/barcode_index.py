@@ -0,0 +1,95 @@
+"""
+바코드 prefix 인덱스 유틸리티 모듈
+정렬된 바코드 배열과 이진 탐색으로 정확 일치, 뒤 3자리 무시 일치, prefix 검색을 처리합니다.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+# 바코드 정확 일치 실패 시 무시하는 뒤쪽 자릿수
+FALLBACK_SUFFIX_LENGTH = 3
+
+
+class BarcodeIndex:
+    """정규화된 바코드를 정렬해 보관하는 prefix 인덱스 클래스"""
+
+    def __init__(self, records: List[Dict], code_field: str = "code"):
+        self.records = records
+
+        entries: List[Tuple[str, int]] = []
+        for position, record in enumerate(records):
+            code = record.get(code_field)
+            if isinstance(code, str) and code.strip():
+                entries.append((code.strip(), position))
+
+        # 같은 바코드는 카탈로그 순서(position)가 빠른 항목이 먼저 오도록 정렬합니다.
+        entries.sort()
+        self._codes = [code for code, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """prefix로 시작하는 바코드의 [start, end) 범위를 반환합니다."""
+        start = bisect_left(self._codes, prefix)
+        # prefix로 시작하는 바코드는 모두 prefix + "\uffff"보다 앞에 정렬되므로 끝 위치도 이진 탐색으로 찾습니다.
+        end = bisect_left(self._codes, prefix + "\uffff", start)
+        return start, end
+
+    def lookup(self, code: Any) -> Optional[Dict]:
+        """
+        바코드로 레코드를 찾습니다.
+
+        정확히 일치하는 바코드를 우선 반환하고, 없으면 뒤 3자리를 제외한 prefix가 같고
+        길이가 같은 바코드 중 카탈로그 순서상 첫 번째 레코드를 반환합니다.
+
+        Args:
+            code: 찾을 바코드
+
+        Returns:
+            찾은 레코드 또는 None
+        """
+        if not isinstance(code, str):
+            return None
+
+        code = code.strip()
+        if not code:
+            return None
+
+        if len(code) <= FALLBACK_SUFFIX_LENGTH:
+            index = bisect_left(self._codes, code)
+            if index < len(self._codes) and self._codes[index] == code:
+                return self.records[self._positions[index]]
+            return None
+
+        # 정확 일치 바코드도 같은 prefix 범위 안에 있으므로 한 번의 탐색으로 두 경우를 처리합니다.
+        prefix = code[:-FALLBACK_SUFFIX_LENGTH]
+        start, end = self._prefix_range(prefix)
+
+        fallback_position = None
+        for index in range(start, end):
+            candidate = self._codes[index]
+            if candidate == code:
+                return self.records[self._positions[index]]
+            if len(candidate) == len(code):
+                position = self._positions[index]
+                if fallback_position is None or position < fallback_position:
+                    fallback_position = position
+
+        if fallback_position is None:
+            return None
+        return self.records[fallback_position]
+
+    def search_prefix(self, prefix: Any) -> List[Dict]:
+        """
+        바코드 prefix로 시작하는 모든 레코드를 찾습니다.
+
+        Args:
+            prefix: 바코드 prefix (예: 제조사 코드)
+
+        Returns:
+            카탈로그 순서를 유지한 레코드 리스트
+        """
+        if not isinstance(prefix, str) or not prefix.strip():
+            return []
+
+        start, end = self._prefix_range(prefix.strip())
+        return [self.records[position] for position in sorted(self._positions[start:end])]
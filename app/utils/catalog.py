@@ -0,0 +1,289 @@
+"""
+카탈로그 인덱스 유틸리티 모듈
+DataLoader가 로드한 레코드 리스트에 대한 해시 인덱스를 제공합니다.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from app.utils.barcode_index import BarcodeIndex
+from app.utils.data_loader import data_loader
+from app.utils.pagination import FieldColumns
+from app.utils.product_table import ProductTable
+from app.utils.recipe_bitset import RecipeBitset
+from app.utils.recipe_images import RecipeImageMap
+from app.utils.text_index import NgramIndex
+
+
+def normalize_name(value: Any) -> str:
+    """
+    이름 인덱스에 사용할 정규화된 문자열을 반환합니다.
+
+    Args:
+        value: 정규화할 값
+
+    Returns:
+        앞뒤 공백을 제거하고 소문자로 변환한 문자열 (문자열이 아니면 빈 문자열)
+    """
+    if not isinstance(value, str):
+        return ""
+    return value.strip().lower()
+
+
+class RecordIndex:
+    """
+    레코드 리스트에 대한 코드/이름 해시 인덱스
+
+    text_fallback이면 이름 검색(search)은 name_fields 중 레코드가 가진 첫 번째 필드만 사용합니다.
+    """
+
+    # 직렬화(카탈로그 스냅샷)에서 제외하는 파생 구조
+    # 이미지 매핑은 파일 시스템 상태에 의존하므로 스냅샷을 로드한 뒤 현재 이미지 디렉토리로 다시 만듭니다.
+    TRANSIENT_DERIVED = ("images",)
+
+    def __init__(self, records: List[Dict], code_field: str = "code", name_fields: Sequence[str] = ("name",),
+                 text_fallback: bool = False):
+        self.records = records
+        self.size = len(records)
+        self.name_fields = tuple(name_fields)
+        self.text_fallback = text_fallback
+        self.by_code: Dict[str, Dict] = {}
+        self.by_name: Dict[str, Dict] = {}
+        self._derived: Dict[str, Any] = {}
+
+        # 같은 키가 여러 번 나오면 카탈로그 순서상 첫 번째 레코드를 유지합니다.
+        for record in records:
+            code = record.get(code_field)
+            if code is not None:
+                self.by_code.setdefault(str(code).strip(), record)
+
+            for field in name_fields:
+                name = normalize_name(record.get(field))
+                if name:
+                    self.by_name.setdefault(name, record)
+
+    def is_built_from(self, records: List[Dict]) -> bool:
+        """인덱스가 주어진 레코드 리스트로 만들어졌는지 확인합니다."""
+        return self.records is records and self.size == len(records)
+
+    def get(self, code: Any) -> Optional[Dict]:
+        """
+        코드로 레코드를 찾습니다.
+
+        Args:
+            code: 찾을 코드
+
+        Returns:
+            찾은 레코드 또는 None
+        """
+        if code is None:
+            return None
+        return self.by_code.get(str(code))
+
+    def get_many(self, codes: Iterable[Any]) -> List[Dict]:
+        """
+        여러 코드로 레코드를 찾습니다. 입력 순서를 유지하며 없는 코드는 건너뜁니다.
+
+        Args:
+            codes: 찾을 코드 목록
+
+        Returns:
+            찾은 레코드 리스트
+        """
+        results = []
+        for code in codes:
+            record = self.get(code)
+            if record is not None:
+                results.append(record)
+        return results
+
+    def get_by_name(self, name: Any) -> Optional[Dict]:
+        """
+        정규화된 이름이 정확히 일치하는 레코드를 찾습니다.
+
+        Args:
+            name: 찾을 이름
+
+        Returns:
+            찾은 레코드 또는 None
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+        return self.by_name.get(normalized)
+
+    def search(self, keyword: Any) -> List[Dict]:
+        """
+        이름 필드에 키워드가 포함된 레코드를 n-gram 역색인으로 검색합니다.
+
+        Args:
+            keyword: 검색할 키워드
+
+        Returns:
+            카탈로그 순서를 유지한 검색 결과 리스트
+        """
+        return self.get_text_index().search(keyword)
+
+    def get_text_index(self) -> NgramIndex:
+        """이름 필드에 대한 n-gram 역색인을 반환합니다."""
+        return self.get_derived("text", lambda records: NgramIndex(records, self.name_fields, self.text_fallback))
+
+    def get_derived(self, name: str, factory: Callable[[List[Dict]], Any]) -> Any:
+        """
+        레코드 리스트에서 파생된 구조를 처음 요청될 때 한 번만 만들어 보관합니다.
+
+        인덱스와 수명이 같으므로 데이터가 다시 로드되면 함께 새로 만들어집니다.
+
+        Args:
+            name: 파생 구조 이름
+            factory: 레코드 리스트를 받아 파생 구조를 만드는 함수
+
+        Returns:
+            파생 구조
+        """
+        if name not in self._derived:
+            self._derived[name] = factory(self.records)
+        return self._derived[name]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_derived"] = {
+            name: value for name, value in self._derived.items() if name not in self.TRANSIENT_DERIVED
+        }
+        return state
+
+
+class Catalog:
+    """
+    데이터 로드 단위로 레코드 인덱스를 보관하는 카탈로그
+
+    loader가 있으면 새로 만든 인덱스는 records가 loader의 현재 리스트일 때만 보관하므로,
+    교체 직전 데이터를 읽은 요청이 교체 후 등록된 인덱스를 이전 데이터의 인덱스로 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, loader: Any = None):
+        self.loader = loader
+        self._indexes: Dict[str, RecordIndex] = {}
+        self._staged: Dict[str, RecordIndex] = {}
+
+    def get_index(
+        self, name: str, records: List[Dict], code_field: str = "code", name_fields: Sequence[str] = ("name",),
+        text_fallback: bool = False, source: Optional[str] = None,
+    ) -> RecordIndex:
+        """
+        레코드 리스트에 대한 인덱스를 반환합니다.
+
+        DataLoader는 다시 로드하기 전까지 같은 리스트 객체를 반환하므로,
+        리스트가 바뀐 경우에만 인덱스를 새로 만듭니다.
+
+        Args:
+            name: 인덱스 이름
+            records: 인덱싱할 레코드 리스트
+            code_field: 코드로 사용할 필드명
+            name_fields: 이름으로 사용할 필드명 목록
+            text_fallback: 이름 검색에 name_fields 중 레코드가 가진 첫 번째 필드만 사용할지 여부
+            source: records를 반환하는 loader 메서드 이름 (현재 데이터인지 확인용)
+
+        Returns:
+            RecordIndex 인스턴스
+        """
+        index = self._indexes.get(name)
+        if index is not None and index.is_built_from(records):
+            return index
+
+        # 핫 리로드 중에는 새 데이터용 인덱스가 stage되어 있으므로 다시 만들지 않습니다.
+        staged = self._staged.get(name)
+        if staged is not None and staged.is_built_from(records):
+            return staged
+
+        index = RecordIndex(records, code_field=code_field, name_fields=name_fields, text_fallback=text_fallback)
+        # 교체 전 데이터의 인덱스는 보관하지 않고 이번 요청에만 사용합니다.
+        if name not in self._indexes or self._is_current(records, source):
+            self._indexes[name] = index
+        return index
+
+    def _is_current(self, records: List[Dict], source: Optional[str]) -> bool:
+        """records가 loader가 현재 반환하는 리스트인지 확인합니다 (loader가 없으면 항상 True)."""
+        if self.loader is None or source is None:
+            return True
+        return getattr(self.loader, source)() is records
+
+    def products(self, records: List[Dict]) -> RecordIndex:
+        """음료 인덱스를 반환합니다."""
+        return self.get_index("products", records, "code", ("name",), source="get_all_drinks")
+
+    def ingredients(self, records: List[Dict]) -> RecordIndex:
+        """재료 인덱스를 반환합니다."""
+        return self.get_index("ingredients", records, "code", ("name",), source="get_all_ingredients")
+
+    def recipes(self, records: List[Dict]) -> RecordIndex:
+        """레시피 인덱스를 반환합니다."""
+        return self.get_index("recipes", records, "code", ("korean_name", "english_name"), source="get_all_recipes")
+
+    def challenges(self, records: List[Dict]) -> RecordIndex:
+        """챌린지 인덱스를 반환합니다."""
+        # 제목 검색은 title이 있으면 title만, 없으면 name을 사용합니다.
+        return self.get_index(
+            "challenges", records, "id", ("title", "name"), text_fallback=True, source="get_all_challenges"
+        )
+
+    def install(self, indexes: Dict[str, RecordIndex]):
+        """
+        미리 만들어 둔 인덱스(예: 카탈로그 스냅샷)를 등록합니다.
+
+        Args:
+            indexes: 인덱스 이름별 RecordIndex 딕셔너리
+        """
+        # 참조 하나만 교체해 읽는 쪽이 일부만 바뀐 인덱스를 보지 않도록 합니다.
+        self._indexes = {**self._indexes, **indexes}
+        self._staged = {}
+
+    def stage(self, indexes: Dict[str, RecordIndex]):
+        """
+        데이터 교체 직전에 새 버전의 인덱스를 미리 등록합니다.
+
+        교체 전 데이터로 요청하는 쪽은 기존 인덱스를, 교체 후 데이터로 요청하는 쪽은
+        stage된 인덱스를 사용하므로 교체 중에도 인덱스를 다시 만들지 않습니다.
+
+        Args:
+            indexes: 인덱스 이름별 RecordIndex 딕셔너리
+        """
+        self._staged = dict(indexes)
+
+    def warm(self, loader: Any) -> Dict[str, RecordIndex]:
+        """
+        모든 카탈로그 데이터를 로드하고 인덱스와 파생 구조를 미리 만듭니다.
+
+        Args:
+            loader: get_all_drinks 등을 제공하는 DataLoader 인스턴스
+
+        Returns:
+            인덱스 이름별 RecordIndex 딕셔너리
+        """
+        products = self.products(loader.get_all_drinks())
+        products.get_derived("barcode", BarcodeIndex)
+        products.get_derived("columns", ProductTable)
+        products.get_derived("fields", FieldColumns)
+
+        recipes = self.recipes(loader.get_all_recipes())
+        recipes.get_derived("ingredient_bitset", RecipeBitset)
+        recipes.get_derived("fields", FieldColumns)
+        recipes.get_derived("images", RecipeImageMap)
+
+        indexes = {
+            "products": products,
+            "ingredients": self.ingredients(loader.get_all_ingredients()),
+            "recipes": recipes,
+            "challenges": self.challenges(loader.get_all_challenges()),
+        }
+        for index in indexes.values():
+            index.get_text_index()
+
+        return indexes
+
+    def clear(self):
+        """모든 인덱스를 초기화합니다."""
+        self._indexes = {}
+        self._staged = {}
+
+
+# 전역 카탈로그 인스턴스
+catalog = Catalog(data_loader)
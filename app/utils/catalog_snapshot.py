@@ -0,0 +1,172 @@
+"""
+카탈로그 스냅샷 유틸리티 모듈
+카탈로그 JSON 파일과 인덱스를 하나의 바이너리 스냅샷으로 컴파일하고 다시 로드합니다.
+
+파일 구조:
+    MAGIC(8) | 포맷 버전(4) | manifest 길이(4) | manifest(JSON) | payload SHA-256(32) | payload(pickle)
+
+manifest에는 원본 JSON 파일별 SHA-256이 들어 있어, payload를 역직렬화하기 전에
+원본이 바뀌었는지(stale) 확인할 수 있습니다.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.utils.catalog import catalog
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"MIXBYCAT"
+SNAPSHOT_FORMAT_VERSION = 1
+DEFAULT_SNAPSHOT_FILENAME = "catalog.snapshot"
+
+# 스냅샷에 포함하는 원본 JSON 파일
+SNAPSHOT_SOURCE_FILES = (
+    "allProducts.json",
+    "allIngredients.json",
+    "allRecipes.json",
+    "allChallenges.json",
+    "bases.json",
+    "recipe_names.json",
+    "api_rules.json",
+)
+
+_HEADER = struct.Struct(">8sII")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def _file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_checksums(data_dir: str) -> Dict[str, str]:
+    """
+    데이터 디렉토리의 원본 JSON 파일별 SHA-256을 계산합니다.
+
+    Args:
+        data_dir: 데이터 디렉토리 경로
+
+    Returns:
+        파일명별 SHA-256 딕셔너리 (존재하는 파일만 포함)
+    """
+    checksums = {}
+    for filename in SNAPSHOT_SOURCE_FILES:
+        path = os.path.join(data_dir, filename)
+        if os.path.exists(path):
+            checksums[filename] = _file_sha256(path)
+    return checksums
+
+
+def build_snapshot(loader: Any, output_path: str = None) -> str:
+    """
+    DataLoader의 JSON 원본을 파싱하고 인덱스를 만들어 스냅샷 파일로 저장합니다.
+
+    Args:
+        loader: JSON 원본을 읽을 DataLoader 인스턴스
+        output_path: 저장할 경로 (None이면 데이터 디렉토리의 catalog.snapshot)
+
+    Returns:
+        저장된 스냅샷 파일 경로
+    """
+    if output_path is None:
+        output_path = os.path.join(loader.data_dir, DEFAULT_SNAPSHOT_FILENAME)
+
+    sources = source_checksums(loader.data_dir)
+    data = {filename: loader.load_json(filename) for filename in sources}
+    indexes = catalog.warm(loader)
+
+    manifest = json.dumps(
+        {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "sources": sources,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    # data와 indexes를 한 번에 직렬화해 RecordIndex.records가 같은 리스트 객체를 가리키도록 합니다.
+    payload = pickle.dumps({"data": data, "indexes": indexes}, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = hashlib.sha256(payload).digest()
+
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(manifest)))
+        snapshot_file.write(manifest)
+        snapshot_file.write(digest)
+        snapshot_file.write(payload)
+    os.replace(temp_path, output_path)
+
+    logger.info(f"카탈로그 스냅샷 생성 완료: {output_path} ({len(payload)} bytes)")
+    return output_path
+
+
+def read_snapshot(path: str, data_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    스냅샷 파일을 메모리 매핑으로 읽습니다.
+
+    파일이 없거나, 포맷 버전이 다르거나, 체크섬이 맞지 않거나, 원본 JSON이 바뀐 경우 None을 반환합니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+        data_dir: 원본 JSON 데이터 디렉토리 경로
+
+    Returns:
+        {"manifest", "data", "indexes"} 딕셔너리 또는 None
+    """
+    if not os.path.exists(path):
+        logger.info(f"카탈로그 스냅샷이 없어 JSON 원본을 사용합니다: {path}")
+        return None
+
+    try:
+        with open(path, "rb") as snapshot_file:
+            with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return _parse_snapshot(view, path, data_dir)
+                finally:
+                    view.release()
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError, struct.error) as e:
+        logger.warning(f"카탈로그 스냅샷 로드 실패, JSON 원본을 사용합니다: {path} - {e}")
+        return None
+
+
+def _parse_snapshot(view: memoryview, path: str, data_dir: str) -> Optional[Dict[str, Any]]:
+    """메모리 매핑된 스냅샷을 검증하고 역직렬화합니다."""
+    magic, format_version, manifest_length = _HEADER.unpack_from(view, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("스냅샷 파일 형식이 아닙니다.")
+
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        logger.warning(f"카탈로그 스냅샷 포맷 버전이 다릅니다 ({format_version} != {SNAPSHOT_FORMAT_VERSION}): {path}")
+        return None
+
+    offset = _HEADER.size
+    manifest = json.loads(bytes(view[offset : offset + manifest_length]).decode("utf-8"))
+    offset += manifest_length
+
+    if manifest.get("sources") != source_checksums(data_dir):
+        logger.warning(f"카탈로그 원본이 스냅샷 이후 변경되어 JSON 원본을 사용합니다: {path}")
+        return None
+
+    expected_digest = bytes(view[offset : offset + _DIGEST_SIZE])
+    offset += _DIGEST_SIZE
+
+    # 슬라이스 뷰도 mmap을 참조하므로 예외가 나도 mmap을 닫을 수 있게 with로 해제합니다.
+    with view[offset:] as payload:
+        if hashlib.sha256(payload).digest() != expected_digest:
+            raise ValueError("스냅샷 체크섬이 일치하지 않습니다.")
+        contents = pickle.loads(payload)
+
+    return {"manifest": manifest, "data": contents["data"], "indexes": contents["indexes"]}
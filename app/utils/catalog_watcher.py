@@ -0,0 +1,94 @@
+"""
+카탈로그 파일 감시 유틸리티 모듈
+카탈로그 JSON 파일의 변경을 주기적으로 확인해 워커 재시작 없이 데이터를 다시 로드합니다.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from app.utils.catalog_snapshot import SNAPSHOT_SOURCE_FILES
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWatcher:
+    """카탈로그 JSON 파일의 mtime/크기를 폴링해 변경 시 DataLoader.reload_data를 호출하는 클래스"""
+
+    def __init__(self, loader: Any, interval: float):
+        self.loader = loader
+        self.interval = interval
+        self._signature = self._read_signature()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._fork_hook_registered = False
+
+    def _read_signature(self) -> Dict[str, Tuple[int, int]]:
+        """원본 JSON 파일별 (수정 시각, 크기)를 반환합니다."""
+        signature = {}
+        for filename in SNAPSHOT_SOURCE_FILES:
+            try:
+                stat = os.stat(os.path.join(self.loader.data_dir, filename))
+            except OSError:
+                continue
+            signature[filename] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def check(self) -> bool:
+        """
+        파일 변경 여부를 확인하고 변경되었으면 데이터를 다시 로드합니다.
+
+        Returns:
+            다시 로드했는지 여부
+        """
+        signature = self._read_signature()
+        if signature == self._signature:
+            return False
+
+        self.loader.reload_data()
+        self._signature = signature
+        return True
+
+    def _run(self):
+        """interval마다 파일 변경을 확인합니다."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                # 파일을 쓰는 도중이면 파싱에 실패할 수 있으므로 다음 주기에 다시 시도합니다.
+                logger.warning(f"카탈로그 리로드 실패, 기존 데이터를 계속 사용합니다: {e}")
+
+    def start(self):
+        """
+        백그라운드 감시 스레드를 시작합니다.
+
+        스레드는 fork 후 자식 프로세스로 복사되지 않으므로, gunicorn preload 환경에서는
+        fork 직후 각 워커에서 감시 스레드를 다시 시작하고 마스터의 감시는 중지합니다.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+        if not self._fork_hook_registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=self._stop_event_before_fork, after_in_child=self._restart_after_fork)
+            self._fork_hook_registered = True
+
+    def _stop_event_before_fork(self):
+        """fork하는 부모 프로세스(gunicorn 마스터)는 요청을 처리하지 않으므로 감시를 중지합니다."""
+        self._stop_event.set()
+
+    def _restart_after_fork(self):
+        """fork된 자식 프로세스에서 감시 스레드를 새로 시작합니다."""
+        self._thread = None
+        self.start()
+
+    def stop(self):
+        """감시 스레드를 중지합니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
@@ -6,6 +6,54 @@ import json
 from typing import Dict, Any, List
 
 
+def parse_available_cocktails(cocktail_list: str) -> List[str]:
+    """
+    보유 칵테일 목록에서 매칭에 사용할 칵테일 이름 목록을 추출합니다.
+
+    Args:
+        cocktail_list: 보유한 칵테일 목록 (쉼표로 구분된 문자열 또는 JSON 배열 문자열)
+
+    Returns:
+        칵테일 이름 목록
+    """
+    available_cocktails = []
+    try:
+        # JSON 배열로 파싱 시도
+        cocktail_data = json.loads(cocktail_list)
+        if isinstance(cocktail_data, list):
+            # 각 칵테일에서 이름 추출 (korean_name, english_name, 또는 단순 문자열)
+            for item in cocktail_data:
+                if isinstance(item, dict):
+                    if 'korean_name' in item:
+                        available_cocktails.append(item['korean_name'])
+                    if 'english_name' in item:
+                        available_cocktails.append(item['english_name'])
+                elif isinstance(item, str):
+                    available_cocktails.append(item)
+    except (json.JSONDecodeError, TypeError):
+        # JSON 파싱 실패 시 쉼표로 구분된 문자열로 처리
+        available_cocktails = [name.strip() for name in cocktail_list.split(",")]
+    return available_cocktails
+
+
+def match_recommendation_item(rec: Dict[str, Any], available_cocktails: List[str]) -> Dict[str, Any]:
+    """
+    추천 항목 하나의 칵테일 이름을 보유 칵테일 이름으로 바꿉니다.
+
+    Args:
+        rec: 추천 항목 (name 필드)
+        available_cocktails: parse_available_cocktails로 만든 칵테일 이름 목록
+
+    Returns:
+        이름이 매칭된 추천 항목 (같은 객체)
+    """
+    if "name" in rec:
+        matched_name = find_best_match(rec["name"], available_cocktails)
+        if matched_name:
+            rec["name"] = matched_name
+    return rec
+
+
 def match_cocktail_in_json(cocktail_list: str, response_json: str) -> Dict[str, Any]:
     """
     JSON 응답에서 칵테일 이름을 실제 보유 칵테일 목록과 매칭합니다.
@@ -19,23 +67,7 @@ def match_cocktail_in_json(cocktail_list: str, response_json: str) -> Dict[str,
     """
     try:
         # 보유 칵테일 리스트를 파싱
-        available_cocktails = []
-        try:
-            # JSON 배열로 파싱 시도
-            cocktail_data = json.loads(cocktail_list)
-            if isinstance(cocktail_data, list):
-                # 각 칵테일에서 이름 추출 (korean_name, english_name, 또는 단순 문자열)
-                for item in cocktail_data:
-                    if isinstance(item, dict):
-                        if 'korean_name' in item:
-                            available_cocktails.append(item['korean_name'])
-                        if 'english_name' in item:
-                            available_cocktails.append(item['english_name'])
-                    elif isinstance(item, str):
-                        available_cocktails.append(item)
-        except (json.JSONDecodeError, TypeError):
-            # JSON 파싱 실패 시 쉼표로 구분된 문자열로 처리
-            available_cocktails = [name.strip() for name in cocktail_list.split(",")]
+        available_cocktails = parse_available_cocktails(cocktail_list)
 
         # JSON 응답 파싱
         response_data = json.loads(response_json)
@@ -45,10 +77,7 @@ def match_cocktail_in_json(cocktail_list: str, response_json: str) -> Dict[str,
             recommendations = response_data["recommendation"]
             if isinstance(recommendations, list):
                 for rec in recommendations:
-                    if "name" in rec:
-                        matched_name = find_best_match(rec["name"], available_cocktails)
-                        if matched_name:
-                            rec["name"] = matched_name
+                    match_recommendation_item(rec, available_cocktails)
 
         return response_data
 
@@ -3,10 +3,16 @@
 JSON 파일들을 로드하고 캐싱하는 기능을 제공합니다.
 """
 
+import hashlib
 import json
+import logging
 import os
+import threading
 from collections import OrderedDict
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class DataLoader:
@@ -21,6 +27,11 @@ class DataLoader:
             self.data_dir = data_dir
 
         self._cache: Dict[str, Any] = {}
+        # 데이터가 교체될 때마다 증가하는 버전 (파생 캐시 무효화 키로 사용)
+        self.version = 0
+        self._reload_lock = threading.Lock()
+        # (버전, 원본 파일 fingerprint, 최종 수정 시각) - HTTP 검증자(ETag/Last-Modified)용
+        self._validators: Optional[Tuple[int, str, Optional[datetime]]] = None
 
     def load_json(self, filename: str, use_ordered_dict: bool = True) -> Any:
         """
@@ -33,8 +44,10 @@ class DataLoader:
         Returns:
             로드된 JSON 데이터
         """
-        if filename in self._cache:
-            return self._cache[filename]
+        # 핫 리로드로 캐시 참조가 교체되어도 한 번 읽은 캐시를 끝까지 사용합니다.
+        cache = self._cache
+        if filename in cache:
+            return cache[filename]
 
         file_path = os.path.join(self.data_dir, filename)
 
@@ -48,7 +61,7 @@ class DataLoader:
                 else:
                     data = json.load(json_file)
 
-                self._cache[filename] = data
+                cache[filename] = data
                 return data
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON 파일 파싱 오류: {filename} - {str(e)}")
@@ -79,22 +92,128 @@ class DataLoader:
         """레시피 이름 데이터를 반환합니다."""
         return self.load_json("recipe_names.json")
 
+    def load_snapshot(self, snapshot_path: str = None) -> bool:
+        """
+        미리 컴파일된 카탈로그 스냅샷을 로드합니다.
+
+        스냅샷이 없거나 원본 JSON보다 오래된 경우 아무것도 하지 않으며,
+        이후 요청은 기존처럼 JSON 원본을 파싱합니다.
+
+        Args:
+            snapshot_path: 스냅샷 파일 경로 (None이면 데이터 디렉토리의 기본 파일)
+
+        Returns:
+            스냅샷 로드 성공 여부
+        """
+        from app.utils.catalog import catalog
+        from app.utils.catalog_snapshot import DEFAULT_SNAPSHOT_FILENAME, read_snapshot
+
+        if snapshot_path is None:
+            snapshot_path = os.path.join(self.data_dir, DEFAULT_SNAPSHOT_FILENAME)
+
+        snapshot = read_snapshot(snapshot_path, self.data_dir)
+        if snapshot is None:
+            return False
+
+        catalog.stage(snapshot["indexes"])
+        self._cache = {**self._cache, **snapshot["data"]}
+        self.version += 1
+        catalog.install(snapshot["indexes"])
+        logger.info(f"카탈로그 스냅샷 로드 완료: {snapshot_path} (생성 시각: {snapshot['manifest'].get('created_at')})")
+        return True
+
+    def preload(self) -> List[str]:
+        """
+        카탈로그 JSON 파일을 모두 미리 로드합니다.
+
+        gunicorn preload 환경에서 마스터 프로세스가 fork 전에 호출하면
+        워커들이 파싱된 데이터를 copy-on-write로 공유합니다.
+
+        Returns:
+            로드한 파일명 리스트
+        """
+        from app.utils.catalog_snapshot import SNAPSHOT_SOURCE_FILES
+
+        loaded = []
+        for filename in SNAPSHOT_SOURCE_FILES:
+            if os.path.exists(os.path.join(self.data_dir, filename)):
+                self.load_json(filename)
+                loaded.append(filename)
+        return loaded
+
+    def _read_validators(self) -> Tuple[str, Optional[datetime]]:
+        """원본 JSON 파일 내용의 fingerprint와 가장 최근 수정 시각을 계산합니다."""
+        from app.utils.catalog_snapshot import SNAPSHOT_SOURCE_FILES, source_checksums
+
+        checksums = source_checksums(self.data_dir)
+        fingerprint = hashlib.sha256(json.dumps(checksums, sort_keys=True).encode("utf-8")).hexdigest()
+
+        mtimes = [
+            os.path.getmtime(os.path.join(self.data_dir, filename))
+            for filename in SNAPSHOT_SOURCE_FILES
+            if filename in checksums
+        ]
+        last_modified = datetime.fromtimestamp(int(max(mtimes)), tz=timezone.utc) if mtimes else None
+        return fingerprint, last_modified
+
+    def get_validators(self) -> Tuple[str, Optional[datetime]]:
+        """
+        현재 데이터 버전의 HTTP 검증자 정보를 반환합니다.
+
+        fingerprint는 원본 파일 내용의 해시이므로 워커나 서버가 달라도,
+        재시작해도 같은 데이터면 같은 값을 가집니다. 데이터 버전별로 한 번만 계산합니다.
+
+        Returns:
+            (원본 파일 fingerprint, 원본 파일의 최종 수정 시각) 튜플
+        """
+        validators = self._validators
+        if validators is None or validators[0] != self.version:
+            version = self.version
+            fingerprint, last_modified = self._read_validators()
+            validators = (version, fingerprint, last_modified)
+            self._validators = validators
+        return validators[1], validators[2]
+
     def clear_cache(self):
         """캐시를 초기화합니다."""
-        self._cache.clear()
+        self._cache = {}
+        self.version += 1
 
-    def reload_data(self, filename: str = None):
+    def reload_data(self, filename: str = None) -> int:
         """
         데이터를 다시 로드합니다.
 
+        새 데이터와 인덱스를 별도로 모두 만든 뒤 캐시 참조 하나만 교체하므로,
+        교체 전까지 요청은 기존 데이터를 그대로 사용하고 파싱 비용을 부담하지 않습니다.
+
         Args:
             filename: 특정 파일만 다시 로드할 경우 파일명 지정
+
+        Returns:
+            교체된 데이터 버전
         """
-        if filename:
-            if filename in self._cache:
-                del self._cache[filename]
-        else:
-            self.clear_cache()
+        from app.utils.catalog import Catalog, catalog
+
+        with self._reload_lock:
+            # 파싱 전에 계산해, 그 사이 파일이 바뀌면 다음 리로드에서 fingerprint도 함께 갱신되도록 합니다.
+            fingerprint, last_modified = self._read_validators()
+
+            staging = DataLoader(self.data_dir)
+            if filename:
+                staging._cache = {name: data for name, data in self._cache.items() if name != filename}
+                staging.load_json(filename)
+            staging.preload()
+            indexes = Catalog().warm(staging)
+
+            catalog.stage(indexes)
+            self._cache = staging._cache
+            # 데이터 교체 후 버전을 올려, 새 버전 키로 이전 데이터가 캐시되지 않도록 합니다.
+            self.version += 1
+            self._validators = (self.version, fingerprint, last_modified)
+            catalog.install(indexes)
+
+        logger.info(f"카탈로그 데이터 리로드 완료: 버전 {self.version}")
+        return self.version
 
 
 # 전역 데이터 로더 인스턴스
@@ -6,6 +6,7 @@ import os
 from typing import List, Union
 import logging
 from functools import lru_cache
+from app.utils.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -19,23 +20,27 @@ class EmbeddingGenerator:
     def __init__(self):
         """초기화 - OpenAI 클라이언트는 lazy initialization"""
         self._client = None
+        self._client_pid = None
         self._cache = {}  # 수동 캐시 (LRU 스타일)
         self._cache_max_size = 128
 
     def _get_client(self) -> OpenAI:
         """OpenAI 클라이언트 lazy initialization
 
+        fork된 프로세스(gunicorn 워커)에서는 부모의 HTTP 연결 풀을 공유하지 않도록 새로 생성합니다.
+
         Returns:
             OpenAI 클라이언트 인스턴스
 
         Raises:
             ValueError: OPENAI_API_KEY가 설정되지 않은 경우
         """
-        if self._client is None:
+        if self._client is None or self._client_pid != os.getpid():
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
             self._client = OpenAI(api_key=api_key)
+            self._client_pid = os.getpid()
         return self._client
 
     def generate(self, text: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
@@ -110,12 +115,13 @@ class EmbeddingGenerator:
             logger.debug(f"캐시 히트: {text[:50]}...")
             return self._cache[text]
 
-        # 캐시 미스 - API 호출
+        # 캐시 미스 - API 호출 (같은 텍스트의 동시 요청은 호출 하나의 결과를 함께 사용)
         logger.debug(f"캐시 미스: {text[:50]}...")
-        embedding = self.generate(text)
+        embedding = single_flight.do(f"embedding:{self.MODEL}:{text}", lambda: self.generate(text))
 
         # 캐시 크기 제한 (LRU 방식: 가장 오래된 항목 삭제)
-        if len(self._cache) >= self._cache_max_size:
+        # (병합된 호출은 같은 텍스트를 다시 저장하므로 이미 있는 텍스트면 삭제하지 않음)
+        if text not in self._cache and len(self._cache) >= self._cache_max_size:
             # 첫 번째 키 삭제 (FIFO - 간단한 구현)
             first_key = next(iter(self._cache))
             del self._cache[first_key]
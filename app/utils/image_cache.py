@@ -0,0 +1,194 @@
+"""
+이미지 캐시 유틸리티 모듈
+이미지 디렉토리의 파일 목록(manifest)과 자주 요청되는 이미지 바이트를 메모리에 보관합니다.
+없는 이미지 요청은 파일 목록으로 바로 응답하고, 캐싱된 이미지는 파일을 다시 열지 않고 응답합니다.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from app.utils.image_variants import data_hash, file_hash
+
+# 기본 최대 캐시 크기 (바이트)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 캐시할 수 있는 이미지 하나의 최대 크기 비율 (큰 이미지 하나가 캐시를 모두 비우지 않도록 제한)
+MAX_ITEM_RATIO = 16
+
+# 파일 목록(manifest)을 만드는 이미지 디렉토리 (static 디렉토리 기준)
+IMAGE_DIRS = ("drinks", "recipes")
+
+
+def scan_directory(directory: str) -> Tuple[FrozenSet[str], str]:
+    """
+    디렉토리의 파일 목록과 그 fingerprint를 만듭니다.
+
+    fingerprint는 파일명, 수정 시각, 크기의 해시이므로 이미지를 추가/삭제/교체하면 바뀝니다.
+
+    Args:
+        directory: 이미지 디렉토리
+
+    Returns:
+        (파일명 집합, fingerprint) 튜플 (디렉토리가 없으면 빈 집합)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            files = sorted((entry.name, entry.stat()) for entry in entries if entry.is_file())
+    except OSError:
+        files = []
+
+    digest = hashlib.sha256()
+    for name, stat in files:
+        digest.update(f"{name}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    return frozenset(name for name, _ in files), digest.hexdigest()
+
+
+def combine_fingerprints(fingerprints: Iterable[str]) -> str:
+    """디렉토리별 fingerprint를 하나의 값으로 합칩니다."""
+    return hashlib.sha256("\n".join(fingerprints).encode("ascii")).hexdigest()[:16]
+
+
+class CachedImage:
+    """캐싱된 이미지 바이트와 검증 정보"""
+
+    __slots__ = ("data", "etag", "last_modified")
+
+    def __init__(self, data: bytes, etag: str, last_modified: datetime):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ImageCache:
+    """
+    이미지 파일 목록과 이미지 바이트를 보관하는 LRU 캐시 클래스
+
+    - 파일 목록은 디렉토리별로 앱 시작 시(또는 처음 요청될 때) 한 번 만들고, 없는 파일은 디스크를 확인하지 않습니다.
+    - 이미지 바이트는 전체 크기가 max_bytes를 넘지 않도록 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 이미지 파일은 배포 시에만 바뀐다고 가정하므로 캐싱된 항목은 다시 확인하지 않습니다 (변경 시 clear 호출).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._manifests: Dict[str, FrozenSet[str]] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._hashes: Dict[str, str] = {}
+        self._entries: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load_manifest(self, directory: str) -> FrozenSet[str]:
+        """
+        디렉토리의 파일 목록을 만들어 보관합니다.
+
+        이전에 만든 목록과 fingerprint가 다르면(이미지 변경) 캐싱된 내용 해시와 이미지 바이트를 버립니다.
+
+        Args:
+            directory: 이미지 디렉토리
+
+        Returns:
+            파일명 집합 (디렉토리가 없으면 빈 집합)
+        """
+        manifest, fingerprint = scan_directory(directory)
+
+        with self._lock:
+            previous = self._fingerprints.get(directory)
+            if previous is not None and previous != fingerprint:
+                self._hashes.clear()
+                self._entries.clear()
+                self._size = 0
+            self._manifests[directory] = manifest
+            self._fingerprints[directory] = fingerprint
+        return manifest
+
+    def fingerprint(self) -> str:
+        """
+        만들어 둔 파일 목록 전체의 fingerprint를 반환합니다.
+
+        이미지 URL(해시 URL)을 담은 응답의 ETag와 캐시 버전에 사용하므로, 이미지가 바뀌면 응답도 새로 만들어집니다.
+
+        Returns:
+            fingerprint 문자열
+        """
+        return combine_fingerprints(
+            f"{directory}={fingerprint}" for directory, fingerprint in sorted(self._fingerprints.items())
+        )
+
+    def exists(self, directory: str, filename: str) -> bool:
+        """파일 목록에 이미지가 있는지 확인합니다 (목록이 없으면 먼저 만듦)."""
+        manifest = self._manifests.get(directory)
+        if manifest is None:
+            manifest = self.load_manifest(directory)
+        return filename in manifest
+
+    def content_hash(self, path: str) -> str:
+        """파일 내용 해시를 반환합니다 (한 번 계산한 값은 재사용)."""
+        digest = self._hashes.get(path)
+        if digest is None:
+            digest = file_hash(path)
+            self._hashes[path] = digest
+        return digest
+
+    def get(self, path: str, etag: Optional[str] = None) -> CachedImage:
+        """
+        이미지 바이트를 반환합니다. 캐시에 없으면 파일을 읽어 캐싱합니다.
+
+        Args:
+            path: 이미지 파일 경로
+            etag: ETag (없으면 파일 내용 해시)
+
+        Returns:
+            CachedImage
+
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+        """
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None:
+                self._entries.move_to_end(path)
+                return cached
+
+        with open(path, "rb") as image_file:
+            data = image_file.read()
+            mtime = os.fstat(image_file.fileno()).st_mtime
+        if etag is None:
+            etag = data_hash(data)
+            self._hashes[path] = etag
+        cached = CachedImage(data, etag, datetime.fromtimestamp(int(mtime), tz=timezone.utc))
+
+        if len(data) <= self.max_bytes // MAX_ITEM_RATIO:
+            with self._lock:
+                previous = self._entries.pop(path, None)
+                if previous is not None:
+                    self._size -= len(previous.data)
+                self._entries[path] = cached
+                self._size += len(data)
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted.data)
+        return cached
+
+    def clear(self):
+        """파일 목록과 캐싱된 이미지를 모두 삭제합니다."""
+        with self._lock:
+            self._manifests.clear()
+            self._fingerprints.clear()
+            self._hashes.clear()
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """캐싱된 이미지 바이트의 전체 크기"""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 전역 이미지 캐시 인스턴스
+image_cache = ImageCache()
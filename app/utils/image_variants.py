@@ -0,0 +1,163 @@
+"""
+이미지 변형(variant) 유틸리티 모듈
+원본 PNG 이미지를 정해진 너비(64/128/256/512px)의 WebP/PNG로 변환해 디스크에 저장합니다.
+변형 파일명은 원본 내용 해시로 정해지므로(content-addressed) 원본이 바뀌면 새 파일이 만들어지고,
+같은 원본은 서버나 배포가 달라도 같은 파일명을 가집니다.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 변형을 만들지 않고 원본을 사용
+    Image = None
+
+# 제공하는 변형 너비 (요청한 너비 이상인 가장 작은 값으로 맞춤)
+VARIANT_WIDTHS = (64, 128, 256, 512)
+
+# 포맷별 (MIME 타입, 확장자, Pillow 저장 옵션)
+VARIANT_FORMATS = {
+    "webp": ("image/webp", "webp", {"format": "WEBP", "quality": 80, "method": 6}),
+    "png": ("image/png", "png", {"format": "PNG", "optimize": True}),
+}
+
+# 변형 생성 방식이 바뀌면 올려서 이전 변형 파일을 사용하지 않도록 함
+VARIANT_VERSION = 1
+
+
+def parse_width(value: Any) -> int:
+    """
+    요청한 너비를 제공하는 변형 너비로 맞춥니다.
+
+    Args:
+        value: 요청한 너비 (쿼리 파라미터 w)
+
+    Returns:
+        요청한 너비 이상인 가장 작은 변형 너비 (최대 너비를 넘으면 최대 너비)
+
+    Raises:
+        ValueError: 양의 정수가 아닌 경우
+    """
+    if not str(value).strip().isdigit() or int(value) <= 0:
+        raise ValueError(f"w는 1 이상의 정수여야 합니다 (지원 너비: {', '.join(map(str, VARIANT_WIDTHS))}).")
+
+    width = int(value)
+    for candidate in VARIANT_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return VARIANT_WIDTHS[-1]
+
+
+def negotiate_format(accept_mimetypes: Any) -> str:
+    """
+    Accept 헤더로 변형 포맷을 고릅니다.
+
+    */*만 보내는 클라이언트는 WebP 지원 여부를 알 수 없으므로, image/webp를 명시한 경우에만 WebP를 선택합니다.
+
+    Args:
+        accept_mimetypes: request.accept_mimetypes
+
+    Returns:
+        "webp" 또는 "png"
+    """
+    if Image is not None and any(mimetype == "image/webp" and quality > 0 for mimetype, quality in accept_mimetypes):
+        return "webp"
+    return "png"
+
+
+def variant_name(source_hash: str, width: int, fmt: str) -> str:
+    """
+    변형 파일의 상대 경로를 반환합니다.
+
+    Args:
+        source_hash: 원본 파일 내용 해시
+        width: 변형 너비
+        fmt: 변형 포맷
+
+    Returns:
+        "<해시 앞 2자리>/<해시>-w<너비>-v<버전>.<확장자>" 형식의 상대 경로
+    """
+    extension = VARIANT_FORMATS[fmt][1]
+    return os.path.join(source_hash[:2], f"{source_hash}-w{width}-v{VARIANT_VERSION}.{extension}")
+
+
+def render_variant(source_path: str, width: int, fmt: str, output_path: str):
+    """
+    원본 이미지를 지정한 너비로 줄여 저장합니다. 원본보다 크게 늘리지는 않습니다.
+
+    다른 프로세스가 불완전한 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+
+    Args:
+        source_path: 원본 이미지 경로
+        width: 변형 너비
+        fmt: 변형 포맷 ("webp" 또는 "png")
+        output_path: 저장할 경로
+    """
+    save_options = VARIANT_FORMATS[fmt][2]
+    with Image.open(source_path) as image:
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as output:
+                image.save(output, **save_options)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def get_variant(
+    source_path: str, width: int, fmt: str, variant_dir: str, source_hash: Optional[str] = None
+) -> Tuple[str, str, str]:
+    """
+    변형 파일을 반환합니다. 디스크에 없으면 만들어 저장합니다 (lazy 생성).
+
+    Pillow가 설치되어 있지 않으면 원본 파일을 그대로 반환합니다.
+
+    Args:
+        source_path: 원본 이미지 경로
+        width: 변형 너비 (parse_width 결과)
+        fmt: 변형 포맷 (negotiate_format 결과)
+        variant_dir: 변형 저장 디렉토리
+        source_hash: 원본 파일 내용 해시 (없으면 계산)
+
+    Returns:
+        (파일 경로, MIME 타입, ETag) 튜플
+    """
+    if source_hash is None:
+        source_hash = file_hash(source_path)
+
+    if Image is None:
+        return source_path, "image/png", source_hash
+
+    name = variant_name(source_hash, width, fmt)
+    path = os.path.join(variant_dir, name)
+    if not os.path.exists(path):
+        render_variant(source_path, width, fmt, path)
+
+    # 파일명이 원본 해시/너비/포맷으로 정해지므로 그대로 ETag로 사용합니다.
+    return path, VARIANT_FORMATS[fmt][0], os.path.basename(name)
+
+
+def file_hash(path: str) -> str:
+    """파일 내용의 SHA-256 해시(앞 32자리)를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def data_hash(data: bytes) -> str:
+    """바이트 내용의 SHA-256 해시(앞 32자리)를 반환합니다 (같은 내용의 file_hash와 같은 값)."""
+    return hashlib.sha256(data).hexdigest()[:32]
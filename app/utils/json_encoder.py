@@ -0,0 +1,105 @@
+"""
+JSON 인코더 유틸리티 모듈
+응답 직렬화에 사용할 JSON 인코더를 제공합니다. orjson이 설치되어 있으면 orjson을, 없으면 표준 json 모듈을 사용합니다.
+"""
+
+import json
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈만 사용
+    orjson = None
+
+
+class StdlibJSONEncoder:
+    """표준 json 모듈을 사용하는 인코더"""
+
+    name = "stdlib"
+
+    def dumps(self, data: Any, compact: bool = False, ensure_ascii: bool = False) -> bytes:
+        """
+        데이터를 UTF-8 JSON 바이트로 직렬화합니다.
+
+        Args:
+            data: 직렬화할 데이터
+            compact: True이면 공백 없이, False이면 4칸 들여쓰기로 출력
+            ensure_ascii: 비ASCII 문자를 \\uXXXX로 이스케이프할지 여부
+
+        Returns:
+            JSON 바이트
+        """
+        if compact:
+            text = json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii)
+        else:
+            text = json.dumps(data, indent=4, ensure_ascii=ensure_ascii)
+        return text.encode("utf-8")
+
+
+class OrjsonEncoder:
+    """
+    orjson을 사용하는 인코더
+
+    orjson은 항상 비ASCII 문자를 그대로 UTF-8로 출력하고 들여쓰기는 2칸만 지원합니다.
+    ensure_ascii=True 요청이나 orjson이 처리하지 못하는 값(64비트를 넘는 정수, 문자열이 아닌 키 등)은
+    표준 json 모듈로 직렬화합니다.
+    들여쓰기 출력(개발 환경)은 기존과 같은 4칸 들여쓰기를 유지하도록 표준 json 모듈을 사용하고,
+    표준 모듈이 처리하지 못하는 값(NumPy 등)만 orjson의 2칸 들여쓰기로 출력합니다.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        self._fallback = StdlibJSONEncoder()
+
+    def dumps(self, data: Any, compact: bool = False, ensure_ascii: bool = False) -> bytes:
+        """
+        데이터를 UTF-8 JSON 바이트로 직렬화합니다.
+
+        Args:
+            data: 직렬화할 데이터
+            compact: True이면 공백 없이, False이면 4칸 들여쓰기로 출력 (표준 json 모듈)
+            ensure_ascii: 비ASCII 문자를 \\uXXXX로 이스케이프할지 여부
+
+        Returns:
+            JSON 바이트
+        """
+        if ensure_ascii:
+            return self._fallback.dumps(data, compact, ensure_ascii)
+
+        if not compact:
+            try:
+                return self._fallback.dumps(data, compact, ensure_ascii)
+            except TypeError:
+                return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            return self._fallback.dumps(data, compact, ensure_ascii)
+
+
+# 이름별 인코더 인스턴스
+_encoders: Dict[str, Any] = {"stdlib": StdlibJSONEncoder()}
+if orjson is not None:
+    _encoders["orjson"] = OrjsonEncoder()
+
+
+def get_json_encoder(name: str = "auto"):
+    """
+    설정 이름에 해당하는 JSON 인코더를 반환합니다.
+
+    Args:
+        name: "auto"(orjson이 있으면 orjson), "orjson", "stdlib"
+
+    Returns:
+        dumps(data, compact, ensure_ascii) 메서드를 가진 인코더
+
+    Raises:
+        ValueError: 알 수 없거나 설치되지 않은 인코더인 경우
+    """
+    if name == "auto":
+        return _encoders.get("orjson", _encoders["stdlib"])
+    if name not in _encoders:
+        raise ValueError(f"사용할 수 없는 JSON 인코더입니다: {name}")
+    return _encoders[name]
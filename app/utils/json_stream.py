@@ -0,0 +1,92 @@
+"""
+JSON 스트림 파싱 유틸리티 모듈
+LLM이 토큰 단위로 내보내는 JSON 응답에서 특정 키의 배열 원소를 원소가 닫히는 즉시 꺼냅니다.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+
+class JsonArrayStream:
+    """
+    JSON 텍스트 조각을 받아 지정한 키의 배열 원소(객체/배열)를 점진적으로 파싱하는 클래스
+
+    - 배열 시작("<key>": [)을 찾은 뒤에는 문자열/이스케이프 상태와 중첩 깊이를 추적하며 새로 들어온 문자만 검사합니다.
+    - 원소가 닫히면 그 구간만 json.loads로 파싱해 반환합니다 (파싱할 수 없는 원소는 건너뜀).
+    - 지금까지 받은 전체 텍스트는 text에 보관하므로 스트림이 끝나면 전체 응답을 파싱할 수 있습니다.
+    """
+
+    def __init__(self, key: str):
+        self._pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._chunks: List[str] = []
+        self._text = ""
+        self._pos: Optional[int] = None
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escape = False
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트"""
+        if self._chunks:
+            self._text += "".join(self._chunks)
+            self._chunks.clear()
+        return self._text
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        텍스트 조각을 추가하고 새로 닫힌 배열 원소를 반환합니다.
+
+        Args:
+            chunk: LLM 응답 텍스트 조각
+
+        Returns:
+            이번 조각으로 완성된 원소 리스트
+        """
+        self._chunks.append(chunk)
+        if self.closed:
+            return []
+
+        text = self.text
+        if self._pos is None:
+            match = self._pattern.search(text)
+            if match is None:
+                return []
+            self._pos = match.end()
+
+        items = []
+        index = self._pos
+        while index < len(text):
+            char = text[index]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._start = index
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # 배열 자체가 닫힘
+                    self.closed = True
+                    index += 1
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        items.append(json.loads(text[self._start:index + 1]))
+                    except ValueError:
+                        pass
+            index += 1
+
+        self._pos = index
+        return items
@@ -0,0 +1,67 @@
+"""
+NDJSON 스트리밍 유틸리티 모듈
+카탈로그 레코드를 한 줄에 하나씩 JSON으로 인코딩해 청크 단위로 내보냅니다.
+전체 응답을 메모리에 만들지 않으므로 요청당 메모리 사용량이 카탈로그 크기와 무관하게 일정합니다.
+"""
+
+import zlib
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+from app.utils.pagination import FieldColumns
+
+# NDJSON 응답 MIME 타입
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# 한 번에 인코딩해 내보낼 레코드 수
+NDJSON_BATCH_SIZE = 256
+
+# 스트리밍 gzip 압축 수준 (요청마다 압축하므로 속도 우선)
+NDJSON_GZIP_LEVEL = 1
+
+
+def iter_ndjson(
+    records: Sequence[Any],
+    encoder: Any,
+    fields: Optional[List[str]] = None,
+    columns: Optional[FieldColumns] = None,
+    batch_size: int = NDJSON_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """
+    레코드를 NDJSON 청크로 인코딩하는 제너레이터입니다.
+
+    Args:
+        records: 내보낼 레코드 목록
+        encoder: dumps(data, compact) 메서드를 가진 JSON 인코더
+        fields: 선택할 필드 목록 (None이면 전체 필드)
+        columns: 필드 컬럼 (fields가 있으면 필수)
+        batch_size: 한 청크에 담을 레코드 수
+
+    Yields:
+        레코드 batch_size개의 줄로 이루어진 바이트 청크
+    """
+    # 전체 카탈로그 목록이면 필드 컬럼의 연속 구간을 그대로 잘라 사용합니다.
+    contiguous = columns is not None and records is columns.records
+    for start in range(0, len(records), batch_size):
+        batch = records[start : start + batch_size]
+        if fields:
+            batch = columns.project(batch, fields, start if contiguous else None)
+        yield b"".join(encoder.dumps(record, compact=True) + b"\n" for record in batch)
+
+
+def iter_gzip(chunks: Iterable[bytes], level: int = NDJSON_GZIP_LEVEL) -> Iterator[bytes]:
+    """
+    바이트 청크를 gzip 스트림으로 압축하는 제너레이터입니다.
+
+    Args:
+        chunks: 압축할 바이트 청크
+        level: 압축 수준
+
+    Yields:
+        gzip 형식의 바이트 청크
+    """
+    # wbits=31: gzip 헤더/트레일러 포함
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,214 @@
+"""
+목록 페이지네이션 유틸리티 모듈
+limit/cursor 기반 페이지 분할과 fields 파라미터에 따른 필드 선택(projection)을 제공합니다.
+커서에는 발급 시점의 데이터 fingerprint가 들어 있어, 데이터가 바뀐 뒤의 커서는 항목을 건너뛰거나
+중복해서 반환하지 않도록 거부합니다.
+"""
+
+import base64
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.utils.data_loader import data_loader
+
+# 한 페이지에 반환할 수 있는 최대 항목 수
+MAX_PAGE_LIMIT = 500
+
+# 커서 문자열 접두사 (형식이 바뀌면 이전 커서를 거부하도록 버전 포함)
+_CURSOR_PREFIX = "o2:"
+
+# 커서에 넣는 데이터 fingerprint 길이
+_CURSOR_VERSION_LENGTH = 12
+
+
+def current_data_version() -> str:
+    """
+    커서에 넣을 현재 데이터 버전을 반환합니다.
+
+    DataLoader.version은 워커마다 따로 증가하므로, 워커나 재시작과 무관하게
+    같은 데이터면 같은 값인 원본 파일 fingerprint를 사용합니다.
+
+    Returns:
+        데이터 fingerprint 앞부분
+    """
+    return data_loader.get_validators()[0][:_CURSOR_VERSION_LENGTH]
+
+
+def encode_cursor(offset: int, version: Optional[str] = None) -> str:
+    """
+    다음 페이지 시작 위치를 불투명한 커서 문자열로 변환합니다.
+
+    Args:
+        offset: 다음 페이지의 시작 위치
+        version: 커서를 발급하는 데이터 버전 (생략하면 현재 데이터 버전)
+
+    Returns:
+        URL에 그대로 사용할 수 있는 커서 문자열
+    """
+    if version is None:
+        version = current_data_version()
+    payload = f"{_CURSOR_PREFIX}{version}:{offset}"
+    return base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, version: Optional[str] = None) -> int:
+    """
+    커서 문자열을 시작 위치로 변환합니다.
+
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열
+        version: 현재 데이터 버전 (생략하면 data_loader에서 조회)
+
+    Returns:
+        시작 위치
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않거나 다른 데이터 버전에서 발급된 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+    except (UnicodeError, ValueError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+    cursor_version, _, offset = decoded[len(_CURSOR_PREFIX):].rpartition(":")
+    if not decoded.startswith(_CURSOR_PREFIX) or not cursor_version or not offset.isdigit():
+        raise ValueError("잘못된 커서입니다.")
+    if version is None:
+        version = current_data_version()
+    if cursor_version != version:
+        raise ValueError("데이터가 변경되어 커서가 만료되었습니다. 처음부터 다시 요청해주세요.")
+    return int(offset)
+
+
+class PageRequest:
+    """목록 요청의 페이지네이션/필드 선택 파라미터"""
+
+    __slots__ = ("limit", "offset", "fields")
+
+    def __init__(self, limit: Optional[int] = None, offset: int = 0, fields: Optional[List[str]] = None):
+        self.limit = limit
+        self.offset = offset
+        self.fields = fields
+
+    @property
+    def is_paginated(self) -> bool:
+        """limit 또는 cursor가 지정되었는지 여부"""
+        return self.limit is not None or self.offset > 0
+
+
+def parse_page_request(args: Mapping[str, str]) -> Tuple[PageRequest, List[str]]:
+    """
+    쿼리 파라미터(limit, cursor, fields)를 PageRequest로 변환합니다.
+
+    Args:
+        args: 요청 쿼리 파라미터
+
+    Returns:
+        (PageRequest, 에러 메시지 리스트) 튜플
+    """
+    errors = []
+    page = PageRequest()
+
+    limit = args.get("limit")
+    if limit is not None and limit.strip() != "":
+        if not limit.strip().isdigit() or not 1 <= int(limit) <= MAX_PAGE_LIMIT:
+            errors.append(f"limit은(는) 1 이상 {MAX_PAGE_LIMIT} 이하의 정수여야 합니다.")
+        else:
+            page.limit = int(limit)
+
+    cursor = args.get("cursor")
+    if cursor:
+        try:
+            page.offset = decode_cursor(cursor)
+        except ValueError as e:
+            errors.append(str(e))
+
+    page.fields = parse_fields(args)
+    return page, errors
+
+
+def parse_fields(args: Mapping[str, str]) -> Optional[List[str]]:
+    """
+    쿼리 파라미터 fields(쉼표로 구분)를 필드 목록으로 변환합니다.
+
+    Args:
+        args: 요청 쿼리 파라미터
+
+    Returns:
+        중복을 제거하고 요청 순서를 유지한 필드 목록 (지정하지 않으면 None)
+    """
+    fields = [field.strip() for field in args.get("fields", "").split(",") if field.strip()]
+    return list(dict.fromkeys(fields)) or None
+
+
+def paginate(records: Sequence[Any], page: PageRequest) -> Tuple[Sequence[Any], Optional[str]]:
+    """
+    레코드 목록에서 요청한 페이지를 잘라냅니다.
+
+    Args:
+        records: 전체 레코드 목록
+        page: 페이지 요청
+
+    Returns:
+        (페이지 레코드 목록, 다음 페이지 커서 또는 None) 튜플
+    """
+    if page.limit is None:
+        return records[page.offset:], None
+
+    end = page.offset + page.limit
+    next_cursor = encode_cursor(end) if end < len(records) else None
+    return records[page.offset:end], next_cursor
+
+
+class FieldColumns:
+    """
+    레코드 리스트의 필드별 값 리스트(컬럼)를 보관하는 클래스
+
+    필드 선택 응답을 만들 때 레코드 딕셔너리를 매번 순회하지 않고 필드 컬럼의 슬라이스를 조합합니다.
+    컬럼은 필드별로 처음 요청될 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.fields = list(dict.fromkeys(key for record in records for key in record))
+        self._row_of = {id(record): row for row, record in enumerate(records)}
+        self._columns: Dict[str, List[Any]] = {}
+
+    def column(self, field: str) -> List[Any]:
+        """필드의 값 리스트를 반환합니다 (없는 값은 None)."""
+        values = self._columns.get(field)
+        if values is None:
+            values = [record.get(field) for record in self.records]
+            self._columns[field] = values
+        return values
+
+    def unknown_fields(self, fields: Sequence[str]) -> List[str]:
+        """카탈로그에 없는 필드 목록을 반환합니다."""
+        known = set(self.fields)
+        return [field for field in fields if field not in known]
+
+    def project(self, records: Sequence[Dict], fields: Sequence[str], offset: Optional[int] = None) -> List[Dict]:
+        """
+        레코드 목록에서 선택한 필드만 남긴 딕셔너리 목록을 만듭니다.
+
+        Args:
+            records: 필드를 선택할 레코드 목록 (카탈로그 레코드의 부분 목록)
+            fields: 선택할 필드 목록
+            offset: records가 카탈로그의 연속 구간이면 그 시작 위치 (컬럼 슬라이스를 그대로 사용)
+
+        Returns:
+            선택한 필드만 가진 딕셔너리 리스트
+        """
+        columns = [self.column(field) for field in fields]
+        if offset is not None:
+            end = offset + len(records)
+            return [dict(zip(fields, values)) for values in zip(*(column[offset:end] for column in columns))]
+
+        projected = []
+        for record in records:
+            row = self._row_of.get(id(record))
+            if row is None:
+                projected.append({field: record.get(field) for field in fields})
+            else:
+                projected.append({field: column[row] for field, column in zip(fields, columns)})
+        return projected
@@ -0,0 +1,108 @@
+"""
+페르소나 캐시 유틸리티 모듈
+사용자 정보와 테이스팅 이력의 내용 해시로 생성한 페르소나 요약을 보관합니다.
+테이스팅 이력의 각 길이(prefix)마다 연쇄 해시 키를 만들므로, 이력에 새 테이스팅이 추가되기만 한 경우
+가장 최근에 보관한 요약과 그 이후에 추가된 테이스팅을 찾을 수 있습니다.
+요약마다 마지막 전체 생성 이후 갱신으로만 반영한 테이스팅 수를 함께 보관해, 갱신이 계속 이어지며
+요약이 원래 이력에서 멀어지지 않도록 일정 수를 넘으면 전체 이력으로 다시 생성하게 합니다.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 기본 최대 캐시 항목 수
+DEFAULT_MAX_ENTRIES = 4096
+
+# 전체 생성 없이 갱신으로만 반영할 수 있는 최대 테이스팅 수 (넘으면 전체 이력으로 다시 생성)
+DEFAULT_MAX_INCREMENTAL = 10
+
+
+def _entry_bytes(value: Any) -> bytes:
+    """해시에 사용할 값의 정규화된 JSON 바이트를 반환합니다 (키 순서와 무관)."""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def chain_keys(user_data: List[Dict[str, Any]], tasting_data: List[Dict[str, Any]]) -> List[str]:
+    """
+    테이스팅 이력의 각 길이에 대한 캐시 키를 만듭니다.
+
+    keys[0]은 사용자 정보만, keys[i]는 사용자 정보와 처음 i개의 테이스팅의 해시이며
+    keys[i]는 keys[i-1]과 i번째 테이스팅으로 계산하므로 전체 키를 한 번의 순회로 만듭니다.
+
+    Args:
+        user_data: 사용자 기본 정보
+        tasting_data: 사용자의 테이스팅 데이터
+
+    Returns:
+        길이 len(tasting_data) + 1의 키 리스트
+    """
+    key = hashlib.sha256(b"persona:" + _entry_bytes(user_data)).hexdigest()
+    keys = [key]
+    for item in tasting_data:
+        key = hashlib.sha256(key.encode("ascii") + _entry_bytes(item)).hexdigest()
+        keys.append(key)
+    return keys
+
+
+class PersonaCache:
+    """
+    연쇄 해시 키별로 페르소나 요약을 보관하는 LRU 캐시 클래스
+
+    각 요약은 마지막 전체 생성 이후 갱신으로만 반영한 테이스팅 수(incremental)와 함께 보관하며,
+    max_incremental은 갱신을 이어갈 수 있는 한도입니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_incremental: int = DEFAULT_MAX_INCREMENTAL):
+        self.max_entries = max_entries
+        self.max_incremental = max_incremental
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find_latest(self, keys: List[str]) -> Optional[Tuple[int, str, int]]:
+        """
+        가장 긴 이력에 대해 보관된 요약을 찾습니다.
+
+        Args:
+            keys: chain_keys로 만든 키 리스트
+
+        Returns:
+            (요약에 반영된 테이스팅 수, 요약, 갱신으로만 반영한 테이스팅 수) 튜플
+            또는 None (보관된 요약이 없는 경우)
+        """
+        with self._lock:
+            for index in range(len(keys) - 1, -1, -1):
+                entry = self._entries.get(keys[index])
+                if entry is not None:
+                    self._entries.move_to_end(keys[index])
+                    return (index,) + entry
+        return None
+
+    def put(self, key: str, summary: str, incremental: int = 0):
+        """
+        요약을 저장합니다. 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 제거합니다.
+
+        Args:
+            key: 요약에 반영된 이력의 키 (chain_keys의 마지막 값)
+            summary: 페르소나 요약
+            incremental: 마지막 전체 생성 이후 갱신으로만 반영한 테이스팅 수 (전체 생성이면 0)
+        """
+        with self._lock:
+            self._entries[key] = (summary, incremental)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """모든 요약을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 전역 페르소나 캐시 인스턴스
+persona_cache = PersonaCache()
@@ -0,0 +1,167 @@
+"""
+음료 컬럼형 테이블 유틸리티 모듈
+문자열로 저장된 음료 속성을 NumPy 컬럼(도수, 용량, 범주 코드)으로 변환해 필터와 패싯 집계를 벡터 연산으로 처리합니다.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+# 용량 문자열 패턴 (예: "700ml", "1.8L")
+_VOLUME_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ml|l)\s*$", re.IGNORECASE)
+
+# 단위별 ml 환산 배율
+_VOLUME_UNITS = {"ml": 1.0, "l": 1000.0}
+
+
+def parse_volume(value: Any) -> float:
+    """
+    용량 문자열을 ml 단위 숫자로 변환합니다.
+
+    Args:
+        value: 용량 문자열 (예: "700ml", "1.8L")
+
+    Returns:
+        ml 단위 용량 (해석할 수 없으면 NaN)
+    """
+    if not isinstance(value, str):
+        return float("nan")
+
+    match = _VOLUME_PATTERN.match(value)
+    if not match:
+        return float("nan")
+
+    return float(match.group(1)) * _VOLUME_UNITS[match.group(2).lower()]
+
+
+def parse_alcohol(value: Any) -> float:
+    """
+    도수 문자열을 숫자로 변환합니다.
+
+    Args:
+        value: 도수 문자열 (예: "40.0")
+
+    Returns:
+        도수 (해석할 수 없으면 NaN)
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _encode_categories(values: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """문자열 리스트를 (범주 코드 배열, 등장 순서대로의 범주 라벨 리스트)로 변환합니다."""
+    code_of: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for row, value in enumerate(values):
+        if value not in code_of:
+            code_of[value] = len(code_of)
+        codes[row] = code_of[value]
+    return codes, list(code_of)
+
+
+class ProductTable:
+    """음료 속성을 컬럼 배열로 보관하는 클래스"""
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.alcohol = np.array([parse_alcohol(record.get("alcohol")) for record in records], dtype=np.float32)
+        self.volume_ml = np.array([parse_volume(record.get("volume")) for record in records], dtype=np.float32)
+        self.type_codes, self.type_labels = _encode_categories([str(record.get("type") or "") for record in records])
+        self.base_codes, self.base_labels = _encode_categories(
+            [str(record.get("baseCode") or "") for record in records]
+        )
+
+    def search_type(self, keyword: str) -> List[Dict]:
+        """
+        타입명에 키워드가 포함된 음료를 찾습니다 (대소문자 무시).
+
+        범주 라벨에서 먼저 일치하는 타입을 찾고, 행은 범주 코드 비교로 선택합니다.
+
+        Args:
+            keyword: 타입 검색어
+
+        Returns:
+            카탈로그 순서를 유지한 음료 리스트
+        """
+        keyword = keyword.lower()
+        matched = [code for code, label in enumerate(self.type_labels) if keyword in label.lower()]
+        rows = np.flatnonzero(np.isin(self.type_codes, matched))
+        return [self.records[row] for row in rows]
+
+    def _category_mask(self, codes: np.ndarray, labels: List[str], values: Optional[Iterable[str]]) -> np.ndarray:
+        """선택한 범주 값 중 하나에 해당하는 행의 마스크를 반환합니다 (values가 없으면 전체)."""
+        if not values:
+            return np.ones(len(self.records), dtype=bool)
+        values = set(values)
+        selected = [code for code, label in enumerate(labels) if label in values]
+        return np.isin(codes, selected)
+
+    @staticmethod
+    def _range_mask(column: np.ndarray, minimum: Optional[float], maximum: Optional[float]) -> np.ndarray:
+        """값이 [minimum, maximum] 범위에 있는 행의 마스크를 반환합니다 (범위 지정 시 NaN은 제외)."""
+        # 경계값을 컬럼과 같은 float32로 맞춰 "40.8" 같은 값이 경계에서 누락되지 않도록 합니다.
+        mask = np.ones(len(column), dtype=bool)
+        if minimum is not None:
+            mask &= column >= column.dtype.type(minimum)
+        if maximum is not None:
+            mask &= column <= column.dtype.type(maximum)
+        return mask
+
+    @staticmethod
+    def _count_facet(codes: np.ndarray, labels: List[str], mask: np.ndarray) -> List[Dict[str, Any]]:
+        """마스크에 해당하는 행의 범주별 개수를 [{"value", "count"}] 형태로 반환합니다 (개수 내림차순)."""
+        counts = np.bincount(codes[mask], minlength=len(labels))
+        order = np.argsort(-counts, kind="stable")
+        return [{"value": labels[code], "count": int(counts[code])} for code in order if counts[code] > 0]
+
+    @staticmethod
+    def _column_range(column: np.ndarray, mask: np.ndarray) -> Dict[str, Optional[float]]:
+        """마스크에 해당하는 행의 최솟값/최댓값을 반환합니다 (NaN 제외)."""
+        values = column[mask]
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return {"min": None, "max": None}
+        return {"min": round(float(values.min()), 2), "max": round(float(values.max()), 2)}
+
+    def filter(
+        self,
+        types: Optional[Iterable[str]] = None,
+        bases: Optional[Iterable[str]] = None,
+        abv_min: Optional[float] = None,
+        abv_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+    ) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        타입, 베이스, 도수 범위, 용량 범위로 음료를 필터링하고 패싯 개수를 집계합니다.
+
+        타입/베이스 패싯은 자기 자신을 제외한 나머지 조건만 적용해 집계하므로,
+        다른 값을 선택했을 때의 결과 수를 함께 보여줄 수 있습니다.
+
+        Args:
+            types: 선택한 타입 목록 (정확히 일치, 하나라도 해당하면 포함)
+            bases: 선택한 베이스 코드 목록
+            abv_min: 최소 도수
+            abv_max: 최대 도수
+            volume_min: 최소 용량 (ml)
+            volume_max: 최대 용량 (ml)
+
+        Returns:
+            (카탈로그 순서를 유지한 음료 리스트, 패싯 딕셔너리) 튜플
+        """
+        type_mask = self._category_mask(self.type_codes, self.type_labels, types)
+        base_mask = self._category_mask(self.base_codes, self.base_labels, bases)
+        range_mask = self._range_mask(self.alcohol, abv_min, abv_max) & self._range_mask(
+            self.volume_ml, volume_min, volume_max
+        )
+        mask = type_mask & base_mask & range_mask
+
+        facets = {
+            "type": self._count_facet(self.type_codes, self.type_labels, base_mask & range_mask),
+            "baseCode": self._count_facet(self.base_codes, self.base_labels, type_mask & range_mask),
+            "alcohol": self._column_range(self.alcohol, mask),
+            "volume_ml": self._column_range(self.volume_ml, mask),
+        }
+        return [self.records[row] for row in np.flatnonzero(mask)], facets
@@ -0,0 +1,198 @@
+"""
+레시피 재료 비트셋 유틸리티 모듈
+레시피별 재료 구성을 비트마스크로 미리 계산해 재료 포함 관계를 벡터 연산으로 판단합니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+# 비트마스크 한 워드의 비트 수
+WORD_BITS = 64
+
+# 바이트 값별 set bit 개수 (popcount 조회 테이블)
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(masks: np.ndarray) -> np.ndarray:
+    """
+    비트마스크 행렬의 행별 set bit 개수를 계산합니다.
+
+    Args:
+        masks: (행 수, 워드 수) 크기의 uint64 배열
+
+    Returns:
+        (행 수,) 크기의 정수 배열
+    """
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return _BYTE_POPCOUNT[masks.view(np.uint8)].reshape(masks.shape[0], -1).sum(axis=1, dtype=np.int64)
+
+
+class RecipeBitset:
+    """레시피 재료 구성을 uint64 비트마스크 행렬로 보관하는 클래스"""
+
+    def __init__(self, recipes: List[Dict]):
+        self.records = recipes
+        self.bit_of: Dict[Optional[str], int] = {}
+        self.code_of: List[Optional[str]] = []
+        self.name_of: List[str] = []
+
+        # 레시피에 등장하는 재료 코드에 등장 순서대로 비트를 할당합니다.
+        recipe_bits: List[List[int]] = []
+        for recipe in recipes:
+            bits = []
+            for ingredient in recipe.get("ingredients", []):
+                # 코드가 없는 재료는 None 키로 두어 어떤 보유 재료와도 일치하지 않게 합니다.
+                code = ingredient.get("code")
+                code = None if code is None else str(code)
+                if code not in self.bit_of:
+                    self.bit_of[code] = len(self.code_of)
+                    self.code_of.append(code)
+                    self.name_of.append(ingredient.get("name", ""))
+                bits.append(self.bit_of[code])
+            recipe_bits.append(bits)
+
+        self.num_words = max(1, -(-len(self.bit_of) // WORD_BITS))
+        self.masks = np.zeros((len(recipes), self.num_words), dtype=np.uint64)
+        for row, bits in enumerate(recipe_bits):
+            for bit in bits:
+                self.masks[row, bit // WORD_BITS] |= np.uint64(1 << (bit % WORD_BITS))
+
+        # 코드가 없는 재료는 구매 후보에서 제외합니다.
+        self.purchasable = np.array([code is not None for code in self.code_of], dtype=bool)
+
+    def build_mask(self, codes: Iterable[Any]) -> np.ndarray:
+        """
+        재료 코드 목록을 비트마스크로 변환합니다.
+
+        어떤 레시피에도 쓰이지 않는 코드는 결과에 영향을 주지 않으므로 무시합니다.
+
+        Args:
+            codes: 재료 코드 목록
+
+        Returns:
+            (num_words,) 크기의 uint64 배열
+        """
+        mask = np.zeros(self.num_words, dtype=np.uint64)
+        for code in codes:
+            bit = self.bit_of.get(str(code))
+            if bit is not None:
+                mask[bit // WORD_BITS] |= np.uint64(1 << (bit % WORD_BITS))
+        return mask
+
+    def find_makeable(self, codes: Iterable[Any]) -> List[Dict]:
+        """
+        주어진 재료만으로 만들 수 있는 레시피를 찾습니다.
+
+        Args:
+            codes: 보유한 재료 코드 목록
+
+        Returns:
+            카탈로그 순서를 유지한 레시피 리스트
+        """
+        inventory = self.build_mask(codes)
+        makeable = ~(self.masks & ~inventory).any(axis=1)
+        return [self.records[row] for row in np.flatnonzero(makeable)]
+
+    def find_near_misses(self, codes: Iterable[Any], max_missing: int) -> List[Tuple[Dict, List[Optional[str]]]]:
+        """
+        부족한 재료가 max_missing개 이하인 레시피를 찾습니다.
+
+        Args:
+            codes: 보유한 재료 코드 목록
+            max_missing: 허용할 부족 재료 최대 개수
+
+        Returns:
+            (레시피, 부족한 재료 코드 리스트) 튜플 리스트.
+            부족한 재료 수가 적은 순으로 정렬하며, 같으면 카탈로그 순서를 유지합니다.
+        """
+        inventory = self.build_mask(codes)
+        missing = self.masks & ~inventory
+        missing_counts = popcount_rows(missing)
+
+        rows = np.flatnonzero(missing_counts <= max_missing)
+        rows = rows[np.argsort(missing_counts[rows], kind="stable")]
+
+        return [(self.records[row], self._decode(missing[row])) for row in rows]
+
+    def _decode(self, mask: np.ndarray) -> List[Optional[str]]:
+        """비트마스크를 재료 코드 리스트로 변환합니다."""
+        codes = []
+        for word_index, word in enumerate(mask.tolist()):
+            while word:
+                lowest = word & -word
+                codes.append(self.code_of[word_index * WORD_BITS + lowest.bit_length() - 1])
+                word ^= lowest
+        return codes
+
+    def _unpack(self, masks: np.ndarray) -> np.ndarray:
+        """비트마스크 행렬을 (행 수, 재료 수) 크기의 bool 행렬로 펼칩니다."""
+        as_bytes = np.ascontiguousarray(masks, dtype="<u8").view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=1, bitorder="little")
+        return bits[:, : len(self.code_of)].astype(bool)
+
+    def rank_next_ingredients(self, codes: Iterable[Any]) -> List[Tuple[int, List[Dict]]]:
+        """
+        재료 하나를 추가했을 때 새로 만들 수 있는 레시피 수로 후보 재료를 순위화합니다.
+
+        Args:
+            codes: 보유한 재료 코드 목록
+
+        Returns:
+            (재료 비트, 새로 만들 수 있는 레시피 리스트) 튜플 리스트 (레시피 수 내림차순)
+        """
+        missing_bits = self._unpack(self.masks & ~self.build_mask(codes))
+        one_away = missing_bits.sum(axis=1) == 1
+
+        gains = missing_bits[one_away].sum(axis=0)
+        gains[~self.purchasable] = 0
+
+        ranking = []
+        for bit in np.argsort(-gains, kind="stable"):
+            if gains[bit] == 0:
+                break
+            rows = np.flatnonzero(one_away & missing_bits[:, bit])
+            ranking.append((int(bit), [self.records[row] for row in rows]))
+        return ranking
+
+    def plan_purchase(self, codes: Iterable[Any], count: int) -> List[Tuple[int, List[Dict]]]:
+        """
+        count개의 재료를 탐욕적으로 골라 새로 만들 수 있는 레시피 수를 최대화합니다.
+
+        매 단계에서 바로 만들 수 있게 되는 레시피 수가 가장 큰 재료를 고르고,
+        같으면 남은 구매 횟수 안에 완성할 수 있는 레시피에 대한 기여도(1/부족 재료 수의 합)가 큰 재료를 고릅니다.
+
+        Args:
+            codes: 보유한 재료 코드 목록
+            count: 구매할 재료 개수
+
+        Returns:
+            (재료 비트, 이 단계에서 새로 만들 수 있게 된 레시피 리스트) 튜플 리스트 (구매 순서)
+        """
+        missing_bits = self._unpack(self.masks & ~self.build_mask(codes))
+        tie_breaker = -np.arange(len(self.code_of))
+        steps = []
+
+        for step in range(count):
+            remaining = count - step
+            missing_counts = missing_bits.sum(axis=1)
+            one_away = missing_counts == 1
+            near = (missing_counts > 0) & (missing_counts <= remaining)
+
+            gains = missing_bits[one_away].sum(axis=0)
+            progress = (missing_bits[near] / missing_counts[near, None]).sum(axis=0)
+            gains[~self.purchasable] = 0
+            progress[~self.purchasable] = 0
+
+            if len(gains) == 0:
+                break
+
+            # lexsort는 마지막 키를 우선하므로 (레시피 수, 기여도, 낮은 비트) 순으로 최댓값을 고릅니다.
+            best = int(np.lexsort((tie_breaker, progress, gains))[-1])
+            if gains[best] == 0 and progress[best] == 0:
+                break
+
+            rows = np.flatnonzero(one_away & missing_bits[:, best])
+            steps.append((best, [self.records[row] for row in rows]))
+            missing_bits[:, best] = False
+
+        return steps
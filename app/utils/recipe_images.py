@@ -0,0 +1,104 @@
+"""
+레시피 이미지 매핑 유틸리티 모듈
+레시피 코드/한국어 이름/영어 이름을 이미지 파일명으로 바로 찾을 수 있도록 카탈로그 로드 시 매핑을 만듭니다.
+"""
+
+import logging
+import os
+import re
+from typing import Dict, List, Optional
+from app.utils.text_index import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 이름 비교 시 무시하는 구분 문자 (영어 이름은 "Apple-Martini"처럼 하이픈으로 구분)
+_SEPARATORS = re.compile(r"[\s\-_]+")
+
+
+def normalize_key(value: object) -> str:
+    """
+    매핑 키로 사용할 정규화된 문자열을 반환합니다.
+
+    NFC로 합치고 소문자로 바꾼 뒤 공백/하이픈/밑줄을 제거하므로
+    "Apple Martini", "apple-martini", "애플마티니"가 각각 같은 키가 됩니다.
+    """
+    return _SEPARATORS.sub("", normalize_text(value))
+
+
+class RecipeImageMap:
+    """
+    레시피 코드/이름에서 이미지 파일명으로의 매핑
+
+    - 키는 레시피 코드, korean_name, english_name을 정규화한 값이며 코드가 이름보다 우선합니다.
+    - 같은 이름의 레시피가 여러 개면 카탈로그 순서상 첫 번째 레시피를 사용합니다.
+    - 이미지 파일은 만들 때 디렉토리 목록으로 한 번 확인하고, 없는 레시피는 missing에 모아 경고 로그를 남깁니다.
+    - directory를 지정하지 않으면 default_directory(앱 생성 시 app.static_folder/recipes로 설정)를 사용합니다.
+    - 이미지 파일 목록에 의존하므로 카탈로그 스냅샷에는 포함하지 않습니다 (RecordIndex.TRANSIENT_DERIVED).
+    """
+
+    # 기본 레시피 이미지 디렉토리 (configure_recipe_images에서 설정)
+    default_directory: Optional[str] = None
+
+    def __init__(self, records: List[Dict], directory: Optional[str] = None):
+        self._directory = directory
+        self.missing: List[Dict] = []
+        self._codes: Dict[str, str] = {}
+        self._files: Dict[str, str] = {}
+
+        available = set()
+        if self.directory is not None:
+            try:
+                with os.scandir(self.directory) as entries:
+                    available = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                pass
+
+        for record in records:
+            code = record.get("code")
+            if code is None:
+                continue
+            code = str(code).strip()
+            self._codes.setdefault(normalize_key(code), code)
+
+            filename = f"{record.get('english_name', '')}.png"
+            if filename in available:
+                self._files.setdefault(code, filename)
+            else:
+                self.missing.append(record)
+
+        for field in ("korean_name", "english_name"):
+            for record in records:
+                name = normalize_key(record.get(field))
+                if name and record.get("code") is not None:
+                    self._codes.setdefault(name, str(record["code"]).strip())
+
+        if self.missing:
+            names = ", ".join(str(record.get("english_name") or record.get("code")) for record in self.missing)
+            logger.warning(f"이미지 파일이 없는 레시피 {len(self.missing)}개: {names}")
+
+    @property
+    def directory(self) -> Optional[str]:
+        """레시피 이미지 디렉토리"""
+        return self._directory or RecipeImageMap.default_directory
+
+    def resolve(self, key: object) -> Optional[str]:
+        """
+        레시피 코드 또는 이름(정확히 일치)으로 레시피 코드를 찾습니다.
+
+        Args:
+            key: 레시피 코드, 한국어 이름 또는 영어 이름
+
+        Returns:
+            레시피 코드 또는 None
+        """
+        normalized = normalize_key(key)
+        if not normalized:
+            return None
+        return self._codes.get(normalized)
+
+    def filename(self, code: str) -> Optional[str]:
+        """레시피 코드의 이미지 파일명을 반환합니다 (이미지가 없으면 None)."""
+        return self._files.get(code)
+
+    def __len__(self) -> int:
+        return len(self._files)
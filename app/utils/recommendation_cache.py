@@ -0,0 +1,273 @@
+"""
+추천 결과 캐시 유틸리티 모듈
+같은 입력(엔드포인트, 페르소나, 보유 칵테일 집합, 상황 정보)의 추천 결과를 키별로 서로 다른 N개까지 보관합니다.
+요청마다 보관된 결과를 차례로 돌려주고 부족한 결과는 백그라운드에서 채우므로,
+매번 다른 추천을 주면서도 재방문 사용자의 요청은 LLM 호출 없이 응답합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from app.utils.recipe_images import normalize_key
+
+logger = logging.getLogger(__name__)
+
+# 키별로 보관할 서로 다른 추천 결과 수
+DEFAULT_POOL_SIZE = 3
+
+# 추천 결과 보관 시간(초)
+DEFAULT_TTL = 60 * 60
+
+# 최대 키 수 (LRU로 제한)
+DEFAULT_MAX_ENTRIES = 1024
+
+# 백그라운드 보충에 사용할 스레드 수 (동시에 보충하는 키 수)
+DEFAULT_REFILL_WORKERS = 2
+
+
+def _normalize_cocktails(cocktail_list: str) -> List[str]:
+    """
+    보유 칵테일 목록을 순서와 표기에 무관한 정렬된 집합으로 변환합니다.
+
+    Args:
+        cocktail_list: JSON 배열 문자열 또는 쉼표로 구분된 문자열
+
+    Returns:
+        정규화된 칵테일 키의 정렬된 리스트
+    """
+    try:
+        items = json.loads(cocktail_list)
+    except (json.JSONDecodeError, TypeError):
+        items = None
+    if not isinstance(items, list):
+        items = str(cocktail_list).split(",")
+
+    keys = set()
+    for item in items:
+        if isinstance(item, dict):
+            item = json.dumps(item, ensure_ascii=False, sort_keys=True)
+        key = normalize_key(item)
+        if key:
+            keys.add(key)
+    return sorted(keys)
+
+
+def make_recommendation_key(endpoint: str, persona: Any, cocktail_list: str, *context: Any) -> str:
+    """
+    추천 결과 캐시 키를 만듭니다.
+
+    Args:
+        endpoint: 추천 종류 ("default", "feeling", "situation")
+        persona: 사용자 페르소나
+        cocktail_list: 보유 칵테일 목록
+        *context: 상황 정보 (계절, 시간, 날씨 등)
+
+    Returns:
+        입력을 정규화한 값의 SHA-256 해시
+    """
+    payload = [
+        endpoint,
+        str(persona).strip(),
+        _normalize_cocktails(cocktail_list),
+        [normalize_key(value) for value in context],
+    ]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _recommended_names(result: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    추천 결과에서 추천된 칵테일 이름을 정규화한 튜플을 반환합니다 (중복 결과 판단용).
+
+    설명 문구만 다르고 같은 칵테일을 추천한 결과는 같은 튜플이 됩니다.
+
+    Args:
+        result: 추천 결과 딕셔너리
+
+    Returns:
+        추천 항목 순서대로의 정규화된 이름 튜플
+    """
+    items = result.get("recommendation")
+    if not isinstance(items, list):
+        return ()
+    return tuple(normalize_key(item.get("name") if isinstance(item, dict) else item) for item in items)
+
+
+class RecommendationPool:
+    """키 하나의 추천 결과 목록, 결과별 추천 이름과 다음에 돌려줄 위치"""
+
+    __slots__ = ("results", "names", "position", "expires_at")
+
+    def __init__(self, expires_at: float):
+        self.results: List[Dict[str, Any]] = []
+        self.names: Set[Tuple[str, ...]] = set()
+        self.position = 0
+        self.expires_at = expires_at
+
+
+class RecommendationCache:
+    """
+    키별로 서로 다른 추천 결과를 pool_size개까지 보관하는 LRU 캐시 클래스
+
+    - 첫 요청(캐시 없음)은 LLM을 호출해 응답하고, 그 결과로 pool을 만듭니다.
+    - 이미 응답한 결과는 served로 추가해 다음 요청이 같은 결과를 다시 받지 않도록 pool 위치를 그 다음으로 옮깁니다.
+    - 이후 요청은 pool의 결과를 차례로 돌려주며, pool이 가득 차지 않았으면 백그라운드에서 한 개씩 채웁니다.
+      보관된 결과를 모두 응답했는데 보충이 진행 중이면, 같은 결과를 반복하지 않도록 pool 대신 새로 호출합니다.
+    - pool은 처음 만든 뒤 ttl초가 지나면 버리고 다시 만듭니다.
+    - 에러 결과와 이미 보관한 결과와 같은 칵테일을 추천한 결과(설명 문구만 다른 경우 포함)는 보관하지 않습니다.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, refill_workers: int = DEFAULT_REFILL_WORKERS):
+        self.pool_size = pool_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refill_workers = refill_workers
+        self._pools: "OrderedDict[str, RecommendationPool]" = OrderedDict()
+        self._refilling: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self, key: str) -> Optional[RecommendationPool]:
+        """만료되지 않은 pool을 반환합니다 (lock을 잡은 상태에서 호출)."""
+        pool = self._pools.get(key)
+        if pool is not None and pool.expires_at <= time.monotonic():
+            del self._pools[key]
+            return None
+        return pool
+
+    def next(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        pool에서 다음 추천 결과를 꺼냅니다 (결과는 pool에 남아 순서대로 반복).
+
+        Args:
+            key: make_recommendation_key로 만든 키
+
+        Returns:
+            추천 결과 또는 None (pool이 없거나 만료된 경우, 보관된 결과를 모두 응답했고 보충이 진행 중인 경우)
+        """
+        with self._lock:
+            pool = self._get_pool(key)
+            if pool is None or not pool.results:
+                return None
+            if pool.position >= len(pool.results) and key in self._refilling:
+                return None
+            self._pools.move_to_end(key)
+            result = pool.results[pool.position % len(pool.results)]
+            pool.position += 1
+            return result
+
+    def add(self, key: str, result: Any, served: bool = False) -> bool:
+        """
+        추천 결과를 pool에 추가합니다.
+
+        Args:
+            key: 캐시 키
+            result: 추천 결과 딕셔너리
+            served: 이미 응답한 결과인지 여부 (True면 다음 next()가 이 결과 다음부터 돌려줌)
+
+        Returns:
+            추가했으면 True (에러 결과, 중복 결과, pool이 가득 찬 경우 False)
+        """
+        if not isinstance(result, dict) or "error" in result:
+            return False
+        names = _recommended_names(result)
+
+        with self._lock:
+            pool = self._get_pool(key)
+            if pool is None:
+                pool = RecommendationPool(time.monotonic() + self.ttl)
+                self._pools[key] = pool
+            self._pools.move_to_end(key)
+            if names in pool.names:
+                if served:
+                    # 같은 칵테일을 추천한 결과를 이미 응답했으므로 보관된 그 결과도 건너뜁니다.
+                    index = [_recommended_names(item) for item in pool.results].index(names)
+                    pool.position = max(pool.position, index + 1)
+                return False
+            if len(pool.results) >= self.pool_size:
+                return False
+            pool.results.append(result)
+            pool.names.add(names)
+            if served:
+                pool.position = len(pool.results)
+            while len(self._pools) > self.max_entries:
+                self._pools.popitem(last=False)
+            return True
+
+    def needs_refill(self, key: str) -> bool:
+        """pool이 있고 아직 가득 차지 않았는지 확인합니다."""
+        with self._lock:
+            pool = self._get_pool(key)
+            return pool is not None and 0 < len(pool.results) < self.pool_size
+
+    def get_or_call(self, key: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        pool의 다음 추천 결과를 반환합니다. pool이 없으면 call로 새 결과를 만들어 응답한 결과로 보관합니다.
+
+        응답한 뒤 pool이 가득 차지 않았으면 백그라운드 보충을 예약하므로, 다음 요청은 다른 결과를 받습니다.
+
+        Args:
+            key: 캐시 키
+            call: 새 추천 결과를 만드는 함수 (요청 컨텍스트 밖에서도 호출할 수 있어야 함)
+
+        Returns:
+            추천 결과 딕셔너리
+        """
+        result = self.next(key)
+        if result is None:
+            result = call()
+            self.add(key, result, served=True)
+        self.schedule_refill(key, call)
+        return result
+
+    def schedule_refill(self, key: str, call: Callable[[], Dict[str, Any]]):
+        """pool이 가득 차지 않았으면 백그라운드에서 채웁니다 (키마다 동시에 하나만 실행)."""
+        if not self.needs_refill(key):
+            return
+        with self._lock:
+            if key in self._refilling:
+                return
+            self._refilling.add(key)
+        self._get_executor().submit(self._refill, key, call)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """보충용 스레드 풀을 지연 생성합니다 (fork된 워커에서는 새로 생성)."""
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.refill_workers,
+                                                    thread_name_prefix="recommendation-refill")
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _refill(self, key: str, call: Callable[[], Dict[str, Any]]):
+        """pool이 가득 찰 때까지 새 추천 결과를 추가합니다 (실패하거나 중복이면 중단)."""
+        try:
+            for _ in range(self.pool_size):
+                if not self.needs_refill(key):
+                    break
+                if not self.add(key, call()):
+                    break
+        except Exception as e:
+            logger.warning(f"추천 결과 보충 실패: {e}")
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def clear(self):
+        """모든 추천 결과를 삭제합니다."""
+        with self._lock:
+            self._pools.clear()
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+
+# 전역 추천 결과 캐시 인스턴스
+recommendation_cache = RecommendationCache()
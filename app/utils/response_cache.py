@@ -0,0 +1,285 @@
+"""
+응답 캐시 유틸리티 모듈
+카탈로그 조회 응답의 최종 바이트를 데이터 버전별로 캐싱해 요청마다 JSON을 다시 인코딩하지 않도록 하고,
+ETag/Last-Modified 기반 조건부 요청(304)을 처리합니다.
+"""
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlencode
+from flask import Response, current_app, request
+from app.utils.data_loader import data_loader
+from app.utils.image_cache import IMAGE_DIRS, combine_fingerprints, image_cache, scan_directory
+from app.utils.response_helper import response_helper
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 제공
+    brotli = None
+
+# 기본 최대 캐시 항목 수 (조회 엔드포인트는 키가 다양하므로 LRU로 제한)
+DEFAULT_MAX_ENTRIES = 2048
+
+# 이 크기보다 작은 응답은 압축하지 않음 (압축 이득보다 헤더/CPU 비용이 큼)
+COMPRESSION_MIN_SIZE = 1024
+
+# 미리 채우는 전체 카탈로그 응답의 압축 수준 (앱 시작 시 한 번만 압축하므로 최대 압축률 사용)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# 요청 중에 만드는 응답의 압축 수준 (요청 스레드에서 압축하므로 속도 우선)
+ON_DEMAND_GZIP_LEVEL = 6
+ON_DEMAND_BROTLI_QUALITY = 5
+
+# 미리 채우기 요청임을 나타내는 WSGI environ 키 (클라이언트 헤더로는 설정할 수 없음)
+WARM_ENVIRON_KEY = "app.response_cache.warm"
+
+# 캐시 키와 ETag에 포함하는 쿼리 파라미터 (카탈로그 라우트가 읽는 파라미터만 사용해,
+# 알 수 없는 파라미터로 캐시 항목이 늘어나지 않도록 함)
+CACHE_QUERY_PARAMS = (
+    "limit", "cursor", "fields",
+    "type", "base", "abv_min", "abv_max", "volume_min", "volume_max",
+)
+
+# 응답 형식 버전 (데이터가 같아도 응답 구조가 바뀌면 올려서 클라이언트 캐시(ETag)를 무효화)
+RESPONSE_FORMAT_VERSION = 1
+
+
+def _compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    응답 본문을 지정한 Content-Encoding으로 압축합니다.
+
+    Args:
+        body: 응답 본문
+        encoding: "br" 또는 "gzip"
+        best: 최대 압축률 사용 여부 (미리 채우는 응답), False면 요청 중 압축용 수준 사용
+
+    Returns:
+        압축된 본문
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY if best else ON_DEMAND_BROTLI_QUALITY)
+    # mtime=0으로 고정해 같은 본문은 항상 같은 바이트로 압축되도록 합니다.
+    return gzip.compress(body, compresslevel=GZIP_LEVEL if best else ON_DEMAND_GZIP_LEVEL, mtime=0)
+
+
+class CachedResponse:
+    """
+    캐싱된 응답 본문과 헤더 정보
+
+    - precompress이면(미리 채우는 응답) 압축본(br/gzip)을 만들 때 최대 압축률로 모두 만들어 두므로,
+      preload 마스터에서 만든 항목은 워커들이 copy-on-write로 공유합니다.
+    - 그 외에는 요청에서 협상된 인코딩의 압축본만 처음 요청될 때 속도 우선 수준으로 만듭니다.
+      두 스레드가 동시에 만들어도 같은 바이트이므로 잠금 없이 저장합니다.
+    """
+
+    __slots__ = ("body", "status", "content_type", "_encoded", "_best")
+
+    def __init__(self, body: bytes, status: int, content_type: str, precompress: bool = False):
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+        self._best = precompress
+        self._encoded: Dict[str, bytes] = {}
+        if precompress:
+            for encoding in self.available_encodings():
+                self._encoded[encoding] = _compress(body, encoding, best=True)
+
+    def available_encodings(self) -> Tuple[str, ...]:
+        """이 응답에 제공할 수 있는 Content-Encoding 목록을 선호 순서대로 반환합니다."""
+        if len(self.body) < COMPRESSION_MIN_SIZE:
+            return ()
+        return ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def encoded_body(self, encoding: Optional[str]) -> bytes:
+        """
+        인코딩별 본문을 반환합니다 (압축본이 없으면 만들어 보관).
+
+        Args:
+            encoding: "br", "gzip" 또는 None(압축 안 함)
+
+        Returns:
+            본문 바이트
+        """
+        if encoding is None:
+            return self.body
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            encoded = _compress(self.body, encoding, best=self._best)
+            self._encoded[encoding] = encoded
+        return encoded
+
+    def to_response(self, encoding: Optional[str] = None) -> Response:
+        """캐싱된 바이트로 Flask Response를 생성합니다 (다시 인코딩하지 않음)."""
+        response = Response(response=self.encoded_body(encoding), status=self.status, content_type=self.content_type)
+        if encoding is not None:
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+def cache_path() -> str:
+    """
+    캐시 키와 ETag에 사용할 요청 경로를 반환합니다.
+
+    CACHE_QUERY_PARAMS에 있는 쿼리 파라미터만 이름순으로 포함하므로,
+    파라미터 순서나 알 수 없는 파라미터가 달라도 같은 응답은 같은 경로가 됩니다.
+
+    Returns:
+        "<경로>?<정규화된 쿼리>" (쿼리가 없으면 경로만)
+    """
+    query = urlencode(
+        [(name, value) for name in sorted(CACHE_QUERY_PARAMS) for value in request.args.getlist(name)]
+    )
+    return f"{request.path}?{query}" if query else request.path
+
+
+def image_fingerprint() -> str:
+    """
+    응답에 포함된 이미지 URL(v=<내용 해시>)의 유효성을 나타내는 이미지 디렉토리 fingerprint를 반환합니다.
+
+    IMAGE_CACHE_ENABLED이면 시작 시 만든 파일 목록의 값을 사용하고,
+    그 외(개발 환경)에는 요청마다 이미지 디렉토리를 확인합니다.
+
+    Returns:
+        fingerprint 문자열
+    """
+    if current_app.config.get("IMAGE_CACHE_ENABLED"):
+        return image_cache.fingerprint()
+    return combine_fingerprints(
+        scan_directory(os.path.join(current_app.static_folder, name))[1] for name in IMAGE_DIRS
+    )
+
+
+def choose_encoding(available: Tuple[str, ...]) -> Optional[str]:
+    """
+    요청의 Accept-Encoding에서 가장 선호하는 압축 방식을 고릅니다.
+
+    품질 값(q)이 같으면 available의 순서(br > gzip)를 따릅니다.
+
+    Args:
+        available: 제공할 수 있는 Content-Encoding 목록 (선호 순서)
+
+    Returns:
+        선택한 Content-Encoding 또는 None(압축 안 함)
+    """
+    if not available:
+        return None
+    return request.accept_encodings.best_match(available)
+
+
+class ResponseCache:
+    """데이터 버전별로 응답 바이트를 보관하는 LRU 캐시 클래스"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[CachedResponse]:
+        """
+        데이터 버전이 일치하는 캐시 항목을 반환합니다.
+
+        Args:
+            key: 캐시 키
+            version: 현재 버전 (데이터 버전과 이미지 fingerprint)
+
+        Returns:
+            CachedResponse 또는 None (없거나 이전 버전인 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, version: Hashable, cached: CachedResponse):
+        """
+        캐시 항목을 저장합니다. 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 제거합니다.
+
+        Args:
+            key: 캐시 키
+            version: 응답을 만들 때의 버전 (데이터 버전과 이미지 fingerprint)
+            cached: 저장할 응답
+        """
+        with self._lock:
+            self._entries[key] = (version, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_response(view: Callable) -> Callable:
+    """
+    카탈로그 GET 라우트의 HTTP 캐싱을 처리하는 데코레이터입니다.
+
+    - ETag(응답 형식 버전 + 원본 데이터 fingerprint + 이미지 fingerprint + 요청 경로/쿼리(cache_path) + JSON 모드)와
+      Last-Modified(원본 파일 수정 시각)를 추가하고,
+      If-None-Match / If-Modified-Since가 일치하면 뷰를 실행하지 않고 304로 응답합니다.
+    - RESPONSE_CACHE_ENABLED 설정이 True이면 200 응답 바이트를 데이터 버전별로 캐싱합니다.
+      데이터가 다시 로드되어 DataLoader.version이 바뀌거나 이미지 fingerprint가 바뀌면 이전 항목은 사용하지 않습니다
+      (응답에 담긴 이미지 해시 URL이 바뀌기 때문).
+    - 캐싱된 응답은 Accept-Encoding에 따라 brotli/gzip 압축본으로 응답하고 Vary 헤더를 추가합니다.
+      최대 압축률의 압축본은 미리 채우는 요청(WARM_ENVIRON_KEY)에서만 만듭니다.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        # 응답을 만들기 전에 버전을 읽어, 교체 중 만든 응답이 새 버전으로 저장되지 않도록 합니다.
+        images = image_fingerprint()
+        version = (data_loader.version, images)
+        compact = bool(current_app.config.get("JSON_COMPACT"))
+        fingerprint, last_modified = data_loader.get_validators()
+        path = cache_path()
+        etag = response_helper.make_etag(RESPONSE_FORMAT_VERSION, fingerprint, images, path, compact)
+
+        use_cache = current_app.config.get("RESPONSE_CACHE_ENABLED")
+        key = (path, compact)
+        cached = response_cache.get(key, version) if use_cache else None
+
+        if cached is None:
+            # 캐시가 없으면 압축 여부를 알 수 없으므로, 압축하지 않은 표현의 ETag로만 304를 판단합니다.
+            if response_helper.is_not_modified(etag, last_modified):
+                return response_helper.not_modified_response(etag, last_modified)
+
+            response = view(*args, **kwargs)
+            if not (isinstance(response, Response) and response.status_code == 200 and not response.direct_passthrough):
+                return response
+            if not use_cache:
+                return response_helper.add_validators(response, etag, last_modified)
+
+            precompress = bool(request.environ.get(WARM_ENVIRON_KEY))
+            cached = CachedResponse(response.get_data(), 200, response.content_type, precompress)
+            response_cache.put(key, version, cached)
+
+        # 압축 표현마다 다른 강한 ETag를 사용합니다.
+        encoding = choose_encoding(cached.available_encodings())
+        if encoding is not None:
+            etag = f"{etag}-{encoding}"
+        if response_helper.is_not_modified(etag, last_modified):
+            response = response_helper.not_modified_response(etag, last_modified)
+            response.vary.add("Accept-Encoding")
+            return response
+        return response_helper.add_validators(cached.to_response(encoding), etag, last_modified)
+
+    return wrapper
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache()
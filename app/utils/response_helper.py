@@ -3,9 +3,28 @@ API 응답을 위한 유틸리티 모듈
 일관된 JSON 응답 형식을 제공합니다.
 """
 
-import json
-from flask import Response, jsonify
-from typing import Any, Dict, List, Optional, Union
+import hashlib
+import mimetypes
+import os
+import threading
+from datetime import datetime
+from flask import Response, current_app, has_app_context, jsonify, request, send_file, url_for
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from werkzeug.http import is_resource_modified
+from werkzeug.security import safe_join
+from app.utils.image_cache import image_cache
+from app.utils.image_variants import file_hash, get_variant, negotiate_format, parse_width
+from app.utils.json_encoder import get_json_encoder
+from app.utils.ndjson import NDJSON_MIMETYPE, iter_gzip, iter_ndjson
+from app.utils.pagination import FieldColumns, PageRequest, paginate
+from app.utils.sse import SSE_MIMETYPE, iter_sse
+
+# 파일 경로별 (수정 시각, 크기, 내용 해시) 캐시 - 이미지 ETag 계산용
+_file_etags: Dict[str, Tuple[int, int, str]] = {}
+_file_etags_lock = threading.Lock()
+
+# 해시 URL(?v=<원본 ETag>) 이미지 응답의 캐시 유효 기간(초)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
 
 
 class ResponseHelper:
@@ -24,7 +43,14 @@ class ResponseHelper:
         Returns:
             Flask Response 객체
         """
-        response_data = json.dumps(data, indent=4, ensure_ascii=ensure_ascii)
+        if has_app_context():
+            encoder = get_json_encoder(current_app.config.get("JSON_ENCODER", "auto"))
+            # 공백 없는 compact 모드 (프로덕션 기본값)
+            compact = bool(current_app.config.get("JSON_COMPACT"))
+        else:
+            encoder = get_json_encoder()
+            compact = False
+        response_data = encoder.dumps(data, compact=compact, ensure_ascii=ensure_ascii)
         return Response(response=response_data, status=status_code, mimetype="application/json; charset=utf-8")
 
     @staticmethod
@@ -64,7 +90,13 @@ class ResponseHelper:
         return ResponseHelper.json_response(response_data, status_code)
 
     @staticmethod
-    def search_response(results: List[Any], total_count: int = None, query: str = None) -> Response:
+    def search_response(
+        results: List[Any],
+        total_count: int = None,
+        query: str = None,
+        facets: Dict[str, Any] = None,
+        next_cursor: Optional[str] = None,
+    ) -> Response:
         """
         검색 결과 응답을 생성합니다.
 
@@ -72,6 +104,8 @@ class ResponseHelper:
             results: 검색 결과 리스트
             total_count: 전체 결과 수 (None인 경우 results의 길이 사용)
             query: 검색 쿼리
+            facets: 필터 패싯 집계 (선택사항)
+            next_cursor: 다음 페이지 커서 (마지막 페이지가 아니면 포함)
 
         Returns:
             Flask Response 객체
@@ -84,8 +118,149 @@ class ResponseHelper:
         if query:
             response_data["query"] = query
 
+        if facets is not None:
+            response_data["facets"] = facets
+
+        if next_cursor:
+            response_data["next_cursor"] = next_cursor
+
+        return ResponseHelper.json_response(response_data)
+
+    @staticmethod
+    def page_response(
+        results: List[Dict],
+        page: PageRequest,
+        columns: Optional[FieldColumns] = None,
+        query: str = None,
+        facets: Dict[str, Any] = None,
+        envelope: bool = True,
+    ) -> Response:
+        """
+        limit/cursor 페이지네이션과 fields 필드 선택을 적용한 목록 응답을 생성합니다.
+
+        Args:
+            results: 전체 결과 리스트
+            page: 페이지 요청 (parse_page_request 결과)
+            columns: 필드 컬럼 (page.fields가 있으면 필수)
+            query: 검색 쿼리
+            facets: 필터 패싯 집계 (선택사항)
+            envelope: False이면 페이지네이션을 요청하지 않았을 때 배열을 그대로 반환 (전체 목록 API 호환)
+
+        Returns:
+            Flask Response 객체
+        """
+        if page.fields:
+            unknown = columns.unknown_fields(page.fields)
+            if unknown:
+                return ResponseHelper.validation_error_response(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        items, next_cursor = paginate(results, page)
+        if page.fields:
+            # 전체 카탈로그 목록이면 필드 컬럼의 연속 구간을 그대로 잘라 사용합니다.
+            offset = page.offset if results is columns.records else None
+            items = columns.project(items, page.fields, offset)
+
+        if not envelope and not page.is_paginated:
+            return ResponseHelper.json_response(list(items))
+
+        return ResponseHelper.search_response(
+            results=list(items), total_count=len(results), query=query, facets=facets, next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def batch_response(
+        codes: List[Any],
+        items: List[Optional[Dict]],
+        fields: Optional[List[str]] = None,
+        columns: Optional[FieldColumns] = None,
+    ) -> Response:
+        """
+        일괄 조회 결과 응답을 생성합니다.
+
+        results는 요청한 코드 순서를 유지하며, 찾지 못한 코드는 item이 null이고 missing에도 포함됩니다.
+
+        Args:
+            codes: 요청한 코드 리스트
+            items: 코드별 조회 결과 (없으면 None)
+            fields: 선택할 필드 목록 (None이면 전체 필드)
+            columns: 필드 컬럼 (fields가 있으면 필수)
+
+        Returns:
+            Flask Response 객체
+        """
+        if fields:
+            unknown = columns.unknown_fields(fields)
+            if unknown:
+                return ResponseHelper.validation_error_response(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+            found = [item for item in items if item is not None]
+            projected = iter(columns.project(found, fields))
+            items = [next(projected) if item is not None else None for item in items]
+
+        response_data = {
+            "success": True,
+            "total_count": len(codes),
+            "found_count": sum(item is not None for item in items),
+            "results": [{"code": code, "item": item} for code, item in zip(codes, items)],
+            "missing": [code for code, item in zip(codes, items) if item is None],
+        }
         return ResponseHelper.json_response(response_data)
 
+    @staticmethod
+    def ndjson_response(
+        records: List[Dict], fields: Optional[List[str]] = None, columns: Optional[FieldColumns] = None
+    ) -> Response:
+        """
+        레코드를 NDJSON(한 줄에 레코드 하나)으로 스트리밍하는 응답을 생성합니다.
+
+        클라이언트가 gzip을 허용하면 압축하면서 스트리밍합니다.
+        제너레이터는 요청 시점의 레코드 리스트를 참조하므로 전송 중 데이터가 다시 로드되어도 결과가 섞이지 않습니다.
+
+        Args:
+            records: 내보낼 레코드 리스트
+            fields: 선택할 필드 목록 (None이면 전체 필드)
+            columns: 필드 컬럼 (fields가 있으면 필수)
+
+        Returns:
+            Flask Response 객체 (X-Total-Count 헤더에 레코드 수 포함)
+        """
+        if fields:
+            unknown = columns.unknown_fields(fields)
+            if unknown:
+                return ResponseHelper.validation_error_response(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        encoder = get_json_encoder(current_app.config.get("JSON_ENCODER", "auto"))
+        chunks = iter_ndjson(records, encoder, fields, columns)
+        encoding = request.accept_encodings.best_match(["gzip"])
+        if encoding:
+            chunks = iter_gzip(chunks)
+
+        response = Response(chunks, mimetype=NDJSON_MIMETYPE)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        response.headers["X-Total-Count"] = str(len(records))
+        return response
+
+    @staticmethod
+    def sse_response(events: Iterable[Tuple[str, Any]]) -> Response:
+        """
+        이벤트를 Server-Sent Events로 스트리밍하는 응답을 생성합니다.
+
+        이벤트가 만들어지는 즉시 전달되도록 압축하지 않고, 프록시 버퍼링(X-Accel-Buffering)을 끕니다.
+
+        Args:
+            events: (이벤트 이름, 데이터) 튜플을 내보내는 이터러블
+
+        Returns:
+            Flask Response 객체
+        """
+        encoder = get_json_encoder(current_app.config.get("JSON_ENCODER", "auto"))
+        response = Response(iter_sse(events, encoder), mimetype=SSE_MIMETYPE)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
     @staticmethod
     def not_found_response(resource: str = "리소스") -> Response:
         """
@@ -126,6 +301,242 @@ class ResponseHelper:
 
         return ResponseHelper.json_response(response_data, 400)
 
+    @staticmethod
+    def make_etag(*parts: Any) -> str:
+        """
+        여러 값을 조합해 강한(strong) ETag 값을 만듭니다.
+
+        Args:
+            parts: ETag에 반영할 값들 (데이터 fingerprint, 요청 경로 등)
+
+        Returns:
+            따옴표 없는 ETag 문자열
+        """
+        return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def is_not_modified(etag: str, last_modified: Optional[datetime] = None) -> bool:
+        """
+        요청의 If-None-Match / If-Modified-Since 헤더로 볼 때 클라이언트 캐시가 최신인지 확인합니다.
+
+        Args:
+            etag: 현재 리소스의 ETag
+            last_modified: 현재 리소스의 최종 수정 시각
+
+        Returns:
+            304 Not Modified로 응답할 수 있으면 True
+        """
+        if request.method not in ("GET", "HEAD"):
+            return False
+        if not (request.if_none_match or request.if_modified_since):
+            return False
+        return not is_resource_modified(request.environ, etag=etag, last_modified=last_modified)
+
+    @staticmethod
+    def add_validators(response: Response, etag: str, last_modified: Optional[datetime] = None) -> Response:
+        """
+        응답에 ETag/Last-Modified 헤더를 추가합니다.
+
+        Cache-Control: no-cache를 함께 설정해 클라이언트가 캐시를 사용하기 전에 항상 재검증하도록 합니다.
+
+        Args:
+            response: Flask Response 객체
+            etag: ETag 값
+            last_modified: 최종 수정 시각
+
+        Returns:
+            헤더가 추가된 Response 객체
+        """
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        response.cache_control.no_cache = True
+        return response
+
+    @staticmethod
+    def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+        """
+        304 Not Modified 응답을 생성합니다.
+
+        Args:
+            etag: ETag 값
+            last_modified: 최종 수정 시각
+
+        Returns:
+            본문 없는 Flask Response 객체
+        """
+        return ResponseHelper.add_validators(Response(status=304), etag, last_modified)
+
+    @staticmethod
+    def file_etag(directory: str, filename: str) -> Optional[str]:
+        """
+        정적 파일의 ETag를 반환합니다 (send_from_directory의 etag 인자로 사용).
+
+        파일 내용의 해시를 사용하므로 배포나 서버가 달라도 같은 파일이면 같은 값입니다.
+        send_from_directory는 이 ETag와 파일 수정 시각으로 304 응답을 처리합니다.
+
+        Args:
+            directory: 파일이 있는 디렉토리
+            filename: 파일명
+
+        Returns:
+            ETag 문자열 또는 None (파일이 없는 경우)
+        """
+        path = safe_join(directory, filename)
+        if path is None:
+            return None
+        return _get_file_etag(path)
+
+    @staticmethod
+    def image_exists(directory: str, filename: str) -> bool:
+        """
+        이미지 파일이 있는지 확인합니다.
+
+        IMAGE_CACHE_ENABLED 설정이 True이면 디스크 대신 시작 시 만든 파일 목록(manifest)으로 확인합니다.
+
+        Args:
+            directory: 이미지 디렉토리
+            filename: 이미지 파일명
+
+        Returns:
+            이미지 파일 존재 여부
+        """
+        if current_app.config.get("IMAGE_CACHE_ENABLED"):
+            return image_cache.exists(directory, filename)
+        path = safe_join(directory, filename)
+        return path is not None and os.path.isfile(path)
+
+    @staticmethod
+    def image_url(endpoint: str, directory: str, filename: str, **values: Any) -> Optional[str]:
+        """
+        이미지 내용 해시를 v 파라미터로 붙인 이미지 URL(해시 URL)을 만듭니다.
+
+        해시 URL로 요청하면 image_response가 Cache-Control: immutable로 응답하므로,
+        클라이언트는 이미지가 바뀌어 URL이 달라질 때까지 재검증 없이 캐시를 사용합니다.
+
+        Args:
+            endpoint: 이미지 라우트의 엔드포인트 이름 (예: "drinks.get_drink_image")
+            directory: 이미지 디렉토리
+            filename: 이미지 파일명
+            **values: 엔드포인트 URL 인자
+
+        Returns:
+            이미지 URL 또는 None (이미지가 없는 경우)
+        """
+        path = safe_join(directory, filename)
+        if path is None or not ResponseHelper.image_exists(directory, filename):
+            return None
+        return url_for(endpoint, v=_get_source_hash(path), **values)
+
+    @staticmethod
+    def image_response(directory: str, filename: str, width: Optional[str] = None) -> Response:
+        """
+        이미지 파일을 반환합니다.
+
+        - ETag는 파일 내용 해시이며 If-None-Match가 일치하면 304로 응답합니다.
+        - 쿼리 파라미터 v가 원본 이미지의 ETag와 같으면(해시 URL) 내용이 바뀌지 않으므로
+          Cache-Control: immutable로 1년간 캐싱하도록 하고, 그 외에는 no-cache로 매번 재검증하도록 합니다.
+        - IMAGE_CACHE_ENABLED 설정이 True이면 자주 요청되는 이미지 바이트를 메모리에서 응답합니다.
+
+        Args:
+            directory: 이미지 디렉토리
+            filename: 이미지 파일명
+            width: 요청한 너비 (쿼리 파라미터 w, 지정하면 크기 변형 반환)
+
+        Returns:
+            Flask Response 객체
+        """
+        if width is not None:
+            return ResponseHelper.image_variant_response(directory, filename, width)
+
+        path = safe_join(directory, filename)
+        if path is None or not ResponseHelper.image_exists(directory, filename):
+            return ResponseHelper.not_found_response("이미지")
+
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        source_hash = _get_source_hash(path)
+        return _send_image(path, mimetype, source_hash, source_hash)
+
+    @staticmethod
+    def image_variant_response(directory: str, filename: str, width: str) -> Response:
+        """
+        이미지의 크기 변형(?w=)을 반환합니다.
+
+        Accept 헤더에 image/webp가 있으면 WebP, 없으면 PNG 변형을 반환하고 Vary: Accept를 추가합니다.
+        변형이 디스크에 없으면 처음 요청될 때 만들어 저장합니다.
+
+        Args:
+            directory: 원본 이미지 디렉토리
+            filename: 원본 이미지 파일명
+            width: 요청한 너비 (쿼리 파라미터 w)
+
+        Returns:
+            Flask Response 객체
+        """
+        try:
+            width = parse_width(width)
+        except ValueError as e:
+            return ResponseHelper.validation_error_response(str(e))
+
+        source_path = safe_join(directory, filename)
+        if source_path is None or not ResponseHelper.image_exists(directory, filename):
+            return ResponseHelper.not_found_response("이미지")
+
+        fmt = negotiate_format(request.accept_mimetypes)
+        source_hash = _get_source_hash(source_path)
+        path, mimetype, etag = get_variant(
+            source_path, width, fmt, current_app.config["IMAGE_VARIANT_DIR"], source_hash
+        )
+        response = _send_image(path, mimetype, etag, source_hash)
+        response.vary.add("Accept")
+        return response
+
+
+def _get_source_hash(path: str) -> Optional[str]:
+    """원본 이미지 내용 해시를 반환합니다 (이미지 캐시를 사용하면 파일 상태를 다시 확인하지 않음)."""
+    if current_app.config.get("IMAGE_CACHE_ENABLED"):
+        return image_cache.content_hash(path)
+    return _get_file_etag(path)
+
+
+def _send_image(path: str, mimetype: str, etag: str, source_hash: Optional[str]) -> Response:
+    """이미지 파일 응답을 만들고 해시 URL 여부에 따라 Cache-Control을 설정합니다."""
+    if current_app.config.get("IMAGE_CACHE_ENABLED"):
+        cached = image_cache.get(path, etag)
+        response = Response(cached.data, mimetype=mimetype)
+        response.set_etag(cached.etag)
+        response.last_modified = cached.last_modified
+        response = response.make_conditional(request, accept_ranges=True, complete_length=len(cached.data))
+    else:
+        response = send_file(path, mimetype=mimetype, etag=etag, conditional=True)
+
+    if source_hash is not None and request.args.get("v") == source_hash:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
+def _get_file_etag(path: str) -> Optional[str]:
+    """파일 내용의 해시로 ETag를 계산합니다 (수정 시각과 크기가 같으면 이전 결과 재사용)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    cached = _file_etags.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    etag = file_hash(path)
+
+    with _file_etags_lock:
+        _file_etags[path] = (stat.st_mtime_ns, stat.st_size, etag)
+    return etag
+
 
 # 전역 응답 헬퍼 인스턴스
 response_helper = ResponseHelper()
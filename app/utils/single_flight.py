@@ -0,0 +1,239 @@
+"""
+요청 병합(single-flight) 유틸리티 모듈
+같은 키의 호출이 동시에 여러 개 들어오면 하나만 실제로 실행하고, 나머지 호출은 그 결과(또는 예외)를 함께 받습니다.
+lock_dir을 설정하면 같은 호스트의 다른 워커 프로세스와도 키별 파일 잠금으로 호출을 병합합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 플랫폼에서는 프로세스 내 병합만 사용
+    fcntl = None
+
+# 기본 대기 제한 시간 (초)
+DEFAULT_TIMEOUT = 120.0
+
+# 다른 프로세스의 잠금 해제를 확인하는 간격 (초)
+_LOCK_POLL_INTERVAL = 0.05
+
+# 공유 결과가 없음을 나타내는 값 (None도 정상 결과일 수 있으므로 별도 객체 사용)
+_MISSING = object()
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """
+    병합 키를 만듭니다.
+
+    Args:
+        namespace: 호출 종류 (예: "persona", "embedding")
+        *parts: 호출 인자 (JSON으로 직렬화해 해시)
+
+    Returns:
+        "<namespace>:<인자 해시>" 형식의 키
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class _Flight:
+    """진행 중인 호출 하나의 완료 이벤트와 결과"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 병합하는 클래스
+
+    - 프로세스 안에서는 먼저 들어온 호출(leader)만 함수를 실행하고, 이후 호출은 완료를 기다려 같은 결과를 받습니다.
+    - lock_dir이 있으면 leader는 키별 잠금 파일을 잡고 실행한 뒤 결과를 JSON으로 기록합니다.
+      다른 프로세스의 leader는 잠금을 기다렸다가, 자신이 기다리기 시작한 뒤 기록된 결과가 있으면 그 결과를 사용합니다.
+    - 잠금 파일은 결과를 기록한 leader가 잠금을 쥔 채 삭제하므로, 이미 파일을 열고 기다리던 프로세스만 결과를 읽고
+      디렉토리에는 진행 중인 호출의 파일만 남습니다.
+    - 결과는 호출이 끝나면 버리므로 캐시가 아니며, 실패한 호출은 프로세스 간에 공유하지 않습니다.
+    - 다른 호출의 완료나 잠금을 timeout초 넘게 기다리면 TimeoutError를 발생시킵니다.
+    """
+
+    def __init__(self, lock_dir: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        키가 같은 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            key: 병합 키 (make_key 참고)
+            fn: 실행할 함수
+
+        Returns:
+            fn의 결과 (병합된 경우 leader의 결과)
+
+        Raises:
+            TimeoutError: 다른 호출의 완료를 timeout초 안에 받지 못한 경우
+            Exception: leader의 fn이 발생시킨 예외
+        """
+        flight, leader = self.start(key)
+        if not leader:
+            return self.wait(key, flight)
+
+        try:
+            result = self._call(key, fn)
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result)
+        return result
+
+    def start(self, key: str) -> Tuple[_Flight, bool]:
+        """
+        키의 진행 중인 호출을 찾거나, 없으면 새 호출로 등록합니다.
+
+        결과를 한 번에 반환하지 않는 호출(스트리밍 등)을 병합할 때 사용하며,
+        leader는 끝나면 반드시 finish를, 나머지 호출은 wait를 호출합니다. 프로세스 안에서만 병합합니다.
+
+        Args:
+            key: 병합 키
+
+        Returns:
+            (호출, leader 여부) 튜플
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = _Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def wait(self, key: str, flight: _Flight) -> Any:
+        """
+        leader의 호출이 끝나기를 기다려 결과를 반환합니다.
+
+        Args:
+            key: 병합 키 (에러 메시지용)
+            flight: start로 받은 호출
+
+        Returns:
+            leader의 결과
+
+        Raises:
+            TimeoutError: timeout초 안에 끝나지 않은 경우
+            Exception: leader의 호출이 실패한 경우 그 예외
+        """
+        if not flight.done.wait(self.timeout):
+            raise TimeoutError(f"병합된 호출이 {self.timeout}초 안에 끝나지 않았습니다: {key}")
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def finish(self, key: str, flight: _Flight, result: Any = None, error: Optional[BaseException] = None):
+        """
+        leader의 호출을 끝내고 기다리는 호출에 결과(또는 예외)를 전달합니다.
+
+        Args:
+            key: 병합 키
+            flight: start로 받은 호출
+            result: 호출 결과
+            error: 호출이 실패한 경우 그 예외
+        """
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            del self._flights[key]
+        flight.done.set()
+
+    def _call(self, key: str, fn: Callable[[], Any]) -> Any:
+        """lock_dir이 있으면 다른 프로세스와 병합해 fn을 실행합니다."""
+        if not self.lock_dir or fcntl is None:
+            return fn()
+
+        started = time.time()
+        deadline = time.monotonic() + self.timeout
+        os.makedirs(self.lock_dir, exist_ok=True)
+        path = os.path.join(self.lock_dir, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.lock")
+        while True:
+            with open(path, "a+b") as lock_file:
+                self._acquire(lock_file, deadline, key)
+                try:
+                    lock_file.seek(0)
+                    shared = self._read_shared(lock_file.read(), started)
+                    if shared is not _MISSING:
+                        return shared
+                    if not self._is_current(path, lock_file):
+                        # 이전 leader가 결과 없이 끝나고 삭제한 파일이므로 새 파일로 다시 시도
+                        continue
+
+                    try:
+                        result = fn()
+                        self._write_shared(lock_file, result)
+                        return result
+                    finally:
+                        os.unlink(path)
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _acquire(lock_file, deadline: float, key: str):
+        """deadline까지 잠금 파일의 배타 잠금을 시도합니다."""
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"다른 프로세스의 호출이 끝나지 않았습니다: {key}")
+                time.sleep(_LOCK_POLL_INTERVAL)
+
+    @staticmethod
+    def _is_current(path: str, lock_file) -> bool:
+        """열어 둔 잠금 파일이 아직 path에 연결되어 있는지 확인합니다."""
+        try:
+            return os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _write_shared(lock_file, result: Any):
+        """기다리는 프로세스가 읽을 결과를 잠금 파일에 기록합니다 (JSON으로 직렬화할 수 없으면 기록하지 않음)."""
+        try:
+            payload = json.dumps({"time": time.time(), "result": result}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(payload.encode("utf-8"))
+        lock_file.flush()
+
+    @staticmethod
+    def _read_shared(data: bytes, started: float) -> Any:
+        """잠금 파일에서 started 이후에 기록된 결과를 읽습니다 (없으면 _MISSING)."""
+        if not data:
+            return _MISSING
+        try:
+            shared = json.loads(data)
+        except ValueError:
+            return _MISSING
+        if not isinstance(shared, dict) or shared.get("time", 0) < started:
+            return _MISSING
+        return shared.get("result")
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+# 전역 요청 병합 인스턴스
+single_flight = SingleFlight()
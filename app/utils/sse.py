@@ -0,0 +1,39 @@
+"""
+Server-Sent Events 유틸리티 모듈
+(이벤트 이름, 데이터) 쌍을 text/event-stream 형식의 바이트로 인코딩합니다.
+"""
+
+from typing import Any, Iterable, Iterator, Tuple
+
+# SSE 응답 MIME 타입
+SSE_MIMETYPE = "text/event-stream"
+
+
+def format_event(event: str, data: Any, encoder: Any) -> bytes:
+    """
+    SSE 이벤트 하나를 인코딩합니다.
+
+    Args:
+        event: 이벤트 이름
+        data: 이벤트 데이터 (JSON으로 직렬화)
+        encoder: dumps(data, compact) 메서드를 가진 JSON 인코더
+
+    Returns:
+        "event: <이름>\\ndata: <JSON>\\n\\n" 형식의 바이트 (compact JSON에는 줄바꿈이 없음)
+    """
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + encoder.dumps(data, compact=True) + b"\n\n"
+
+
+def iter_sse(events: Iterable[Tuple[str, Any]], encoder: Any) -> Iterator[bytes]:
+    """
+    이벤트를 SSE 바이트 청크로 인코딩하는 제너레이터입니다.
+
+    Args:
+        events: (이벤트 이름, 데이터) 튜플을 내보내는 이터러블
+        encoder: JSON 인코더
+
+    Yields:
+        이벤트 하나의 바이트 청크
+    """
+    for event, data in events:
+        yield format_event(event, data, encoder)
@@ -0,0 +1,112 @@
+"""
+부분 문자열 검색을 위한 n-gram 역색인 유틸리티 모듈
+한글(완성형 음절)과 영문 이름을 문자 단위 n-gram으로 색인합니다.
+"""
+
+import unicodedata
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+# 색인에 사용하는 최대 n-gram 길이
+MAX_GRAM_SIZE = 3
+
+
+def normalize_text(value: Any) -> str:
+    """
+    검색용 텍스트를 정규화합니다.
+
+    iOS 등에서 자모가 분리된(NFD) 한글이 들어올 수 있으므로 NFC로 합친 뒤 소문자로 변환합니다.
+
+    Args:
+        value: 정규화할 값
+
+    Returns:
+        정규화된 문자열 (문자열이 아니면 빈 문자열)
+    """
+    if not isinstance(value, str):
+        return ""
+    return unicodedata.normalize("NFC", value).lower()
+
+
+def iter_grams(text: str, size: int) -> Iterable[str]:
+    """텍스트에서 길이 size의 n-gram을 순서대로 반환합니다."""
+    for start in range(len(text) - size + 1):
+        yield text[start : start + size]
+
+
+class NgramIndex:
+    """
+    문자 1~3-gram 역색인으로 부분 문자열 검색을 수행하는 클래스
+
+    fallback이면 fields를 대체 관계로 보고, 레코드마다 가진 첫 번째 필드만 색인합니다
+    (예: title이 있으면 title만, 없으면 name).
+    """
+
+    def __init__(self, records: List[Dict], fields: Sequence[str], fallback: bool = False):
+        self.records = records
+        self.fields = tuple(fields)
+        self.fallback = fallback
+        self._texts: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        for position, record in enumerate(records):
+            texts = tuple(text for text in (normalize_text(value) for value in self._values(record)) if text)
+            self._texts.append(texts)
+
+            grams: Set[str] = set()
+            for text in texts:
+                for size in range(1, MAX_GRAM_SIZE + 1):
+                    grams.update(iter_grams(text, size))
+
+            # position이 증가하는 순서로 추가되므로 posting list는 항상 정렬되어 있습니다.
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def _values(self, record: Dict) -> List[Any]:
+        """레코드에서 색인할 필드 값 목록을 반환합니다."""
+        if self.fallback:
+            for field in self.fields:
+                if field in record:
+                    return [record[field]]
+            return []
+        return [record.get(field) for field in self.fields]
+
+    def _query_grams(self, query: str) -> Set[str]:
+        """질의어를 덮는 n-gram 집합을 반환합니다."""
+        size = min(len(query), MAX_GRAM_SIZE)
+        return set(iter_grams(query, size))
+
+    def search(self, keyword: Any) -> List[Dict]:
+        """
+        키워드를 부분 문자열로 포함하는 레코드를 검색합니다.
+
+        Args:
+            keyword: 검색할 키워드
+
+        Returns:
+            카탈로그 순서를 유지한 검색 결과 리스트
+        """
+        query = normalize_text(keyword)
+        if not query:
+            return []
+
+        postings = []
+        for gram in self._query_grams(query):
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # 가장 짧은 posting list부터 교집합을 구합니다.
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        # n-gram 교집합은 후보일 뿐이므로 실제 부분 문자열 포함 여부를 확인합니다.
+        return [
+            self.records[position]
+            for position in sorted(candidates)
+            if any(query in text for text in self._texts[position])
+        ]
@@ -67,6 +67,31 @@ class InputValidator:
         pattern = r"^[a-zA-Z0-9_-]+$"
         return InputValidator.validate_string(code, min_length=1, max_length=50, pattern=pattern, field_name=field_name)
 
+    @staticmethod
+    def validate_code_list(codes: Any, field_name: str = "codes", max_items: int = 200) -> List[str]:
+        """
+        일괄 조회용 코드 목록을 검증합니다.
+
+        개별 코드의 형식은 검증하지 않으며, 형식이 맞지 않는 코드는 조회 결과에서 없는 코드로 처리됩니다.
+
+        Args:
+            codes: 검증할 코드 목록
+            field_name: 필드명
+            max_items: 최대 코드 개수
+
+        Returns:
+            에러 메시지 리스트
+        """
+        if not isinstance(codes, list) or not codes:
+            return [f"{field_name}은(는) 비어있지 않은 리스트여야 합니다."]
+
+        errors = []
+        if len(codes) > max_items:
+            errors.append(f"{field_name}은(는) 최대 {max_items}개까지 지정할 수 있습니다.")
+        if any(isinstance(code, bool) or not isinstance(code, (str, int)) for code in codes):
+            errors.append(f"{field_name}의 각 항목은 문자열 또는 정수여야 합니다.")
+        return errors
+
     @staticmethod
     def validate_coordinates(lat: Any, lng: Any) -> List[str]:
         """
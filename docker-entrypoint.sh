@@ -18,12 +18,7 @@ if [ "$FLASK_ENV" = "development" ]; then
   exec python run.py
 else
   echo "Starting in production mode with Gunicorn..."
-  exec gunicorn --bind $API_HOST:$SERVER_PORT \
-    --workers 4 \
-    --timeout 120 \
-    --access-logfile /app/logs/access.log \
-    --error-logfile /app/logs/error.log \
-    --log-level info \
-    run:app
+  # 워커 수, preload 등은 gunicorn.conf.py 참고 (GUNICORN_WORKERS, GUNICORN_PRELOAD)
+  exec gunicorn --config /app/gunicorn.conf.py run:app
 
 fi
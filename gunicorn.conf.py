@@ -0,0 +1,39 @@
+"""
+Gunicorn 설정 파일
+
+preload_app으로 마스터 프로세스에서 앱(카탈로그 데이터와 인덱스)을 한 번만 로드하고,
+앱 로드 직후와 fork 직전에 gc.freeze()로 힙을 고정해 워커들이 copy-on-write로 메모리를 공유하도록 합니다.
+마스터의 GC는 앱 로드 중에만 끄고 when_ready에서 다시 켭니다 (워커는 켜진 상태를 물려받음).
+워커는 gthread 방식으로 여러 요청을 동시에 처리하므로 LLM 응답을 기다리는 요청이 헬스 체크와 카탈로그 요청을 막지 않습니다.
+"""
+
+import gc
+import os
+
+bind = f"{os.environ.get('API_HOST', '0.0.0.0')}:{os.environ.get('SERVER_PORT', os.environ.get('API_PORT', '8080'))}"
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", "32"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "/app/logs/access.log")
+errorlog = os.environ.get("GUNICORN_ERROR_LOG", "/app/logs/error.log")
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+if preload_app:
+    # 앱 로드 중 GC가 객체를 해제하며 공유될 페이지에 빈 공간을 만들지 않도록 앱 로드가 끝날 때까지 GC를 끕니다.
+    gc.disable()
+
+
+def when_ready(server):
+    """마스터 준비 완료(첫 워커 fork 전): 로드한 객체를 고정한 뒤 마스터의 GC를 다시 켭니다."""
+    if preload_app:
+        gc.freeze()
+        gc.enable()
+
+
+def pre_fork(server, worker):
+    """워커 fork 직전: 이후 마스터에서 만든 객체까지 permanent generation으로 옮겨 워커의 GC가 건드리지 않게 합니다."""
+    if preload_app:
+        gc.freeze()
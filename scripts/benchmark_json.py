@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""JSON 인코더 벤치마크 스크립트
+
+응답 유형별(전체 목록, 검색, 페이지, 추천, 에러)로 ResponseHelper 응답 생성 시간을
+설치된 JSON 인코더(stdlib, orjson)와 출력 모드(compact, indent)별로 측정합니다.
+
+사용법:
+  python scripts/benchmark_json.py              # 응답 유형별 100회 반복
+  python scripts/benchmark_json.py <반복 횟수>
+"""
+import sys
+import os
+import json
+import timeit
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from flask import Flask
+from app.utils.data_loader import DataLoader
+from app.utils.json_encoder import orjson
+from app.utils.pagination import FieldColumns, PageRequest
+from app.utils.response_helper import ResponseHelper
+
+
+def build_cases(loader: DataLoader):
+    """응답 유형별 (이름, 응답 생성 함수) 목록을 만듭니다."""
+    drinks = loader.get_all_drinks()
+    recipes = loader.get_all_recipes()
+    drink_columns = FieldColumns(drinks)
+    whiskies = [drink for drink in drinks if "위스키" in str(drink.get("type", ""))]
+    recommendation = {
+        "recommendation": [
+            {"name": recipe.get("korean_name"), "tag": "계절", "reason": "상큼한 맛이 계절과 잘 어울립니다."}
+            for recipe in recipes[:3]
+        ]
+    }
+
+    return [
+        ("json_response /drink/all", lambda: ResponseHelper.json_response(drinks)),
+        ("json_response /recipe/all", lambda: ResponseHelper.json_response(recipes)),
+        ("search_response /drink/type=", lambda: ResponseHelper.search_response(whiskies, query="위스키")),
+        (
+            "page_response limit=50 fields=code,name",
+            lambda: ResponseHelper.page_response(drinks, PageRequest(limit=50, fields=["code", "name"]), drink_columns),
+        ),
+        (
+            "success_response 추천 (객체)",
+            lambda: ResponseHelper.success_response({"recommendation": recommendation}),
+        ),
+        # 이전 형식: 서비스에서 추천 결과를 JSON 문자열로 인코딩한 뒤 응답에서 다시 인코딩
+        (
+            "success_response 추천 (이중 인코딩)",
+            lambda: ResponseHelper.success_response(
+                {"recommendation": json.dumps(recommendation, ensure_ascii=False, indent=4)}
+            ),
+        ),
+        ("error_response", lambda: ResponseHelper.error_response("오류가 발생했습니다.", 500)),
+        ("validation_error_response", lambda: ResponseHelper.validation_error_response(["limit 오류", "fields 오류"])),
+    ]
+
+
+def main():
+    """JSON 인코더 벤치마크 메인 함수"""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    encoders = ["stdlib"] + (["orjson"] if orjson is not None else [])
+
+    loader = DataLoader()
+    cases = build_cases(loader)
+    app = Flask(__name__)
+
+    print("=" * 88)
+    print(f"JSON 인코더 벤치마크 (반복 {number}회, 단위: ms/응답)")
+    if orjson is None:
+        print("orjson이 설치되어 있지 않아 stdlib만 측정합니다.")
+    print("=" * 88)
+
+    columns = [f"{name}/{mode}" for name in encoders for mode in ("compact", "indent")]
+    print(f"{'응답 유형':<42}" + "".join(f"{column:>15}" for column in columns) + f"{'크기(B)':>12}")
+
+    for case_name, make_response in cases:
+        timings = []
+        size = 0
+        for encoder in encoders:
+            for compact in (True, False):
+                app.config.update(JSON_ENCODER=encoder, JSON_COMPACT=compact)
+                with app.app_context():
+                    elapsed = timeit.timeit(make_response, number=number)
+                    if compact:
+                        size = len(make_response().get_data())
+                timings.append(elapsed / number * 1000)
+        print(f"{case_name:<42}" + "".join(f"{timing:>15.3f}" for timing in timings) + f"{size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""카탈로그 스냅샷 생성 스크립트
+
+카탈로그 JSON 파일과 인덱스를 하나의 바이너리 스냅샷으로 컴파일합니다.
+워커는 시작 시 JSON을 다시 파싱하지 않고 스냅샷을 메모리 매핑으로 로드합니다.
+
+사용법:
+  python scripts/build_catalog_snapshot.py                 # app/data/catalog.snapshot 생성
+  python scripts/build_catalog_snapshot.py <output_path>   # 지정한 경로에 생성
+"""
+import sys
+import os
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.utils.catalog_snapshot import build_snapshot
+from app.utils.data_loader import DataLoader
+
+
+def main():
+    """카탈로그 스냅샷 생성 메인 함수"""
+    output_path = sys.argv[1] if len(sys.argv) > 1 else None
+
+    print("=" * 60)
+    print("MIXBY 카탈로그 스냅샷 생성 스크립트")
+    print("=" * 60)
+
+    start_time = time.time()
+
+    try:
+        # 기존 스냅샷이 아닌 JSON 원본에서 새로 파싱합니다.
+        path = build_snapshot(DataLoader(), output_path)
+
+        print()
+        print("=" * 60)
+        print("✓ 카탈로그 스냅샷 생성 완료!")
+        print("=" * 60)
+        print(f"  저장 위치: {path}")
+        print(f"  파일 크기: {os.path.getsize(path):,} bytes")
+        print(f"  소요 시간: {time.time() - start_time:.2f}초")
+        print()
+
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print("✗ 카탈로그 스냅샷 생성 실패!")
+        print("=" * 60)
+        print(f"  에러: {str(e)}")
+        print()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
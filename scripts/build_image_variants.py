@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""이미지 변형 생성 스크립트
+
+음료/레시피 원본 PNG 이미지의 크기 변형(64/128/256/512px, WebP/PNG)을 미리 만들어 둡니다.
+미리 만들지 않은 변형은 API 요청 시 만들어 저장하므로, 이 스크립트는 첫 요청 지연을 없애기 위한 용도입니다.
+
+사용법:
+  python scripts/build_image_variants.py                     # IMAGE_VARIANT_DIR에 모든 변형 생성
+  python scripts/build_image_variants.py --workers 4         # 프로세스 4개로 생성
+  python scripts/build_image_variants.py --formats webp      # WebP 변형만 생성
+"""
+import argparse
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import Config
+from app.utils.image_variants import Image, VARIANT_FORMATS, VARIANT_WIDTHS, file_hash, get_variant
+
+# 변형을 만들 원본 이미지 디렉토리
+SOURCE_DIRS = ("drinks", "recipes")
+
+
+def build_variants(source_path: str, variant_dir: str, formats: list) -> int:
+    """원본 이미지 하나의 모든 변형을 만들고 만든 변형 수를 반환합니다."""
+    source_hash = file_hash(source_path)
+    for width in VARIANT_WIDTHS:
+        for fmt in formats:
+            get_variant(source_path, width, fmt, variant_dir, source_hash)
+    return len(VARIANT_WIDTHS) * len(formats)
+
+
+def main():
+    """이미지 변형 생성 메인 함수"""
+    parser = argparse.ArgumentParser(description="이미지 크기 변형 생성")
+    parser.add_argument("--output", default=Config.IMAGE_VARIANT_DIR, help="변형 저장 디렉토리")
+    parser.add_argument("--formats", default=",".join(VARIANT_FORMATS), help="생성할 포맷 (쉼표로 구분)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="동시에 실행할 프로세스 수")
+    args = parser.parse_args()
+
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in VARIANT_FORMATS]
+
+    print("=" * 60)
+    print("MIXBY 이미지 변형 생성 스크립트")
+    print("=" * 60)
+
+    if Image is None:
+        print("❌ Pillow가 설치되어 있지 않습니다: pip install Pillow")
+        sys.exit(1)
+    if unknown:
+        print(f"❌ 지원하지 않는 포맷입니다: {', '.join(unknown)}")
+        sys.exit(1)
+
+    sources = []
+    for directory in SOURCE_DIRS:
+        source_dir = os.path.join(Config.STATIC_DIR, directory)
+        if os.path.isdir(source_dir):
+            sources.extend(
+                os.path.join(source_dir, filename) for filename in sorted(os.listdir(source_dir)) if filename.endswith(".png")
+            )
+
+    print(f"  원본 이미지: {len(sources)}개, 너비: {VARIANT_WIDTHS}, 포맷: {formats}")
+    start_time = time.time()
+
+    count = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(build_variants, path, args.output, formats): path for path in sources}
+        for future, path in futures.items():
+            try:
+                count += future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  ⚠️  {os.path.relpath(path, Config.STATIC_DIR)}: {e}")
+
+    print()
+    print("=" * 60)
+    print("✓ 이미지 변형 생성 완료!")
+    print("=" * 60)
+    print(f"  저장 위치: {args.output}")
+    print(f"  변형 수: {count}개 (실패한 원본 {failed}개)")
+    print(f"  소요 시간: {time.time() - start_time:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
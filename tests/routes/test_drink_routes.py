@@ -2,8 +2,11 @@
 DrinkRoutes 통합 테스트
 """
 
+import gzip
+import json
 import pytest
 from unittest.mock import patch, MagicMock
+from app.utils.pagination import encode_cursor
 
 
 class TestDrinkRoutes:
@@ -41,6 +44,56 @@ class TestDrinkRoutes:
             assert len(data) == 2
             assert data[0]["name"] == "Absolut Vodka"
 
+    def test_get_all_drinks_paginated(self, client):
+        """
+        GET /drink/all?limit=&fields= 엔드포인트 테스트
+        페이지 크기만큼 선택한 필드만 반환하고 다음 커서로 이어서 조회하는지 검증
+        """
+        # Given: 음료 데이터 3개
+        mock_drinks = [
+            {"code": "1", "name": "Absolut Vodka", "type": "Vodka", "description": "설명"},
+            {"code": "2", "name": "Absolut Citron", "type": "Vodka", "description": "설명"},
+            {"code": "3", "name": "Smirnoff Vodka", "type": "Vodka", "description": "설명"},
+        ]
+
+        with patch('app.services.drink_service.drink_service.get_all_drinks') as mock_get_all:
+            mock_get_all.return_value = mock_drinks
+
+            # When: 2개씩 code, name 필드만 요청
+            first = client.get('/drink/all?limit=2&fields=code,name').get_json()
+            second = client.get(f'/drink/all?limit=2&fields=code,name&cursor={first["next_cursor"]}').get_json()
+
+            # Then: 페이지별 결과와 전체 개수 반환
+            assert first["total_count"] == 3
+            assert first["results"] == [{"code": "1", "name": "Absolut Vodka"}, {"code": "2", "name": "Absolut Citron"}]
+            assert second["results"] == [{"code": "3", "name": "Smirnoff Vodka"}]
+            assert "next_cursor" not in second
+
+    def test_get_all_drinks_invalid_page_args(self, client):
+        """
+        GET /drink/all 잘못된 limit/fields 테스트
+        """
+        with patch('app.services.drink_service.drink_service.get_all_drinks') as mock_get_all:
+            mock_get_all.return_value = [{"code": "1", "name": "Absolut Vodka"}]
+
+            assert client.get('/drink/all?limit=0').status_code == 400
+            assert client.get('/drink/all?fields=code,unknown').status_code == 400
+
+    def test_get_all_drinks_stale_cursor(self, client):
+        """
+        GET /drink/all 데이터가 바뀐 뒤의 커서 테스트
+        """
+        # Given: 이전 데이터 버전에서 발급된 커서
+        with patch('app.services.drink_service.drink_service.get_all_drinks') as mock_get_all:
+            mock_get_all.return_value = [{"code": "1", "name": "Absolut Vodka"}]
+            cursor = encode_cursor(1, version="oldversion")
+
+            # When
+            response = client.get(f'/drink/all?limit=1&cursor={cursor}')
+
+            # Then: 만료된 커서로 400 반환
+            assert response.status_code == 400
+
     def test_get_drink_types(self, client):
         """
         GET /drink/types 엔드포인트 테스트
@@ -82,9 +135,10 @@ class TestDrinkRoutes:
             # When: /drink/code=0000088001159 엔드포인트 호출
             response = client.get('/drink/code=0000088001159')
 
-            # Then: 200 상태 코드와 음료 데이터 반환
+            # Then: 200 상태 코드와 음료 데이터, 해시 이미지 URL 반환
             assert response.status_code == 200
             data = response.get_json()
+            assert data.pop("image_url").startswith("/drink/image=0000088001159?v=")
             assert data == mock_drink
             assert data["code"] == "0000088001159"
             assert data["name"] == "Absolut Vodka"
@@ -185,6 +239,141 @@ class TestDrinkRoutes:
             assert all(drink["type"] == "Vodka" for drink in data["results"])
             mock_search.assert_called_once_with("Vodka")
 
+    def test_get_drinks_by_codes(self, client):
+        """
+        POST /drink/batch 엔드포인트 테스트
+        여러 코드를 한 번에 조회해 입력 순서대로 결과와 누락 코드를 반환하는지 검증
+        """
+        # Given: 첫 번째 코드만 존재함
+        mock_drink = {"code": "0000088001159", "name": "스카치블루 21년"}
+
+        with patch('app.services.drink_service.drink_service.lookup_by_codes') as mock_lookup:
+            mock_lookup.return_value = [mock_drink, None]
+
+            # When: 코드 2개로 일괄 조회
+            response = client.post('/drink/batch', json={"codes": ["0000088001159", "9999999999999"]})
+
+            # Then: 입력 순서대로 결과 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["results"] == [
+                {"code": "0000088001159", "item": mock_drink},
+                {"code": "9999999999999", "item": None},
+            ]
+            assert data["missing"] == ["9999999999999"]
+            mock_lookup.assert_called_once_with(["0000088001159", "9999999999999"])
+
+    def test_get_drinks_by_codes_invalid(self, client):
+        """
+        POST /drink/batch 잘못된 요청 테스트
+        """
+        assert client.post('/drink/batch', data="{", content_type="application/json").status_code == 400
+        assert client.post('/drink/batch', json={"codes": "0000088001159"}).status_code == 400
+        assert client.post('/drink/batch', json={"codes": ["1"] * 201}).status_code == 400
+
+    def test_get_drinks_by_code_prefix(self, client):
+        """
+        GET /drink/prefix=<prefix> 엔드포인트 테스트
+        바코드 prefix로 검색하면 해당 prefix의 음료들을 반환하는지 검증
+        """
+        # Given: 같은 제조사 prefix를 가진 음료들이 존재함
+        mock_drinks = [
+            {"code": "0000088001159", "name": "스카치블루 21년"},
+            {"code": "0000088001166", "name": "스카치블루 21년"}
+        ]
+
+        with patch('app.services.drink_service.drink_service.search_by_code_prefix') as mock_search:
+            mock_search.return_value = mock_drinks
+
+            # When: /drink/prefix=00000880 엔드포인트 호출
+            response = client.get('/drink/prefix=00000880')
+
+            # Then: 200 상태 코드와 검색 결과 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["total_count"] == 2
+            assert data["query"] == "00000880"
+            mock_search.assert_called_once_with("00000880")
+
+    def test_filter_drinks(self, client):
+        """
+        GET /drink/filter 엔드포인트 테스트
+        쿼리 파라미터를 파싱해 필터 조건으로 전달하고 패싯을 함께 반환하는지 검증
+        """
+        # Given: 필터 결과와 패싯
+        mock_drinks = [{"code": "0000088001159", "name": "스카치블루 21년", "type": "위스키"}]
+        mock_facets = {"type": [{"value": "위스키", "count": 1}], "baseCode": [{"value": "100", "count": 1}]}
+
+        with patch('app.services.drink_service.drink_service.filter_drinks') as mock_filter:
+            mock_filter.return_value = (mock_drinks, mock_facets)
+
+            # When: 여러 타입과 도수/용량 범위로 필터링
+            response = client.get('/drink/filter?type=위스키,진&base=100&abv_min=40&volume_max=750')
+
+            # Then: 200 상태 코드와 결과, 패싯 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["total_count"] == 1
+            assert data["facets"] == mock_facets
+            mock_filter.assert_called_once_with(
+                types=["위스키", "진"], bases=["100"], abv_min=40.0, abv_max=None, volume_min=None, volume_max=750.0
+            )
+
+    def test_filter_drinks_invalid_range(self, client):
+        """
+        GET /drink/filter 엔드포인트 테스트 (잘못된 범위 값)
+        숫자가 아닌 범위 값은 검증 에러를 반환하는지 검증
+        """
+        response = client.get('/drink/filter?abv_min=strong')
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["error_code"] == "VALIDATION_ERROR"
+
+    def test_export_drinks(self, client):
+        """
+        GET /drink/export 엔드포인트 테스트
+        전체 음료를 한 줄에 하나씩 NDJSON으로 스트리밍하는지 검증
+        """
+        # Given: 음료 데이터 2개
+        mock_drinks = [
+            {"code": "0000088001159", "name": "스카치블루 21년", "type": "위스키"},
+            {"code": "0000088001166", "name": "스카치블루 17년", "type": "위스키"},
+        ]
+
+        with patch('app.services.drink_service.drink_service.get_all_drinks') as mock_get_all:
+            mock_get_all.return_value = mock_drinks
+
+            # When: /drink/export 엔드포인트 호출
+            response = client.get('/drink/export?fields=code,name')
+
+            # Then: 선택한 필드만 한 줄씩 반환
+            assert response.status_code == 200
+            assert response.mimetype == "application/x-ndjson"
+            assert response.headers["X-Total-Count"] == "2"
+            lines = [json.loads(line) for line in response.data.decode("utf-8").splitlines()]
+            assert lines == [{"code": "0000088001159", "name": "스카치블루 21년"}, {"code": "0000088001166", "name": "스카치블루 17년"}]
+
+    def test_export_drinks_filtered_gzip(self, client):
+        """
+        GET /drink/export 필터/gzip 테스트
+        필터 파라미터를 filter_drinks로 전달하고 gzip을 허용하면 압축해 스트리밍하는지 검증
+        """
+        mock_drinks = [{"code": "0000088001159", "name": "스카치블루 21년", "type": "위스키"}]
+
+        with patch('app.services.drink_service.drink_service.filter_drinks') as mock_filter:
+            mock_filter.return_value = (mock_drinks, {})
+
+            # When: 타입 필터와 gzip 요청
+            response = client.get('/drink/export?type=위스키&abv_min=40', headers={"Accept-Encoding": "gzip"})
+
+            # Then: gzip으로 압축한 NDJSON 반환
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(response.data)) == mock_drinks[0]
+            mock_filter.assert_called_once_with(
+                types=["위스키"], bases=None, abv_min=40.0, abv_max=None, volume_min=None, volume_max=None
+            )
+
     def test_get_drink_image_exists(self, client):
         """
         GET /drink/image=<code> 엔드포인트 테스트 (이미지 존재)
@@ -193,18 +382,18 @@ class TestDrinkRoutes:
         # Given: 특정 코드의 이미지 파일이 존재함
         test_code = "0000088001159"
         
-        with patch('app.routes.drink_routes.os.path.exists') as mock_exists, \
-             patch('app.routes.drink_routes.send_from_directory') as mock_send:
+        with patch('app.utils.response_helper.response_helper.image_exists') as mock_exists, \
+             patch('app.utils.response_helper.response_helper.image_response') as mock_send:
             mock_exists.return_value = True
             mock_send.return_value = MagicMock()
 
             # When: /drink/image=0000088001159 엔드포인트 호출
             response = client.get(f'/drink/image={test_code}')
 
-            # Then: send_from_directory가 호출되어 이미지 반환
+            # Then: image_response가 호출되어 이미지 반환
             assert mock_exists.called
             assert mock_send.called
-            # send_from_directory의 두 번째 인자가 올바른 파일명인지 확인
+            # image_response의 두 번째 인자가 올바른 파일명인지 확인
             call_args = mock_send.call_args
             assert f"{test_code}.png" in str(call_args)
 
@@ -216,7 +405,7 @@ class TestDrinkRoutes:
         # Given: 특정 코드의 이미지 파일이 존재하지 않음
         test_code = "NONEXISTENT_CODE"
         
-        with patch('app.routes.drink_routes.os.path.exists') as mock_exists:
+        with patch('app.utils.response_helper.response_helper.image_exists') as mock_exists:
             mock_exists.return_value = False
 
             # When: /drink/image=NONEXISTENT_CODE 엔드포인트 호출
@@ -230,6 +419,95 @@ class TestDrinkRoutes:
             assert data["error_code"] == "NOT_FOUND"
             mock_exists.assert_called()
 
+    def test_get_drink_image_variant(self, app, client, tmp_path):
+        """
+        GET /drink/image=<code>?w= 엔드포인트 테스트
+        Accept에 따라 WebP/PNG 크기 변형을 반환하고 ETag로 재검증하는지 검증
+        """
+        # Given: 원본 이미지가 존재하는 음료 코드와 임시 변형 디렉토리
+        app.config["IMAGE_VARIANT_DIR"] = str(tmp_path)
+        test_code = "0000088001159"
+
+        # When: WebP를 허용하고 w=100 요청
+        response = client.get(f"/drink/image={test_code}?w=100", headers={"Accept": "image/webp,*/*"})
+        png_response = client.get(f"/drink/image={test_code}?w=100")
+
+        # Then: 128px WebP 변형 반환, PNG 변형은 다른 ETag
+        assert response.status_code == 200
+        assert response.mimetype == "image/webp"
+        assert "Accept" in response.headers["Vary"]
+        assert png_response.mimetype == "image/png"
+        assert png_response.headers["ETag"] != response.headers["ETag"]
+
+        # When: 같은 ETag로 재요청
+        revalidated = client.get(
+            f"/drink/image={test_code}?w=100",
+            headers={"Accept": "image/webp", "If-None-Match": response.headers["ETag"]},
+        )
+
+        # Then: 304 Not Modified
+        assert revalidated.status_code == 304
+
+    def test_get_drink_image_cached_immutable(self, app, client, tmp_path):
+        """
+        GET /drink/image=<code>?v= 엔드포인트 테스트 (이미지 캐시 사용)
+        원본 ETag를 v로 지정하면 원본과 크기 변형 모두 Cache-Control: immutable로 반환하는지 검증
+        """
+        from app.utils.image_cache import image_cache
+
+        # Given: 이미지 캐시를 사용하는 앱
+        image_cache.clear()
+        app.config.update(IMAGE_CACHE_ENABLED=True, IMAGE_VARIANT_DIR=str(tmp_path))
+        test_code = "0000088001159"
+
+        try:
+            # When: 원본 요청 후 ETag를 v로 지정해 원본/변형 요청
+            etag = client.get(f"/drink/image={test_code}").headers["ETag"].strip('"')
+            response = client.get(f"/drink/image={test_code}?v={etag}")
+            variant = client.get(f"/drink/image={test_code}?w=64&v={etag}", headers={"Accept": "image/webp"})
+            missing = client.get("/drink/image=NONEXISTENT_CODE")
+
+            # Then: 해시 URL은 immutable, 없는 이미지는 404
+            assert response.status_code == 200
+            assert response.cache_control.immutable
+            assert variant.mimetype == "image/webp"
+            assert variant.cache_control.immutable
+            assert missing.status_code == 404
+            assert len(image_cache) == 2
+        finally:
+            image_cache.clear()
+
+    def test_get_drink_image_url_is_immutable(self, client):
+        """
+        GET /drink/code=<code> 응답의 image_url이 Cache-Control: immutable로 응답되는 해시 URL인지 검증
+        """
+        # Given: 이미지가 있는 음료
+        test_code = "0000088001159"
+
+        with patch('app.services.drink_service.drink_service.search_by_code') as mock_search:
+            mock_search.return_value = {"code": test_code, "name": "Absolut Vodka"}
+
+            # When: 음료 조회 후 image_url로 이미지 요청
+            image_url = client.get(f"/drink/code={test_code}").get_json()["image_url"]
+            response = client.get(image_url)
+
+            # Then: 해시 URL은 immutable, v는 이미지 ETag와 같음
+            assert response.status_code == 200
+            assert response.cache_control.immutable
+            assert image_url.endswith(f"?v={response.headers['ETag'].strip(chr(34))}")
+
+    def test_get_drink_image_variant_invalid_width(self, client):
+        """
+        GET /drink/image=<code>?w= 입력 검증 테스트
+        w가 양의 정수가 아니면 400 에러를 반환하는지 검증
+        """
+        # When: w=abc 요청
+        response = client.get("/drink/image=0000088001159?w=abc")
+
+        # Then: 400 상태 코드
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
     def test_validation_errors(self, client):
         """
         입력 검증 테스트
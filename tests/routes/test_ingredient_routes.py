@@ -155,3 +155,20 @@ class TestIngredientRoutes:
         for ingredient in ingredients:
             code = ingredient["code"]
             assert code.isdigit(), f"재료 '{ingredient['name']}'의 코드 '{code}'가 숫자가 아닙니다"
+
+    def test_get_ingredients_by_codes(self, client):
+        """
+        POST /ingredient/batch 엔드포인트 테스트
+        재료 코드 목록을 조회해 선택한 필드만 입력 순서대로 반환하는지 검증
+        """
+        # Given: 실제 재료 데이터의 코드
+        codes = [ingredient["code"] for ingredient in client.get('/ingredient/all').get_json()["data"]["ingredients"][:2]]
+
+        # When: 없는 코드를 섞어 일괄 조회
+        response = client.post('/ingredient/batch?fields=code', json={"codes": [codes[1], "NONEXISTENT", codes[0]]})
+
+        # Then: 입력 순서대로 결과와 누락 코드 반환
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [result["item"] for result in data["results"]] == [{"code": codes[1]}, None, {"code": codes[0]}]
+        assert data["missing"] == ["NONEXISTENT"]
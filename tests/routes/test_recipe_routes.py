@@ -47,6 +47,41 @@ class TestRecipeRoutes:
             assert data["success"] is False
             assert "레시피 데이터를 가져오는 중 오류가 발생했습니다" in data["message"]
 
+    def test_export_recipes(self, client, sample_recipes_list):
+        """
+        GET /recipe/export 엔드포인트 테스트
+        검색어/난이도를 filter_recipes로 전달하고 결과를 NDJSON으로 스트리밍하는지 검증
+        """
+        with patch('app.services.recipe_service.recipe_service.filter_recipes') as mock_filter:
+            mock_filter.return_value = sample_recipes_list
+
+            # When: /recipe/export 엔드포인트 호출
+            response = client.get('/recipe/export?name=진&difficulty=쉬움')
+
+            # Then: 레시피가 한 줄에 하나씩 반환
+            assert response.status_code == 200
+            assert response.mimetype == "application/x-ndjson"
+            assert len(response.data.splitlines()) == len(sample_recipes_list)
+            mock_filter.assert_called_once_with(name="진", difficulty="쉬움")
+
+    def test_get_recipes_by_codes(self, client, sample_recipes_list):
+        """
+        POST /recipe/batch 엔드포인트 테스트
+        여러 코드로 레시피를 조회해 입력 순서대로 반환하는지 검증
+        """
+        with patch('app.services.recipe_service.recipe_service.lookup_by_codes') as mock_lookup:
+            mock_lookup.return_value = [None, sample_recipes_list[0]]
+
+            # When: 없는 코드와 있는 코드로 일괄 조회
+            response = client.post('/recipe/batch', json={"codes": ["NONE", "300600"]})
+
+            # Then: 입력 순서대로 결과 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["found_count"] == 1
+            assert data["results"][1]["item"]["korean_name"] == sample_recipes_list[0]["korean_name"]
+            assert data["missing"] == ["NONE"]
+
     def test_get_recipe_categories(self, client):
         """
         GET /recipe/categories 엔드포인트 테스트
@@ -102,7 +137,7 @@ class TestRecipeRoutes:
             # Then: 200 상태 코드와 레시피 데이터 반환
             assert response.status_code == 200
             data = response.get_json()
-            assert data == sample_recipe
+            assert data == {**sample_recipe, "image_url": None}
             assert data["korean_name"] == "테스트 칵테일"
             assert data["code"] == "TEST001"
 
@@ -200,7 +235,7 @@ class TestRecipeRoutes:
             # Then: 200 상태 코드와 레시피 데이터 반환
             assert response.status_code == 200
             data = response.get_json()
-            assert data == sample_recipe
+            assert data == {**sample_recipe, "image_url": None}
             assert data["code"] == "TEST001"
             assert data["korean_name"] == "테스트 칵테일"
             mock_search.assert_called_once_with("TEST001")
@@ -287,6 +322,77 @@ class TestRecipeRoutes:
             assert data["success"] is False
             assert "레시피 검색 중 오류가 발생했습니다" in data["message"]
 
+    def test_get_recipes_missing_ingredients(self, client, sample_recipes_list):
+        """
+        GET /recipe/with=<codes>/missing=<k> 엔드포인트 테스트
+        부족한 재료가 k개 이하인 레시피를 부족한 재료 정보와 함께 반환하는지 검증
+        """
+        # Given: 진만 보유한 경우 토닉워터 하나가 부족한 진토닉
+        search_results = [{"recipe": sample_recipes_list[0], "missing_count": 1, "missing_codes": ["600"]}]
+
+        with patch('app.services.recipe_service.recipe_service.search_by_missing_ingredients') as mock_search:
+            mock_search.return_value = search_results
+
+            # When: /recipe/with=300/missing=1 엔드포인트 호출
+            response = client.get('/recipe/with=300/missing=1')
+
+            # Then: 200 상태 코드와 검색 결과 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["total_count"] == 1
+            assert data["results"][0]["missing_codes"] == ["600"]
+            mock_search.assert_called_once_with("300", 1)
+
+    def test_get_recipes_missing_ingredients_too_many(self, client):
+        """
+        GET /recipe/with=<codes>/missing=<k> 엔드포인트 테스트 (허용 범위 초과)
+        k가 허용 범위를 넘으면 400 에러를 반환하는지 검증
+        """
+        # When: 허용 범위를 넘는 k로 호출
+        response = client.get('/recipe/with=300/missing=99')
+
+        # Then: 400 상태 코드와 검증 에러 반환
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["error_code"] == "VALIDATION_ERROR"
+
+    def test_get_next_ingredients(self, client):
+        """
+        GET /recipe/with=<codes>/next 엔드포인트 테스트
+        다음 구매 재료 추천 결과를 반환하는지 검증
+        """
+        # Given: 토닉워터를 사면 진토닉을 만들 수 있음
+        ranking = [{"code": "600", "name": "토닉워터", "unlocked_count": 1, "unlocked_recipes": []}]
+
+        with patch('app.services.recipe_service.recipe_service.rank_next_ingredients') as mock_rank:
+            mock_rank.return_value = ranking
+
+            # When: /recipe/with=300/next 엔드포인트 호출
+            response = client.get('/recipe/with=300/next')
+
+            # Then: 200 상태 코드와 추천 결과 반환
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["results"] == ranking
+            mock_rank.assert_called_once_with("300")
+
+    def test_get_ingredient_purchase_plan(self, client):
+        """
+        GET /recipe/with=<codes>/next=<n> 엔드포인트 테스트
+        구매 재료 조합 추천 결과를 반환하고 범위를 검증하는지 확인
+        """
+        with patch('app.services.recipe_service.recipe_service.plan_ingredient_purchase') as mock_plan:
+            mock_plan.return_value = []
+
+            # When: 정상 범위와 범위를 벗어난 n으로 호출
+            response = client.get('/recipe/with=300/next=3')
+            invalid_response = client.get('/recipe/with=300/next=0')
+
+            # Then: 정상 요청은 200, 범위를 벗어난 요청은 400 반환
+            assert response.status_code == 200
+            mock_plan.assert_called_once_with("300", 3)
+            assert invalid_response.status_code == 400
+
     def test_get_recipes_by_difficulty(self, client, sample_recipes_list):
         """
         GET /recipe/difficulty=<difficulty> 엔드포인트 테스트
@@ -340,7 +446,7 @@ class TestRecipeRoutes:
         test_code = "300600"
         
         with patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.send_from_directory') as mock_send:
             mock_search.return_value = sample_recipe
             mock_exists.return_value = True
@@ -410,7 +516,7 @@ class TestRecipeRoutes:
         
         # When: /recipe/image/code= 엔드포인트 호출 (빈 코드)
         # Flask는 빈 문자열을 URL 파라미터로 받을 수 있음
-        with patch('app.routes.recipe_routes.os.path.exists') as mock_exists:
+        with patch('os.path.exists') as mock_exists:
             # 빈 문자열은 입력 검증에서 걸러지므로 os.path.exists가 호출되지 않음
             response = client.get('/recipe/image/code=')
 
@@ -447,7 +553,7 @@ class TestRecipeRoutes:
         
         with patch('app.services.recipe_service.recipe_service.get_code_by_name') as mock_get_code, \
              patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.send_from_directory') as mock_send:
             mock_get_code.return_value = test_code
             mock_search.return_value = sample_recipe
@@ -516,7 +622,7 @@ class TestRecipeRoutes:
         
         with patch('app.services.recipe_service.recipe_service.get_code_by_name') as mock_get_code, \
              patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.send_from_directory') as mock_send:
             mock_get_code.return_value = test_code
             mock_search.return_value = sample_recipe
@@ -543,7 +649,7 @@ class TestRecipeRoutes:
         
         with patch('app.services.recipe_service.recipe_service.get_code_by_name') as mock_get_code, \
              patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.send_from_directory') as mock_send:
             mock_get_code.return_value = test_code
             mock_search.return_value = sample_recipe
@@ -579,6 +685,52 @@ class TestRecipeRoutes:
             assert data["success"] is False
             assert "이미지를 가져오는 중 오류가 발생했습니다" in data["message"]
 
+    def test_get_recipe_image_by_name_mapping(self, client):
+        """
+        GET /recipe/image/name=<name> 이미지 매핑 테스트
+        코드/한국어 이름/영어 이름(공백·하이픈 무관)이 모두 같은 이미지로 연결되는지 검증
+        """
+        # When: 같은 레시피를 코드와 여러 형태의 이름으로 요청
+        responses = [
+            client.get('/recipe/image/code=600207019'),
+            client.get('/recipe/image/name=애플 마티니'),
+            client.get('/recipe/image/name=apple martini'),
+            client.get('/recipe/image/name=Apple-Martini'),
+        ]
+
+        # Then: 모두 같은 이미지(ETag) 반환
+        assert [response.status_code for response in responses] == [200] * 4
+        assert len({response.headers["ETag"] for response in responses}) == 1
+        assert responses[0].mimetype == "image/png"
+
+    def test_get_recipe_by_code_image_url(self, client):
+        """
+        GET /recipe/code=<code> 응답의 image_url이 Cache-Control: immutable로 응답되는 해시 URL인지 검증
+        """
+        # When: 이미지가 있는 레시피 조회 후 image_url로 이미지 요청
+        image_url = client.get('/recipe/code=600207019').get_json()["image_url"]
+        response = client.get(image_url)
+
+        # Then
+        assert image_url.startswith('/recipe/image/code=600207019?v=')
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+
+    def test_get_recipe_image_by_name_partial_fallback(self, client):
+        """
+        GET /recipe/image/name=<name> 부분 일치 테스트
+        정확히 일치하는 이름이 없으면 부분 일치하는 첫 번째 레시피 이미지를, 없으면 404를 반환하는지 검증
+        """
+        # When: 부분 이름과 없는 이름으로 요청
+        partial = client.get('/recipe/image/name=Espresso')
+        missing = client.get('/recipe/image/name=존재하지않는칵테일')
+
+        # Then: 부분 일치 이미지 반환, 없는 이름은 404
+        assert partial.status_code == 200
+        assert partial.headers["ETag"] == client.get('/recipe/image/name=Espresso-Martini').headers["ETag"]
+        assert missing.status_code == 404
+        assert missing.get_json()["error_code"] == "RECIPE_NOT_FOUND"
+
 
 class TestSendRecipeImageHelper:
     """_send_recipe_image() 헬퍼 함수 테스트"""
@@ -593,7 +745,7 @@ class TestSendRecipeImageHelper:
         test_code = "300600"
         
         with patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.send_from_directory') as mock_send, \
              patch('app.routes.recipe_routes.current_app') as mock_app:
             mock_search.return_value = sample_recipe
@@ -647,7 +799,7 @@ class TestSendRecipeImageHelper:
         test_code = "MISSING_IMAGE"
         
         with patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.current_app') as mock_app:
             mock_search.return_value = sample_recipe
             mock_exists.return_value = False
@@ -698,7 +850,7 @@ class TestSendRecipeImageHelper:
         test_code = "TEST001"
         
         with patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.current_app') as mock_app:
             mock_search.return_value = sample_recipe
             mock_exists.side_effect = PermissionError("Permission denied")
@@ -725,7 +877,7 @@ class TestSendRecipeImageHelper:
         test_code = "TEST001"
         
         with patch('app.services.recipe_service.recipe_service.search_by_code') as mock_search, \
-             patch('app.routes.recipe_routes.os.path.exists') as mock_exists, \
+             patch('os.path.exists') as mock_exists, \
              patch('app.routes.recipe_routes.current_app') as mock_app:
             mock_search.return_value = sample_recipe
             mock_exists.side_effect = OSError("Disk I/O error")
@@ -2,6 +2,7 @@
 RecommendationRoutes 통합 테스트
 """
 
+import threading
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -504,3 +505,154 @@ class TestRecommendationRoutes:
         assert response.status_code == 400
         data = response.get_json()
         assert data["success"] is False
+
+    def test_recommendation_cache_enabled(self, app, client):
+        """
+        RECOMMENDATION_CACHE_ENABLED일 때 같은 입력의 추천이 캐시 pool에서 응답되는지 검증
+        """
+        # Given: 추천 결과 캐시 활성화 (백그라운드 보충 없이 pool 크기 1)
+        from app.utils.recommendation_cache import recommendation_cache
+
+        app.config["RECOMMENDATION_CACHE_ENABLED"] = True
+        recommendation_cache.clear()
+        pool_size = recommendation_cache.pool_size
+        recommendation_cache.pool_size = 1
+        request_body = {
+            'persona': '단맛을 선호하는 사용자',
+            'cocktail_list': ['진토닉', '모히토'],
+            'season': '가을',
+            'time': '저녁',
+            'weather': '눈'
+        }
+
+        try:
+            with patch('app.services.recommendation_service.RecommendationService.get_default_recommendation') as mock_recommend:
+                mock_recommend.return_value = {"recommendation": [{"name": "진토닉"}]}
+
+                # When: 같은 입력(칵테일 순서만 다름)으로 두 번 호출
+                first = client.post('/api/recommendations/default', json=request_body)
+                request_body['cocktail_list'] = ['모히토', '진토닉']
+                second = client.post('/api/recommendations/default', json=request_body)
+
+                # Then: 같은 결과, 서비스는 한 번만 호출
+                assert first.status_code == second.status_code == 200
+                assert second.get_json()["data"]["recommendation"] == {"recommendation": [{"name": "진토닉"}]}
+                mock_recommend.assert_called_once()
+        finally:
+            recommendation_cache.pool_size = pool_size
+            recommendation_cache.clear()
+
+    def test_generate_persona_cache_enabled(self, app, client, sample_user_data, sample_tasting_data):
+        """
+        PERSONA_CACHE_ENABLED일 때 페르소나 생성에 페르소나 캐시를 전달하는지 검증
+        """
+        # Given: 페르소나 캐시 활성화
+        from app.utils.persona_cache import persona_cache
+
+        app.config["PERSONA_CACHE_ENABLED"] = True
+
+        with patch('app.services.persona_service.PersonaService.generate_persona') as mock_generate:
+            mock_generate.return_value = "단맛을 선호하는 사용자"
+
+            # When: /api/recommendations/persona 엔드포인트 호출
+            response = client.post(
+                '/api/recommendations/persona',
+                json={'user_data': sample_user_data, 'tasting_data': sample_tasting_data}
+            )
+
+            # Then: 캐시와 함께 호출
+            assert response.status_code == 200
+            mock_generate.assert_called_once_with(sample_user_data, sample_tasting_data, persona_cache)
+
+    def test_recommendation_stream(self, client):
+        """
+        POST /api/recommendations/feeling?stream=true 엔드포인트 테스트
+        추천 항목을 Server-Sent Events로 스트리밍하는지 검증
+        """
+        # Given: 스트리밍 서비스 메서드 모킹
+        events = [
+            ("recommendation", {"name": "진토닉"}),
+            ("done", {"recommendation": [{"name": "진토닉"}]}),
+        ]
+
+        with patch('app.services.recommendation_service.RecommendationService.stream_recommendation',
+                   return_value=iter(events)) as mock_stream:
+            # When: stream=true로 호출
+            response = client.post(
+                '/api/recommendations/feeling?stream=true',
+                json={'persona': '단맛을 선호하는 사용자', 'cocktail_list': '진토닉, 모히토'}
+            )
+
+            # Then: text/event-stream으로 이벤트 순서대로 전달
+            assert response.status_code == 200
+            assert response.mimetype == "text/event-stream"
+            assert response.headers["Cache-Control"] == "no-cache"
+            body = response.get_data(as_text=True)
+            assert body == (
+                'event: recommendation\ndata: {"name":"진토닉"}\n\n'
+                'event: done\ndata: {"recommendation":[{"name":"진토닉"}]}\n\n'
+            )
+            mock_stream.assert_called_once_with('feeling', '단맛을 선호하는 사용자', '진토닉, 모히토')
+
+    def test_recommendation_stream_joins_in_flight_call(self, client):
+        """
+        같은 입력의 추천 호출이 진행 중이면 스트리밍 요청이 LLM을 호출하지 않고 그 결과를 재생하는지 검증
+        """
+        # Given: 같은 입력으로 진행 중인 추천 호출
+        from app.utils.recommendation_cache import make_recommendation_key
+        from app.utils.single_flight import single_flight
+
+        persona, cocktail_list = '단맛을 선호하는 사용자', '진토닉, 모히토'
+        result = {"recommendation": [{"name": "진토닉"}]}
+        flight_key = f"recommendation:{make_recommendation_key('feeling', persona, cocktail_list)}"
+        flight, leader = single_flight.start(flight_key)
+        finisher = threading.Timer(0.05, single_flight.finish, args=(flight_key, flight, result))
+        finisher.start()
+
+        with patch('app.services.recommendation_service.RecommendationService.stream_recommendation') as mock_stream:
+            # When: 같은 입력으로 스트리밍 요청
+            response = client.post(
+                '/api/recommendations/feeling?stream=true',
+                json={'persona': persona, 'cocktail_list': cocktail_list}
+            )
+            body = response.get_data(as_text=True)
+            finisher.join(5)
+
+            # Then: 진행 중인 호출의 결과를 같은 이벤트로 재생
+            assert leader is True
+            assert body == (
+                'event: recommendation\ndata: {"name":"진토닉"}\n\n'
+                'event: done\ndata: {"recommendation":[{"name":"진토닉"}]}\n\n'
+            )
+            mock_stream.assert_not_called()
+
+    def test_recommendation_stream_accept_header_and_cache(self, app, client):
+        """
+        Accept: text/event-stream 요청이 스트리밍되고, 캐시 결과가 있으면 LLM 없이 재생되는지 검증
+        """
+        # Given: 추천 결과 캐시 활성화 (pool 크기 1, 보충 없음)
+        from app.utils.recommendation_cache import recommendation_cache
+
+        app.config["RECOMMENDATION_CACHE_ENABLED"] = True
+        recommendation_cache.clear()
+        pool_size = recommendation_cache.pool_size
+        recommendation_cache.pool_size = 1
+        request_body = {'persona': '단맛을 선호하는 사용자', 'cocktail_list': ['진토닉']}
+        result = {"recommendation": [{"name": "진토닉"}]}
+
+        try:
+            with patch('app.services.recommendation_service.RecommendationService.stream_recommendation',
+                       return_value=iter([("recommendation", {"name": "진토닉"}), ("done", result)])) as mock_stream:
+                # When: 같은 요청을 두 번 스트리밍
+                headers = {"Accept": "text/event-stream"}
+                first = client.post('/api/recommendations/situation', json=request_body, headers=headers)
+                first_body = first.get_data(as_text=True)
+                second = client.post('/api/recommendations/situation', json=request_body, headers=headers)
+
+                # Then: 두 번째는 캐시에서 같은 이벤트 재생, 스트리밍 서비스는 한 번만 호출
+                assert first.mimetype == second.mimetype == "text/event-stream"
+                assert second.get_data(as_text=True) == first_body
+                mock_stream.assert_called_once()
+        finally:
+            recommendation_cache.pool_size = pool_size
+            recommendation_cache.clear()
@@ -32,6 +32,25 @@ class TestIngredientService:
             assert "name" in first_ingredient
             assert "code" in first_ingredient
 
+    def test_lookup_by_codes(self, ingredient_service):
+        """
+        Given: 존재하는 코드와 없는 코드가 섞여 있을 때
+        When: lookup_by_codes() 메서드를 호출하면
+        Then: 입력 순서대로 재료 또는 None이 반환되어야 함
+        """
+        # Given
+        first, second = ingredient_service.get_all_ingredients()[:2]
+
+        # When
+        result = ingredient_service.lookup_by_codes([second["code"], "NONEXISTENT", f" {first['code']} "])
+
+        # Then: 코드가 중복되면 search_by_code와 같은 레코드를 반환
+        assert result == [
+            ingredient_service.search_by_code(second["code"]),
+            None,
+            ingredient_service.search_by_code(first["code"]),
+        ]
+
     def test_get_ingredients_by_codes_valid(self, ingredient_service):
         """
         Given: 유효한 재료 코드들이 주어졌을 때
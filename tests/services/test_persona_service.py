@@ -223,3 +223,144 @@ class TestPersonaService:
         
         # 검증 - 에러 발생 시 기본 메시지 반환
         assert result == "페르소나 생성에 실패했습니다."
+
+    @patch('app.services.persona_service.OpenAI')
+    @patch('app.services.persona_service.RecipeService')
+    def test_generate_persona_prompt(self, mock_recipe_service, mock_openai, monkeypatch):
+        """페르소나 생성 요청에 사용자 정보와 테이스팅 칵테일이 포함되는지 테스트"""
+        # Given: 테이스팅 칵테일 정보와 OpenAI 응답 모킹
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        mock_recipe_service.return_value.search_by_code.return_value = {
+            "korean_name": "마티니",
+            "tag1": "드라이",
+            "tag2": "클래식"
+        }
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({"summary": "드라이한 칵테일을 선호합니다."})
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
+
+        service = PersonaService()
+        user_data = [{"name": "김철수", "gender": "남성", "favoriteTaste": "쓴맛"}]
+        tasting_data = [{"code": "002", "drinkDate": "2024-01-15", "eval": 4, "sweetness": 1, "sourness": 2, "alcohol": 5}]
+
+        # When: 페르소나 생성
+        result = service.generate_persona(user_data, tasting_data)
+
+        # Then: summary 반환, 사용자 정보가 프롬프트에 포함됨
+        assert result == "드라이한 칵테일을 선호합니다."
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        assert "김철수, 남성, 쓴맛" in messages[1]["content"][0]["text"]
+        assert "마티니" in messages[2]["content"][0]["text"]
+
+    @patch('app.services.persona_service.OpenAI')
+    @patch('app.services.persona_service.RecipeService')
+    def test_generate_persona_cached_and_incremental(self, mock_recipe_service, mock_openai, monkeypatch):
+        """페르소나 캐시: 같은 이력은 재사용하고, 추가된 테이스팅만 기존 요약과 함께 보내는지 테스트"""
+        # Given: 호출마다 다른 요약을 반환하는 OpenAI
+        from app.utils.persona_cache import PersonaCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        mock_recipe_service.return_value.search_by_code.side_effect = lambda code: {
+            "korean_name": f"칵테일{code}", "tag1": "상큼", "tag2": "가벼움"
+        }
+        summaries = iter(["첫 요약", "갱신된 요약"])
+
+        def create(**kwargs):
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = json.dumps({"summary": next(summaries)})
+            return response
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai.return_value = mock_client
+
+        service = PersonaService()
+        cache = PersonaCache()
+        user_data = [{"name": "김철수", "gender": "남성", "favoriteTaste": "쓴맛"}]
+        history = [{"code": str(code), "drinkDate": "2024-01-15", "eval": 4,
+                    "sweetness": 1, "sourness": 2, "alcohol": 5} for code in range(3)]
+
+        # When: 같은 이력 두 번, 테이스팅 하나가 추가된 이력 한 번
+        first = service.generate_persona(user_data, history[:2], cache)
+        repeated = service.generate_persona(user_data, history[:2], cache)
+        updated = service.generate_persona(user_data, history, cache)
+
+        # Then: 같은 이력은 캐시 사용, 추가 이력은 기존 요약 + 새 테이스팅만 전송
+        assert (first, repeated, updated) == ("첫 요약", "첫 요약", "갱신된 요약")
+        assert mock_client.chat.completions.create.call_count == 2
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        texts = [message["content"][0]["text"] for message in messages[1:]]
+        assert "첫 요약" in texts[1]
+        assert "칵테일2" in texts[2]
+        assert "칵테일0" not in texts[2]
+        assert service.generate_persona(user_data, history, cache) == "갱신된 요약"
+
+    @patch('app.services.persona_service.OpenAI')
+    @patch('app.services.persona_service.RecipeService')
+    def test_generate_persona_regenerated_after_incremental_limit(self, mock_recipe_service, mock_openai, monkeypatch):
+        """갱신으로만 반영한 테이스팅이 한도를 넘으면 전체 이력으로 다시 생성하는지 테스트"""
+        # Given: 갱신 한도 2
+        from app.utils.persona_cache import PersonaCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        mock_recipe_service.return_value.search_by_code.side_effect = lambda code: {
+            "korean_name": f"칵테일{code}", "tag1": "상큼", "tag2": "가벼움"
+        }
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({"summary": "요약"})
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
+
+        service = PersonaService()
+        cache = PersonaCache(max_incremental=2)
+        user_data = [{"name": "김철수", "gender": "남성", "favoriteTaste": "쓴맛"}]
+        history = [{"code": str(code), "drinkDate": "2024-01-15", "eval": 4,
+                    "sweetness": 1, "sourness": 2, "alcohol": 5} for code in range(6)]
+
+        def sent_history():
+            messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+            return [message["content"][0]["text"] for message in messages[1:]][-1]
+
+        # When / Then: 전체 생성 후 테이스팅 2개까지는 갱신
+        service.generate_persona(user_data, history[:1], cache)
+        service.generate_persona(user_data, history[:2], cache)
+        assert "칵테일0" not in sent_history()
+        service.generate_persona(user_data, history[:3], cache)
+        assert "칵테일0" not in sent_history()
+
+        # When / Then: 한도를 넘으면 전체 이력으로 다시 생성하고, 이후 다시 갱신
+        service.generate_persona(user_data, history[:4], cache)
+        assert "칵테일0" in sent_history()
+        service.generate_persona(user_data, history[:5], cache)
+        assert "칵테일0" not in sent_history()
+
+        # When / Then: 한 번에 한도보다 많이 추가된 경우도 전체 이력으로 생성
+        service.generate_persona(user_data, history[:5] + history[:3], cache)
+        assert "칵테일0" in sent_history()
+
+    @patch('app.services.persona_service.OpenAI')
+    @patch('app.services.persona_service.RecipeService')
+    def test_generate_persona_failure_not_cached(self, mock_recipe_service, mock_openai, monkeypatch):
+        """페르소나 생성 실패 결과는 캐시에 저장하지 않는지 테스트"""
+        # Given
+        from app.utils.persona_cache import PersonaCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        mock_recipe_service.return_value.search_by_code.return_value = None
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = Exception("API 호출 실패")
+        mock_openai.return_value = mock_client
+        cache = PersonaCache()
+
+        # When
+        result = PersonaService().generate_persona([{"name": "김철수"}], [], cache)
+
+        # Then
+        assert result == "페르소나 생성에 실패했습니다."
+        assert len(cache) == 0
@@ -217,6 +217,58 @@ class TestRecipeService:
             assert result_whitespace == []
             assert result_commas_only == []
 
+    def test_search_by_missing_ingredients(self, service, sample_recipes_list):
+        """부족한 재료가 k개 이하인 레시피를 부족한 수 순으로 반환하는지 테스트"""
+        # Given: 데이터 로더가 레시피 리스트를 반환하도록 모킹
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            # When: 럼과 토닉워터만 보유한 상태에서 1개까지 부족한 레시피 검색
+            result = service.search_by_missing_ingredients("500,600", 1)
+
+            # Then: 두 레시피 모두 1개씩 부족하며 카탈로그 순서를 유지함
+            assert [item["recipe"]["code"] for item in result] == ["300600", "500601"]
+            assert result[0]["missing_codes"] == ["300"]
+            assert result[1]["missing_codes"] == ["601"]
+            assert all(item["missing_count"] == 1 for item in result)
+
+    def test_search_by_missing_ingredients_ranked(self, service, sample_recipes_list):
+        """부족한 재료 수가 적은 레시피가 먼저 오는지 테스트"""
+        # Given: 데이터 로더가 레시피 리스트를 반환하도록 모킹
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            # When: 모히또 재료만 보유한 상태에서 2개까지 부족한 레시피 검색
+            result = service.search_by_missing_ingredients("500,601", 2)
+
+            # Then: 바로 만들 수 있는 모히또가 먼저, 진토닉이 다음에 옴
+            assert [item["recipe"]["code"] for item in result] == ["500601", "300600"]
+            assert [item["missing_count"] for item in result] == [0, 2]
+
+    def test_search_by_missing_ingredients_empty(self, service, sample_recipes_list):
+        """빈 재료 코드나 음수 k로 검색 시 빈 리스트를 반환하는지 테스트"""
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            assert service.search_by_missing_ingredients("", 1) == []
+            assert service.search_by_missing_ingredients("300", -1) == []
+
+    def test_rank_next_ingredients(self, service, sample_recipes_list):
+        """하나만 더 사면 만들 수 있는 레시피가 있는 재료를 추천하는지 테스트"""
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            # When: 진과 럼을 보유한 상태에서 다음 재료 추천
+            result = service.rank_next_ingredients("300,500")
+
+            # Then: 토닉워터와 탄산수가 각각 레시피 하나씩을 완성함
+            assert [item["code"] for item in result] == ["600", "601"]
+            assert result[0]["name"] == "토닉워터"
+            assert result[0]["unlocked_recipes"][0]["korean_name"] == "진토닉"
+
+    def test_plan_ingredient_purchase(self, service, sample_recipes_list):
+        """구매 재료 조합을 구매 순서대로 추천하는지 테스트"""
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            # When: 진만 보유한 상태에서 3개 구매 추천
+            result = service.plan_ingredient_purchase("300", 3)
+
+            # Then: 진토닉을 완성하는 토닉워터가 먼저, 이어서 모히또 재료가 추천됨
+            assert [item["code"] for item in result] == ["600", "500", "601"]
+            assert [item["unlocked_count"] for item in result] == [1, 0, 1]
+            assert service.plan_ingredient_purchase("", 2) == []
+
     def test_get_random_recipe(self, service, sample_recipes_list):
         """무작위 레시피를 반환하는지 테스트"""
         # Given: 데이터 로더가 레시피 리스트를 반환하도록 모킹
@@ -267,6 +319,26 @@ class TestRecipeService:
             assert result_medium[0]["korean_name"] == "모히또"
             assert result_invalid == []
 
+    def test_filter_recipes(self, service, sample_recipes_list):
+        """이름 검색어와 난이도를 조합해 필터링하는지 테스트"""
+        with patch.object(service.data_loader, 'get_all_recipes', return_value=sample_recipes_list):
+            # When/Then: 조건이 없으면 전체, 난이도만 지정하면 해당 난이도만 반환
+            assert service.filter_recipes() == sample_recipes_list
+            assert [recipe["korean_name"] for recipe in service.filter_recipes(difficulty="보통")] == ["모히또"]
+            assert service.filter_recipes(name="모히또", difficulty="쉬움") == []
+
+    def test_get_image_map(self, service):
+        """카탈로그의 모든 레시피 코드/이름이 이미지 파일로 매핑되는지 테스트"""
+        # When: 실제 카탈로그로 이미지 매핑 생성
+        image_map = service.get_image_map()
+
+        # Then: 이미지가 없는 레시피가 없고 코드/이름으로 같은 파일을 찾음
+        assert image_map.missing == []
+        assert len(image_map) == len(service.get_all_recipes())
+        assert image_map.resolve("Apple Martini") == image_map.resolve("애플 마티니") == "600207019"
+        assert image_map.filename("600207019") == "Apple-Martini.png"
+        assert service.get_image_map() is image_map
+
     def test_validate_recipe_data_valid(self, service):
         """유효한 레시피 데이터 검증 테스트"""
         # Given: 유효한 레시피 데이터와 빈 레시피 리스트
@@ -100,8 +100,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
         # RAG 관련 메서드 호출되지 않음
         assert service.rag_service is None
@@ -143,8 +142,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
         # RAG 검색이 3번 호출됨 (행복, 피곤, 화남)
         assert mock_rag_service_instance.search_cocktails.call_count == 3
@@ -170,8 +168,7 @@ class TestRecommendationService:
         result = service.get_feeling_recommendation(persona="테스트", cocktail_list="[]")
 
         # Then: 에러 메시지 반환
-        result_data = json.loads(result)
-        assert "error" in result_data
+        assert "error" in result
 
     def test_get_client_lazy_initialization(self, mocker, mock_openai_client):
         """OpenAI 클라이언트 지연 초기화 테스트"""
@@ -211,6 +208,36 @@ class TestRecommendationService:
         with pytest.raises(ValueError, match="OPENAI_API_KEY 환경 변수가 설정되지 않았습니다"):
             service._get_client()
 
+    def test_get_client_recreated_after_fork(self, mocker, mock_openai_client):
+        """fork된 프로세스에서는 OpenAI 클라이언트를 새로 생성하는지 테스트"""
+        # Given: 부모 프로세스에서 클라이언트 생성
+        mocker.patch("os.getenv", side_effect=lambda key, default="false": "test-key" if key == "OPENAI_API_KEY" else default)
+        openai_class = mocker.patch("app.services.recommendation_service.OpenAI")
+        service = RecommendationService()
+        service._get_client()
+
+        # When: 다른 pid(워커)에서 호출
+        mocker.patch("os.getpid", return_value=-1)
+        service._get_client()
+
+        # Then: 클라이언트가 다시 생성됨
+        assert openai_class.call_count == 2
+
+    def test_rag_service_created_lazily(self, mocker):
+        """RAG 서비스가 생성 시점이 아니라 처음 사용할 때 초기화되는지 테스트"""
+        # Given: USE_RAG=true
+        mocker.patch("os.getenv", side_effect=lambda key, default="false": "true" if key == "USE_RAG" else default)
+        mock_rag_service_class = MagicMock()
+        mocker.patch("app.services.rag_service.RAGService", mock_rag_service_class)
+
+        # When: RecommendationService 생성
+        service = RecommendationService()
+
+        # Then: 처음 접근할 때 한 번만 생성됨
+        mock_rag_service_class.assert_not_called()
+        assert service.rag_service is service.rag_service
+        mock_rag_service_class.assert_called_once()
+
     def test_get_default_recommendation(self, mocker, mock_openai_client):
         """기본 추천 테스트 (RAG 미사용)"""
         # Given
@@ -236,8 +263,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
     def test_get_default_recommendation_with_rag(self, mocker, mock_openai_client):
         """RAG 사용 기본 추천 테스트"""
@@ -282,8 +308,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
         # RAG 검색이 3번 호출됨 (계절, 시간, 날씨)
         assert mock_rag_service_instance.search_cocktails.call_count == 3
@@ -312,8 +337,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
     def test_get_situation_recommendation_with_rag(self, mocker, mock_openai_client):
         """RAG 사용 상황 추천 테스트"""
@@ -352,8 +376,7 @@ class TestRecommendationService:
 
         # Then: 추천 결과 반환
         assert result is not None
-        result_data = json.loads(result)
-        assert result_data["matched"] is True
+        assert result["matched"] is True
 
         # RAG 검색이 3번 호출됨 (바쁨, 한가, 여행)
         assert mock_rag_service_instance.search_cocktails.call_count == 3
@@ -362,3 +385,47 @@ class TestRecommendationService:
         call_args = mock_openai_client.chat.completions.create.call_args
         system_message = call_args.kwargs["messages"][0]["content"][0]["text"]
         assert "위 목록에 있는 칵테일 중에서만" in system_message
+
+    def test_stream_recommendation(self, mocker, mock_openai_client):
+        """스트리밍 추천이 항목이 완성될 때마다 이름을 매칭해 내보내고 마지막에 전체 결과를 내보내는지 테스트"""
+        # Given: 토큰 조각으로 나뉜 OpenAI 스트리밍 응답
+        mocker.patch("os.getenv", side_effect=lambda key, default="false": "test-key" if key == "OPENAI_API_KEY" else "false")
+        content = json.dumps({"recommendation": [{"name": "진토닉 칵테일", "reason": "상큼"}, {"name": "mojito", "reason": "청량"}]},
+                             ensure_ascii=False)
+        consumed = []
+
+        def chunks():
+            yield Mock(choices=[])
+            for start in range(0, len(content), 5):
+                consumed.append(start)
+                yield Mock(choices=[Mock(delta=Mock(content=content[start:start + 5]))])
+
+        mock_openai_client.chat.completions.create.return_value = chunks()
+        service = RecommendationService()
+        cocktail_list = json.dumps(["진토닉", "Mojito"])
+
+        # When
+        events = service.stream_recommendation("feeling", "테스트 페르소나", cocktail_list)
+        first_event = next(events)
+        consumed_at_first = len(consumed)
+        remaining = list(events)
+
+        # Then: 첫 항목은 스트림이 끝나기 전에 매칭된 이름으로 전달
+        assert first_event == ("recommendation", {"name": "진토닉", "reason": "상큼"})
+        assert consumed_at_first < len(range(0, len(content), 5))
+        assert remaining[0] == ("recommendation", {"name": "Mojito", "reason": "청량"})
+        assert remaining[-1] == ("done", {"recommendation": [{"name": "진토닉", "reason": "상큼"},
+                                                              {"name": "Mojito", "reason": "청량"}]})
+        assert mock_openai_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_stream_recommendation_error(self, mocker):
+        """스트리밍 추천에서 OpenAI 호출 실패 시 error 이벤트 하나를 내보내는지 테스트"""
+        # Given: API 키 없음
+        mocker.patch("os.getenv", side_effect=lambda key, default="false": None if key == "OPENAI_API_KEY" else default)
+        service = RecommendationService()
+
+        # When
+        events = list(service.stream_recommendation("situation", "테스트", "[]"))
+
+        # Then
+        assert events == [("error", {"error": "추천 생성에 실패했습니다."})]
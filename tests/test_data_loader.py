@@ -75,7 +75,57 @@ def test_clear_cache(data_loader):
     assert len(data_loader._cache) == 0
 
 
+def test_reload_data_swaps_version(data_loader):
+    """다시 로드하면 기존 데이터는 유지한 채 새 버전으로 교체되는지 테스트합니다."""
+    from app.utils.catalog import catalog
+
+    # Given: 기존 데이터
+    old_recipes = data_loader.get_all_recipes()
+    old_version = data_loader.version
+
+    # When: 데이터 리로드
+    new_version = data_loader.reload_data()
+
+    # Then: 새 리스트로 교체되고 버전이 증가하며, 새 인덱스가 미리 만들어져 있음
+    new_recipes = data_loader.get_all_recipes()
+    assert new_version == old_version + 1
+    assert new_recipes is not old_recipes
+    assert new_recipes == old_recipes
+    assert catalog.recipes(new_recipes).is_built_from(new_recipes)
+
+
+def test_reload_single_file(data_loader):
+    """특정 파일만 다시 로드하면 나머지 데이터는 그대로 유지되는지 테스트합니다."""
+    drinks = data_loader.get_all_drinks()
+    recipes = data_loader.get_all_recipes()
+
+    data_loader.reload_data("allRecipes.json")
+
+    assert data_loader.get_all_drinks() is drinks
+    assert data_loader.get_all_recipes() is not recipes
+
+
+def test_get_validators(data_loader):
+    """원본 파일 fingerprint와 최종 수정 시각을 버전별로 반환하는지 테스트합니다."""
+    fingerprint, last_modified = data_loader.get_validators()
+
+    # 같은 데이터면 다른 DataLoader 인스턴스(워커)에서도 같은 fingerprint
+    assert DataLoader().get_validators()[0] == fingerprint
+    assert last_modified is not None
+    assert data_loader.get_validators() == (fingerprint, last_modified)
+
+
 def test_file_not_found_error(data_loader):
     """존재하지 않는 파일을 로드할 때 에러가 발생하는지 테스트합니다."""
     with pytest.raises(FileNotFoundError):
         data_loader.load_json("nonexistent_file.json")
+
+
+def test_preload(data_loader):
+    """카탈로그 JSON 파일을 모두 미리 로드하는 기능을 테스트합니다."""
+    loaded = data_loader.preload()
+
+    assert "allProducts.json" in loaded
+    assert "allRecipes.json" in loaded
+    # 미리 로드한 데이터는 캐시에서 그대로 반환됨
+    assert data_loader.get_all_recipes() is data_loader.load_json("allRecipes.json")
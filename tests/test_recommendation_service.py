@@ -27,7 +27,7 @@ class TestRecommendationService:
             "테스트 페르소나", "진토닉, 마티니", "가을", "저녁", "맑음"
         )
         
-        assert "matched" in result
+        assert result == {"recommendation": "matched"}
         mock_openai.return_value.chat.completions.create.assert_called_once()
         mock_matcher.assert_called_once()
     
@@ -43,4 +43,4 @@ class TestRecommendationService:
         )
         
         assert "error" in result
-        assert "추천 생성에 실패했습니다" in result
\ No newline at end of file
+        assert "추천 생성에 실패했습니다" in result["error"]
\ No newline at end of file
@@ -39,6 +39,25 @@ def test_validate_code_invalid():
     assert "형식이 올바르지 않습니다" in errors[0]
 
 
+def test_validate_code_list_valid():
+    """유효한 코드 목록 검증 테스트 (형식이 다른 개별 코드는 허용)"""
+    errors = InputValidator.validate_code_list(["300", 600, "test@#$"])
+    assert len(errors) == 0
+
+
+@pytest.mark.parametrize("codes", [None, [], "300,600", [{"code": "300"}], [True]])
+def test_validate_code_list_invalid(codes):
+    """리스트가 아니거나 비어 있거나 항목 타입이 잘못된 코드 목록 검증 테스트"""
+    errors = InputValidator.validate_code_list(codes)
+    assert len(errors) > 0
+
+
+def test_validate_code_list_too_many():
+    """최대 개수를 넘는 코드 목록 검증 테스트"""
+    errors = InputValidator.validate_code_list(["300"] * 3, max_items=2)
+    assert "최대 2개" in errors[0]
+
+
 def test_validate_coordinates_valid():
     """유효한 좌표 검증 테스트"""
     errors = InputValidator.validate_coordinates(37.5665, 126.9780)
@@ -0,0 +1,58 @@
+"""
+BarcodeIndex 유틸리티 테스트
+"""
+
+import pytest
+from app.utils.barcode_index import BarcodeIndex
+
+
+@pytest.fixture
+def drinks():
+    """테스트용 음료 리스트 (카탈로그 순서가 바코드 정렬 순서와 다름)"""
+    return [
+        {"code": "8801234000999", "name": "C"},
+        {"code": "8801234000111", "name": "A"},
+        {"code": " 8801234000555 ", "name": "B"},
+        {"code": "8809999000111", "name": "D"},
+        {"code": "123", "name": "짧은 코드"},
+        {"code": 8801234000777, "name": "숫자 코드"},
+    ]
+
+
+class TestBarcodeIndex:
+    """BarcodeIndex 클래스 테스트"""
+
+    def test_lookup_exact_match(self, drinks):
+        """정확히 일치하는 바코드를 우선 반환하는지 테스트"""
+        index = BarcodeIndex(drinks)
+
+        assert index.lookup("8801234000111")["name"] == "A"
+        assert index.lookup("8801234000555")["name"] == "B"
+        assert index.lookup("123")["name"] == "짧은 코드"
+
+    def test_lookup_fallback_returns_first_in_catalog_order(self, drinks):
+        """뒤 3자리가 다른 바코드는 카탈로그 순서상 첫 번째 레코드를 반환하는지 테스트"""
+        index = BarcodeIndex(drinks)
+
+        assert index.lookup("8801234000000")["name"] == "C"
+
+    def test_lookup_fallback_requires_same_length(self, drinks):
+        """prefix가 같아도 길이가 다르면 일치하지 않는지 테스트"""
+        index = BarcodeIndex(drinks)
+
+        assert index.lookup("88012340001") is None
+        assert index.lookup("12") is None
+        assert index.lookup("") is None
+        assert index.lookup(None) is None
+
+    def test_search_prefix(self, drinks):
+        """prefix로 시작하는 모든 레코드를 카탈로그 순서로 반환하는지 테스트"""
+        index = BarcodeIndex(drinks)
+
+        results = index.search_prefix("8801234")
+
+        assert [drink["name"] for drink in results] == ["C", "A", "B"]
+        assert [drink["name"] for drink in index.search_prefix("880123400099")] == ["C"]
+        assert [drink["name"] for drink in index.search_prefix("8809")] == ["D"]
+        assert index.search_prefix("77") == []
+        assert index.search_prefix("") == []
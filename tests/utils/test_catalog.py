@@ -0,0 +1,149 @@
+"""
+Catalog 유틸리티 테스트
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from app.utils.catalog import Catalog, RecordIndex, normalize_name
+
+
+class TestRecordIndex:
+    """RecordIndex 클래스 테스트"""
+
+    def test_get_by_code(self, sample_recipes_list):
+        """코드로 레코드를 찾는지 테스트"""
+        # Given: 레시피 리스트로 만든 인덱스
+        index = RecordIndex(sample_recipes_list, name_fields=("korean_name", "english_name"))
+
+        # When/Then: 코드로 조회하면 해당 레코드가 반환됨
+        assert index.get("300600") is sample_recipes_list[0]
+        assert index.get("999999") is None
+        assert index.get(None) is None
+
+    def test_duplicate_code_keeps_first(self):
+        """중복 코드는 카탈로그 순서상 첫 번째 레코드를 유지하는지 테스트"""
+        # Given: 같은 코드를 가진 재료들
+        ingredients = [{"name": "위스키", "code": "100"}, {"name": "버번 위스키", "code": "100"}]
+        index = RecordIndex(ingredients)
+
+        # When/Then: 첫 번째 레코드가 반환됨
+        assert index.get("100")["name"] == "위스키"
+
+    def test_get_many_keeps_input_order(self, sample_ingredients_list):
+        """여러 코드 조회 시 입력 순서를 유지하고 없는 코드는 건너뛰는지 테스트"""
+        # Given: 재료 인덱스
+        index = RecordIndex(sample_ingredients_list)
+
+        # When: 여러 코드로 조회
+        results = index.get_many(["600", "999", "300"])
+
+        # Then: 입력 순서대로 존재하는 재료만 반환됨
+        assert [item["code"] for item in results] == ["600", "300"]
+
+    def test_get_by_name_normalized(self, sample_recipes_list):
+        """정규화된 이름으로 레코드를 찾는지 테스트"""
+        # Given: 레시피 인덱스
+        index = RecordIndex(sample_recipes_list, name_fields=("korean_name", "english_name"))
+
+        # When/Then: 대소문자와 공백에 관계없이 찾음
+        assert index.get_by_name("  gin TONIC ")["code"] == "300600"
+        assert index.get_by_name("모히또")["code"] == "500601"
+        assert index.get_by_name("") is None
+
+    def test_normalize_name_non_string(self):
+        """문자열이 아닌 값은 빈 문자열로 정규화되는지 테스트"""
+        assert normalize_name(None) == ""
+        assert normalize_name(123) == ""
+        assert normalize_name(" Mojito ") == "mojito"
+
+
+class TestCatalog:
+    """Catalog 클래스 테스트"""
+
+    @pytest.fixture
+    def catalog(self):
+        """Catalog 인스턴스 fixture"""
+        return Catalog()
+
+    def test_index_reused_for_same_records(self, catalog, sample_recipes_list):
+        """같은 레코드 리스트에 대해 인덱스를 재사용하는지 테스트"""
+        # When: 같은 리스트로 두 번 조회
+        first = catalog.recipes(sample_recipes_list)
+        second = catalog.recipes(sample_recipes_list)
+
+        # Then: 같은 인덱스 객체가 반환됨
+        assert first is second
+
+    def test_index_rebuilt_for_new_records(self, catalog, sample_recipes_list):
+        """레코드 리스트가 바뀌면 인덱스를 새로 만드는지 테스트"""
+        # Given: 기존 리스트로 만든 인덱스
+        first = catalog.recipes(sample_recipes_list)
+
+        # When: 다시 로드된 (새) 리스트로 조회
+        reloaded = list(sample_recipes_list)
+        second = catalog.recipes(reloaded)
+
+        # Then: 새 인덱스가 만들어짐
+        assert first is not second
+        assert second.get("500601") is reloaded[1]
+
+    def test_challenge_index_uses_id(self, catalog):
+        """챌린지 인덱스가 id 필드를 문자열 키로 사용하는지 테스트"""
+        # Given: id 필드를 가진 챌린지 리스트
+        challenges = [{"id": 1, "title": "첫 챌린지"}, {"id": 2, "title": "두 번째 챌린지"}]
+
+        # When: 인덱스 생성
+        index = catalog.challenges(challenges)
+
+        # Then: 문자열/정수 ID 모두로 조회 가능
+        assert index.get("2")["title"] == "두 번째 챌린지"
+        assert index.get(1)["title"] == "첫 챌린지"
+
+    def test_challenge_search_prefers_title(self, catalog):
+        """챌린지 검색이 title이 있으면 title만, 없으면 name을 검색하는지 테스트"""
+        # Given: title이 있는 챌린지와 name만 있는 챌린지
+        challenges = [{"id": 1, "title": "첫 챌린지", "name": "칵테일 입문"}, {"id": 2, "name": "칵테일 마스터"}]
+
+        # When
+        index = catalog.challenges(challenges)
+
+        # Then: 기존 제목 검색과 같이 title이 있는 챌린지는 name으로 검색되지 않음
+        assert [challenge["id"] for challenge in index.search("칵테일")] == [2]
+        assert [challenge["id"] for challenge in index.search("첫")] == [1]
+
+    def test_staged_index_used_for_new_records(self, catalog, sample_recipes_list):
+        """stage된 인덱스는 새 데이터에만 사용되고 기존 데이터는 기존 인덱스를 유지하는지 테스트"""
+        # Given: 기존 인덱스와 새 데이터용으로 stage된 인덱스
+        current = catalog.recipes(sample_recipes_list)
+        reloaded = list(sample_recipes_list)
+        staged = RecordIndex(reloaded, name_fields=("korean_name", "english_name"))
+        catalog.stage({"recipes": staged})
+
+        # When/Then: 교체 중에는 데이터에 맞는 인덱스를 다시 만들지 않고 반환
+        assert catalog.recipes(sample_recipes_list) is current
+        assert catalog.recipes(reloaded) is staged
+
+        # When/Then: install 후에는 새 인덱스가 기본값이 됨
+        catalog.install({"recipes": staged})
+        assert catalog.recipes(reloaded) is staged
+
+    def test_stale_records_after_install_keep_installed_index(self, sample_recipes_list):
+        """install 후 이전 데이터로 요청해도 등록된 인덱스와 파생 구조를 덮어쓰지 않는지 테스트"""
+        # Given: 새 데이터를 반환하는 loader와, 파생 구조까지 만들어 등록한 새 인덱스
+        reloaded = list(sample_recipes_list)
+        loader = MagicMock()
+        loader.get_all_recipes.return_value = reloaded
+        catalog = Catalog(loader)
+        catalog.recipes(sample_recipes_list)
+        installed = RecordIndex(reloaded, name_fields=("korean_name", "english_name"))
+        text_index = installed.get_text_index()
+        catalog.install({"recipes": installed})
+
+        # When: 교체 직전 리스트를 읽은 요청이 인덱스를 요청
+        stale = catalog.recipes(sample_recipes_list)
+
+        # Then: 이전 데이터의 인덱스는 이번 요청에만 사용하고, 등록된 인덱스는 그대로 유지
+        assert stale is not installed
+        assert stale.is_built_from(sample_recipes_list)
+        assert catalog.recipes(reloaded) is installed
+        assert catalog.recipes(reloaded).get_text_index() is text_index
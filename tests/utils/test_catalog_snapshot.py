@@ -0,0 +1,96 @@
+"""
+카탈로그 스냅샷 유틸리티 테스트
+"""
+
+import json
+import pytest
+from app.utils.catalog import catalog
+from app.utils.catalog_snapshot import build_snapshot, read_snapshot
+from app.utils.data_loader import DataLoader
+from app.utils.recipe_images import RecipeImageMap
+
+
+@pytest.fixture
+def data_dir(tmp_path, sample_recipes_list, sample_ingredients_list, sample_challenges_list):
+    """테스트용 카탈로그 JSON 파일이 있는 데이터 디렉토리"""
+    files = {
+        "allProducts.json": [{"code": "8801234000111", "name": "테스트 진", "type": "진"}],
+        "allIngredients.json": sample_ingredients_list,
+        "allRecipes.json": sample_recipes_list,
+        "allChallenges.json": sample_challenges_list,
+    }
+    for filename, data in files.items():
+        (tmp_path / filename).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return tmp_path
+
+
+class TestCatalogSnapshot:
+    """카탈로그 스냅샷 생성/로드 테스트"""
+
+    def test_build_and_load_snapshot(self, data_dir):
+        """스냅샷으로 로드한 데이터와 인덱스가 JSON 원본과 같은지 테스트"""
+        # Given: JSON 원본으로 스냅샷 생성
+        path = build_snapshot(DataLoader(str(data_dir)))
+
+        # When: 새 DataLoader로 스냅샷 로드
+        loader = DataLoader(str(data_dir))
+        loaded = loader.load_snapshot(path)
+
+        # Then: 데이터가 캐시에 들어가고 미리 만든 인덱스가 그대로 사용됨
+        assert loaded is True
+        recipes = loader.get_all_recipes()
+        assert recipes == json.loads((data_dir / "allRecipes.json").read_text(encoding="utf-8"))
+        index = catalog.recipes(recipes)
+        assert index.records is recipes
+        assert index.get("500601")["korean_name"] == "모히또"
+        assert [recipe["code"] for recipe in index.search("토닉")] == ["300600"]
+
+    def test_image_map_not_in_snapshot(self, data_dir, tmp_path, monkeypatch):
+        """레시피 이미지 매핑은 스냅샷에 넣지 않고, 로드 후 현재 이미지 디렉토리로 다시 만드는지 테스트"""
+        # Given: 이미지가 없는 상태에서 이미지 매핑까지 만든 스냅샷
+        image_dir = tmp_path / "images"
+        image_dir.mkdir()
+        monkeypatch.setattr(RecipeImageMap, "default_directory", str(image_dir))
+        path = build_snapshot(DataLoader(str(data_dir)))
+
+        # When: 스냅샷 생성 후 이미지 추가, 스냅샷 로드
+        (image_dir / "Mojito.png").write_bytes(b"png")
+        snapshot = read_snapshot(path, str(data_dir))
+        recipes = snapshot["indexes"]["recipes"]
+
+        # Then: 스냅샷에는 이미지 매핑이 없고, 다시 만든 매핑은 추가된 이미지를 사용
+        assert "images" not in recipes._derived
+        assert "text" in recipes._derived
+        assert recipes.get_derived("images", RecipeImageMap).filename("500601") == "Mojito.png"
+
+    def test_stale_snapshot_falls_back(self, data_dir):
+        """원본 JSON이 바뀌면 스냅샷을 사용하지 않는지 테스트"""
+        # Given: 스냅샷 생성 후 원본 변경
+        path = build_snapshot(DataLoader(str(data_dir)))
+        (data_dir / "allRecipes.json").write_text("[]", encoding="utf-8")
+
+        # When: 스냅샷 로드 시도
+        loader = DataLoader(str(data_dir))
+
+        # Then: 로드하지 않고 JSON 원본을 사용함
+        assert loader.load_snapshot(path) is False
+        assert loader.get_all_recipes() == []
+
+    def test_corrupted_snapshot_falls_back(self, data_dir):
+        """체크섬이 맞지 않는 스냅샷은 사용하지 않는지 테스트"""
+        # Given: payload 마지막 바이트가 손상된 스냅샷
+        path = build_snapshot(DataLoader(str(data_dir)))
+        with open(path, "r+b") as snapshot_file:
+            snapshot_file.seek(-1, 2)
+            last = snapshot_file.read(1)
+            snapshot_file.seek(-1, 2)
+            snapshot_file.write(bytes([last[0] ^ 0xFF]))
+
+        # When/Then: 읽기 실패로 None 반환
+        assert read_snapshot(path, str(data_dir)) is None
+
+    def test_missing_snapshot(self, data_dir):
+        """스냅샷 파일이 없으면 False를 반환하는지 테스트"""
+        loader = DataLoader(str(data_dir))
+
+        assert loader.load_snapshot(str(data_dir / "missing.snapshot")) is False
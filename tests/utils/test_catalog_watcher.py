@@ -0,0 +1,66 @@
+"""
+카탈로그 파일 감시 유틸리티 테스트
+"""
+
+import json
+import os
+import pytest
+from app.utils.catalog_watcher import CatalogWatcher
+from app.utils.data_loader import DataLoader
+
+
+@pytest.fixture
+def data_dir(tmp_path, sample_recipes_list, sample_ingredients_list, sample_challenges_list):
+    """테스트용 카탈로그 JSON 파일이 있는 데이터 디렉토리"""
+    files = {
+        "allProducts.json": [{"code": "8801234000111", "name": "테스트 진"}],
+        "allIngredients.json": sample_ingredients_list,
+        "allRecipes.json": sample_recipes_list,
+        "allChallenges.json": sample_challenges_list,
+    }
+    for filename, data in files.items():
+        (tmp_path / filename).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return tmp_path
+
+
+class TestCatalogWatcher:
+    """CatalogWatcher 클래스 테스트"""
+
+    def test_check_without_changes(self, data_dir):
+        """파일이 바뀌지 않으면 다시 로드하지 않는지 테스트"""
+        loader = DataLoader(str(data_dir))
+        watcher = CatalogWatcher(loader, interval=1)
+
+        assert watcher.check() is False
+        assert loader.version == 0
+
+    def test_check_reloads_changed_file(self, data_dir):
+        """파일이 바뀌면 새 데이터로 교체하는지 테스트"""
+        # Given: 데이터를 로드한 상태에서 감시 시작
+        loader = DataLoader(str(data_dir))
+        assert len(loader.get_all_recipes()) == 2
+        watcher = CatalogWatcher(loader, interval=1)
+
+        # When: 레시피 파일 변경
+        recipes_path = data_dir / "allRecipes.json"
+        recipes_path.write_text(json.dumps([{"code": "1", "korean_name": "새 레시피"}]), encoding="utf-8")
+        stat = os.stat(recipes_path)
+        os.utime(recipes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Then: 새 데이터로 교체되고 버전이 증가함
+        assert watcher.check() is True
+        assert loader.version == 1
+        assert [recipe["korean_name"] for recipe in loader.get_all_recipes()] == ["새 레시피"]
+        assert watcher.check() is False
+
+    def test_invalid_file_keeps_current_data(self, data_dir):
+        """파싱할 수 없는 파일로 바뀌면 기존 데이터를 유지하는지 테스트"""
+        loader = DataLoader(str(data_dir))
+        recipes = loader.get_all_recipes()
+        watcher = CatalogWatcher(loader, interval=1)
+
+        (data_dir / "allRecipes.json").write_text("[{", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            watcher.check()
+        assert loader.get_all_recipes() is recipes
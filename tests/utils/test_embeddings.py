@@ -2,6 +2,8 @@
 EmbeddingGenerator 유틸리티 테스트
 """
 
+import threading
+import time
 import pytest
 from unittest.mock import Mock, MagicMock
 from app.utils.embeddings import EmbeddingGenerator
@@ -193,6 +195,35 @@ class TestEmbeddingGenerator:
         assert result1 == result2
         assert mock_client.embeddings.create.call_count == 1
 
+    def test_generate_cached_concurrent_miss_coalesced(self, mocker):
+        """같은 쿼리의 동시 캐시 미스가 API 호출 하나로 병합되는지 테스트"""
+        # Given: 응답이 느린 API
+        mocker.patch("os.getenv", return_value="test-api-key")
+
+        def slow_create(**kwargs):
+            time.sleep(0.2)
+            return Mock(data=[Mock(embedding=[0.1, 0.2, 0.3])])
+
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = slow_create
+        mocker.patch("app.utils.embeddings.OpenAI", return_value=mock_client)
+
+        generator = EmbeddingGenerator()
+        results = []
+
+        # When: 5개 스레드에서 같은 쿼리 동시 호출
+        threads = [threading.Thread(target=lambda: results.append(generator.generate_cached("행복")))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        # Then: API 호출 1번, 모두 같은 결과
+        assert mock_client.embeddings.create.call_count == 1
+        assert results == [[0.1, 0.2, 0.3]] * 5
+        assert len(generator._cache) == 1
+
     def test_generate_cached_invalid_input(self):
         """generate_cached에 리스트 입력 시 에러 테스트"""
         # Given
@@ -0,0 +1,101 @@
+"""
+이미지 캐시 유틸리티 테스트
+"""
+
+import pytest
+from app.utils.image_cache import ImageCache
+from app.utils.image_variants import file_hash
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    """크기가 다른 이미지 파일 3개가 있는 디렉토리"""
+    for name, size in (("a.png", 100), ("b.png", 200), ("c.png", 300)):
+        (tmp_path / name).write_bytes(name.encode() * size)
+    return tmp_path
+
+
+class TestImageCache:
+    """ImageCache 클래스 테스트"""
+
+    def test_manifest(self, image_dir):
+        """파일 목록으로 존재 여부를 확인하고 목록을 만든 뒤 추가된 파일은 보지 않는지 테스트"""
+        # Given: 파일 목록을 만든 캐시
+        cache = ImageCache()
+        assert cache.load_manifest(str(image_dir)) == {"a.png", "b.png", "c.png"}
+
+        # When: 목록을 만든 뒤 파일 추가
+        (image_dir / "d.png").write_bytes(b"d")
+
+        # Then: 파일 목록 기준으로 확인 (clear 후 다시 만들면 반영)
+        assert cache.exists(str(image_dir), "a.png")
+        assert not cache.exists(str(image_dir), "d.png")
+        cache.clear()
+        assert cache.exists(str(image_dir), "d.png")
+        assert not cache.exists(str(image_dir / "missing"), "a.png")
+
+    def test_reloaded_manifest_changes_fingerprint(self, image_dir):
+        """이미지가 바뀐 뒤 파일 목록을 다시 만들면 fingerprint가 바뀌고 캐싱된 해시를 버리는지 테스트"""
+        # Given: 파일 목록과 내용 해시를 만든 캐시
+        cache = ImageCache()
+        cache.load_manifest(str(image_dir))
+        path = str(image_dir / "a.png")
+        before = (cache.fingerprint(), cache.content_hash(path))
+
+        # When: 같은 파일명으로 이미지 교체 후 파일 목록 다시 로드
+        (image_dir / "a.png").write_bytes(b"new image")
+        cache.load_manifest(str(image_dir))
+
+        # Then
+        assert cache.fingerprint() != before[0]
+        assert cache.content_hash(path) == file_hash(path) != before[1]
+
+    def test_get_reads_once(self, image_dir):
+        """처음 요청 시 파일을 읽어 캐싱하고 이후에는 파일을 다시 읽지 않는지 테스트"""
+        cache = ImageCache()
+        path = str(image_dir / "a.png")
+
+        # When: 같은 이미지를 두 번 요청 (두 번째 요청 전에 파일 삭제)
+        first = cache.get(path)
+        (image_dir / "a.png").unlink()
+        second = cache.get(path)
+
+        # Then: 캐싱된 바이트와 내용 해시 ETag 반환
+        assert second is first
+        assert first.data == b"a.png" * 100
+        assert first.etag == cache.content_hash(path)
+        assert cache.size == 500
+
+    def test_content_hash_matches_file_hash(self, image_dir):
+        """바이트로 계산한 ETag가 파일 해시와 같은지 테스트"""
+        path = str(image_dir / "b.png")
+
+        assert ImageCache().get(path).etag == file_hash(path)
+
+    def test_evicts_by_size(self, image_dir, monkeypatch):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 이미지부터 제거하는지 테스트"""
+        # Given: 최대 2000 바이트 캐시 (이미지 크기 제한 없음)
+        monkeypatch.setattr("app.utils.image_cache.MAX_ITEM_RATIO", 1)
+        cache = ImageCache(max_bytes=2000)
+
+        # When: a(500), b(1000) 캐싱 후 a 사용, c(1500) 캐싱
+        a = cache.get(str(image_dir / "a.png"))
+        b = cache.get(str(image_dir / "b.png"))
+        cache.get(str(image_dir / "a.png"))
+        cache.get(str(image_dir / "c.png"))
+
+        # Then: 가장 오래 사용하지 않은 b를 제거하고 a, c 유지
+        assert cache.size == 2000
+        assert len(cache) == 2
+        assert cache.get(str(image_dir / "a.png")) is a
+        assert cache.get(str(image_dir / "b.png")) is not b
+
+    def test_skips_large_images(self, image_dir):
+        """max_bytes의 1/16보다 큰 이미지는 캐싱하지 않는지 테스트"""
+        cache = ImageCache(max_bytes=16 * 1000)
+
+        cached = cache.get(str(image_dir / "c.png"))
+
+        assert cached.data == b"c.png" * 300
+        assert len(cache) == 0
+        assert cache.size == 0
@@ -0,0 +1,78 @@
+"""
+이미지 변형 유틸리티 테스트
+"""
+
+import os
+import pytest
+from PIL import Image
+from werkzeug.datastructures import MIMEAccept
+from app.utils.image_variants import file_hash, get_variant, negotiate_format, parse_width, variant_name
+
+
+@pytest.fixture
+def source_image(tmp_path):
+    """300x150 크기의 원본 PNG 이미지"""
+    path = tmp_path / "source.png"
+    Image.new("RGBA", (300, 150), (200, 30, 30, 255)).save(path)
+    return str(path)
+
+
+class TestParseWidth:
+    """parse_width 함수 테스트"""
+
+    @pytest.mark.parametrize("value, expected", [("1", 64), ("64", 64), ("65", 128), ("300", 512), ("5000", 512)])
+    def test_snap_to_variant_width(self, value, expected):
+        """요청한 너비 이상인 가장 작은 변형 너비로 맞추는지 테스트"""
+        assert parse_width(value) == expected
+
+    @pytest.mark.parametrize("value", ["0", "-1", "abc", "12.5", ""])
+    def test_invalid(self, value):
+        """양의 정수가 아니면 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            parse_width(value)
+
+
+class TestNegotiateFormat:
+    """negotiate_format 함수 테스트"""
+
+    def test_webp_when_accepted(self):
+        """image/webp를 명시하면 WebP를 선택하는지 테스트"""
+        assert negotiate_format(MIMEAccept([("image/webp", 1), ("*/*", 0.8)])) == "webp"
+
+    def test_png_for_wildcard(self):
+        """*/*만 보내거나 WebP를 거부하면 PNG를 선택하는지 테스트"""
+        assert negotiate_format(MIMEAccept([("*/*", 1)])) == "png"
+        assert negotiate_format(MIMEAccept([("image/webp", 0), ("*/*", 1)])) == "png"
+
+
+class TestGetVariant:
+    """get_variant 함수 테스트"""
+
+    def test_render_and_reuse(self, source_image, tmp_path):
+        """변형을 만들어 저장하고 다시 요청하면 저장된 파일을 재사용하는지 테스트"""
+        variant_dir = str(tmp_path / "variants")
+
+        path, mimetype, etag = get_variant(source_image, 128, "webp", variant_dir)
+        mtime = os.path.getmtime(path)
+
+        assert mimetype == "image/webp"
+        assert path == os.path.join(variant_dir, variant_name(file_hash(source_image), 128, "webp"))
+        with Image.open(path) as image:
+            assert image.format == "WEBP"
+            assert image.size == (128, 64)
+        assert get_variant(source_image, 128, "webp", variant_dir)[0] == path
+        assert os.path.getmtime(path) == mtime
+
+    def test_no_upscale(self, source_image, tmp_path):
+        """원본보다 큰 너비는 원본 크기로 저장하는지 테스트"""
+        path, mimetype, _ = get_variant(source_image, 512, "png", str(tmp_path))
+
+        assert mimetype == "image/png"
+        with Image.open(path) as image:
+            assert image.size == (300, 150)
+
+    def test_etag_per_format_and_width(self, source_image, tmp_path):
+        """너비/포맷마다 ETag가 다른지 테스트"""
+        etags = {get_variant(source_image, width, fmt, str(tmp_path))[2] for width in (64, 128) for fmt in ("webp", "png")}
+
+        assert len(etags) == 4
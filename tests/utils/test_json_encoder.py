@@ -0,0 +1,75 @@
+"""
+JSON 인코더 유틸리티 테스트
+"""
+
+import json
+import numpy as np
+import pytest
+from app.utils.json_encoder import OrjsonEncoder, StdlibJSONEncoder, get_json_encoder, orjson
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="orjson이 설치되어 있지 않음")
+
+
+@pytest.fixture
+def data():
+    """한글을 포함한 테스트용 응답 데이터"""
+    return {"success": True, "results": [{"code": "1", "name": "진토닉", "alcohol": 40.5}], "total_count": 1}
+
+
+class TestStdlibJSONEncoder:
+    """StdlibJSONEncoder 클래스 테스트"""
+
+    def test_modes(self, data):
+        """compact와 들여쓰기 모드가 표준 json.dumps와 같은 바이트를 만드는지 테스트"""
+        encoder = StdlibJSONEncoder()
+
+        assert encoder.dumps(data, compact=True) == json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+        assert encoder.dumps(data) == json.dumps(data, indent=4, ensure_ascii=False).encode()
+
+
+@requires_orjson
+class TestOrjsonEncoder:
+    """OrjsonEncoder 클래스 테스트"""
+
+    def test_compact_matches_stdlib(self, data):
+        """compact 모드 출력이 표준 인코더와 같은지 테스트 (한글은 이스케이프하지 않음)"""
+        encoded = OrjsonEncoder().dumps(data, compact=True)
+
+        assert encoded == StdlibJSONEncoder().dumps(data, compact=True)
+        assert "진토닉".encode("utf-8") in encoded
+
+    def test_indent_matches_stdlib(self, data):
+        """들여쓰기 모드는 표준 인코더와 같은 4칸 들여쓰기로 출력하는지 테스트"""
+        assert OrjsonEncoder().dumps(data) == StdlibJSONEncoder().dumps(data)
+
+    def test_ensure_ascii_falls_back(self, data):
+        """ensure_ascii=True이면 표준 인코더로 이스케이프하는지 테스트"""
+        encoded = OrjsonEncoder().dumps(data, compact=True, ensure_ascii=True)
+
+        assert b"\\uc9c4" in encoded
+
+    def test_unsupported_values_fall_back(self):
+        """orjson이 처리하지 못하는 값은 표준 인코더로 직렬화하는지 테스트"""
+        data = {1: 2**70}
+
+        assert json.loads(OrjsonEncoder().dumps(data, compact=True)) == {"1": 2**70}
+
+    def test_numpy_values(self):
+        """NumPy 값도 직렬화하는지 테스트"""
+        assert json.loads(OrjsonEncoder().dumps({"counts": np.array([1, 2], dtype=np.int32)})) == {"counts": [1, 2]}
+
+
+class TestGetJsonEncoder:
+    """get_json_encoder 함수 테스트"""
+
+    def test_auto(self):
+        """auto는 orjson이 있으면 orjson, 없으면 표준 인코더를 반환하는지 테스트"""
+        expected = "orjson" if orjson is not None else "stdlib"
+
+        assert get_json_encoder("auto").name == expected
+        assert get_json_encoder("stdlib").name == "stdlib"
+
+    def test_unknown(self):
+        """알 수 없는 인코더 이름은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            get_json_encoder("simdjson")
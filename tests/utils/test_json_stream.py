@@ -0,0 +1,53 @@
+"""
+JSON 스트림 파싱 유틸리티 테스트
+"""
+
+import json
+import pytest
+from app.utils.json_stream import JsonArrayStream
+
+RESPONSE = json.dumps({
+    "intro": "오늘의 추천 {\"recommendation\"",
+    "recommendation": [
+        {"name": "진토닉", "reason": "상큼한 [맛] {괄호}"},
+        {"name": "모히토", "reason": "\"민트\"의 청량함\\"},
+        {"name": "마티니", "tags": [{"k": 1}], "reason": "클래식"},
+    ],
+    "closing": {"note": "즐거운 시간 되세요"},
+}, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, len(RESPONSE)])
+def test_items_emitted_as_they_close(chunk_size):
+    """조각 크기와 관계없이 배열 원소를 순서대로 한 번씩 꺼내는지 테스트"""
+    # Given
+    parser = JsonArrayStream("recommendation")
+    items = []
+
+    # When: 조각 단위로 입력
+    for start in range(0, len(RESPONSE), chunk_size):
+        items.extend(parser.feed(RESPONSE[start:start + chunk_size]))
+
+    # Then
+    assert items == json.loads(RESPONSE)["recommendation"]
+    assert parser.closed is True
+    assert parser.text == RESPONSE
+
+
+def test_item_emitted_before_stream_ends():
+    """원소가 닫히는 조각에서 바로 원소를 반환하는지 테스트"""
+    # Given
+    parser = JsonArrayStream("recommendation")
+
+    # When & Then
+    assert parser.feed('{"recommendation": [{"name": "진') == []
+    assert parser.feed('토닉"}, {"name"') == [{"name": "진토닉"}]
+    assert parser.closed is False
+
+
+def test_missing_key_yields_nothing():
+    """키가 없는 응답에서는 원소를 꺼내지 않는지 테스트"""
+    parser = JsonArrayStream("recommendation")
+
+    assert parser.feed('{"other": [{"name": "진토닉"}]}') == []
+    assert parser.closed is False
@@ -0,0 +1,49 @@
+"""
+NDJSON 스트리밍 유틸리티 테스트
+"""
+
+import gzip
+import json
+from app.utils.json_encoder import StdlibJSONEncoder
+from app.utils.ndjson import iter_gzip, iter_ndjson
+from app.utils.pagination import FieldColumns
+
+RECORDS = [{"code": str(i), "name": f"음료{i}", "type": "진"} for i in range(10)]
+
+
+class TestIterNdjson:
+    """iter_ndjson 함수 테스트"""
+
+    def test_one_record_per_line(self):
+        """레코드마다 한 줄씩, batch_size개씩 청크로 내보내는지 테스트"""
+        chunks = list(iter_ndjson(RECORDS, StdlibJSONEncoder(), batch_size=4))
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == RECORDS
+        assert "음료0" in lines[0]
+
+    def test_fields(self):
+        """필드 컬럼으로 선택한 필드만 내보내는지 테스트 (전체 목록과 부분 목록)"""
+        columns = FieldColumns(RECORDS)
+        encoder = StdlibJSONEncoder()
+
+        full = b"".join(iter_ndjson(RECORDS, encoder, ["code"], columns, batch_size=3)).splitlines()
+        subset = b"".join(iter_ndjson(RECORDS[5:7], encoder, ["name"], columns)).splitlines()
+
+        assert [json.loads(line) for line in full] == [{"code": str(i)} for i in range(10)]
+        assert [json.loads(line) for line in subset] == [{"name": "음료5"}, {"name": "음료6"}]
+
+    def test_empty(self):
+        """레코드가 없으면 아무것도 내보내지 않는지 테스트"""
+        assert list(iter_ndjson([], StdlibJSONEncoder())) == []
+
+
+class TestIterGzip:
+    """iter_gzip 함수 테스트"""
+
+    def test_round_trip(self):
+        """압축한 스트림을 gzip으로 풀면 원본과 같은지 테스트"""
+        chunks = [b'{"a":1}\n' * 100, b'{"b":2}\n' * 100]
+
+        assert gzip.decompress(b"".join(iter_gzip(iter(chunks)))) == b"".join(chunks)
@@ -0,0 +1,126 @@
+"""
+목록 페이지네이션 유틸리티 테스트
+"""
+
+import pytest
+from app.utils.pagination import (
+    FieldColumns,
+    MAX_PAGE_LIMIT,
+    PageRequest,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    parse_page_request,
+)
+
+
+@pytest.fixture
+def records():
+    """테스트용 레코드 리스트"""
+    return [{"code": str(i), "name": f"음료{i}", "description": "긴 설명" * 10} for i in range(5)]
+
+
+class TestCursor:
+    """커서 인코딩 테스트"""
+
+    def test_round_trip(self):
+        """인코딩한 커서를 다시 시작 위치로 변환하는지 테스트"""
+        assert decode_cursor(encode_cursor(0)) == 0
+        assert decode_cursor(encode_cursor(1234)) == 1234
+
+    @pytest.mark.parametrize("cursor", ["xx", "!!!", encode_cursor(3)[:-1] + "#"])
+    def test_invalid(self, cursor):
+        """형식이 올바르지 않은 커서는 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_stale_version(self):
+        """다른 데이터 버전에서 발급된 커서는 만료 에러를 발생시키는지 테스트"""
+        # Given: 이전 데이터에서 발급된 커서
+        cursor = encode_cursor(10, version="oldversion")
+
+        # When / Then
+        assert decode_cursor(cursor, version="oldversion") == 10
+        with pytest.raises(ValueError, match="만료"):
+            decode_cursor(cursor, version="newversion")
+
+
+class TestParsePageRequest:
+    """parse_page_request 함수 테스트"""
+
+    def test_defaults(self):
+        """파라미터가 없으면 전체 목록을 요청한 것으로 처리하는지 테스트"""
+        page, errors = parse_page_request({})
+
+        assert errors == []
+        assert page.limit is None and page.offset == 0 and page.fields is None
+        assert page.is_paginated is False
+
+    def test_parse(self):
+        """limit, cursor, fields를 변환하고 중복 필드를 제거하는지 테스트"""
+        page, errors = parse_page_request({"limit": "10", "cursor": encode_cursor(20), "fields": "code, name,code"})
+
+        assert errors == []
+        assert (page.limit, page.offset, page.fields) == (10, 20, ["code", "name"])
+        assert page.is_paginated is True
+
+    @pytest.mark.parametrize("limit", ["0", "-1", "abc", str(MAX_PAGE_LIMIT + 1)])
+    def test_invalid_limit(self, limit):
+        """범위를 벗어나거나 정수가 아닌 limit은 에러를 반환하는지 테스트"""
+        _, errors = parse_page_request({"limit": limit})
+
+        assert len(errors) == 1
+
+
+class TestPaginate:
+    """paginate 함수 테스트"""
+
+    def test_pages(self, records):
+        """다음 커서를 따라가면 모든 레코드를 한 번씩 반환하는지 테스트"""
+        # Given: 페이지 크기 2
+        page = PageRequest(limit=2)
+        seen = []
+
+        # When: 마지막 페이지까지 순회
+        while True:
+            items, cursor = paginate(records, page)
+            seen.extend(items)
+            if cursor is None:
+                break
+            page = PageRequest(limit=2, offset=decode_cursor(cursor))
+
+        # Then: 순서를 유지하며 모든 레코드를 반환
+        assert seen == records
+
+    def test_without_limit(self, records):
+        """limit이 없으면 나머지 전체를 반환하는지 테스트"""
+        items, cursor = paginate(records, PageRequest(offset=3))
+
+        assert items == records[3:]
+        assert cursor is None
+
+
+class TestFieldColumns:
+    """FieldColumns 클래스 테스트"""
+
+    def test_project_range(self, records):
+        """연속 구간은 컬럼 슬라이스로 필드를 선택하는지 테스트"""
+        columns = FieldColumns(records)
+
+        assert columns.project(records[1:3], ["code", "name"], offset=1) == [
+            {"code": "1", "name": "음료1"},
+            {"code": "2", "name": "음료2"},
+        ]
+
+    def test_project_subset(self, records):
+        """카탈로그의 임의 부분 목록과 카탈로그에 없는 레코드도 필드를 선택하는지 테스트"""
+        columns = FieldColumns(records)
+        subset = [records[4], {"code": "x", "name": "외부"}, records[0]]
+
+        assert columns.project(subset, ["name"]) == [{"name": "음료4"}, {"name": "외부"}, {"name": "음료0"}]
+
+    def test_unknown_fields(self, records):
+        """카탈로그에 없는 필드를 찾아내는지 테스트"""
+        columns = FieldColumns(records)
+
+        assert columns.unknown_fields(["code", "image", "name"]) == ["image"]
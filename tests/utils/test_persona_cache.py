@@ -0,0 +1,64 @@
+"""
+페르소나 캐시 유틸리티 테스트
+"""
+
+from app.utils.persona_cache import PersonaCache, chain_keys
+
+USER = [{"name": "김철수", "gender": "남성", "favoriteTaste": "쓴맛"}]
+TASTINGS = [{"code": str(code), "eval": 4} for code in range(5)]
+
+
+def test_chain_keys_share_prefix():
+    """이력이 추가되기만 하면 기존 키가 새 키 목록의 앞부분과 같은지 테스트"""
+    # Given
+    old_keys = chain_keys(USER, TASTINGS[:3])
+    new_keys = chain_keys(USER, TASTINGS)
+
+    # Then
+    assert len(new_keys) == len(TASTINGS) + 1
+    assert new_keys[:4] == old_keys
+
+
+def test_chain_keys_ignore_dict_key_order():
+    """딕셔너리 키 순서가 달라도 같은 키를 만드는지 테스트"""
+    reordered = [{"eval": 4, "code": "0"}]
+
+    assert chain_keys(USER, reordered) == chain_keys(USER, TASTINGS[:1])
+
+
+def test_chain_keys_differ_for_changed_history():
+    """이전 테이스팅이 바뀌거나 사용자 정보가 다르면 다른 키를 만드는지 테스트"""
+    changed = [dict(TASTINGS[0], eval=1)] + TASTINGS[1:]
+
+    assert chain_keys(USER, changed)[-1] != chain_keys(USER, TASTINGS)[-1]
+    assert chain_keys([{"name": "이영희"}], TASTINGS)[0] != chain_keys(USER, TASTINGS)[0]
+
+
+def test_find_latest_returns_longest_prefix():
+    """보관된 요약 중 가장 긴 이력의 요약을 찾는지 테스트"""
+    # Given: 1개, 3개 이력의 요약
+    cache = PersonaCache()
+    keys = chain_keys(USER, TASTINGS)
+    cache.put(keys[1], "요약1")
+    cache.put(keys[3], "요약3")
+
+    # When & Then
+    assert cache.find_latest(keys) == (3, "요약3", 0)
+    assert cache.find_latest(chain_keys(USER, [])) is None
+
+
+def test_lru_eviction():
+    """최대 항목 수를 넘으면 가장 오래 사용하지 않은 요약을 제거하는지 테스트"""
+    # Given
+    cache = PersonaCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.find_latest(["a"])
+
+    # When
+    cache.put("c", "C")
+
+    # Then
+    assert len(cache) == 2
+    assert cache.find_latest(["b"]) is None
+    assert cache.find_latest(["a"]) == (0, "A", 0)
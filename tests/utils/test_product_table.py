@@ -0,0 +1,77 @@
+"""
+ProductTable 유틸리티 테스트
+"""
+
+import math
+import pytest
+from app.utils.product_table import ProductTable, parse_volume
+
+
+@pytest.fixture
+def products():
+    """테스트용 음료 리스트"""
+    return [
+        {"code": "1", "type": "위스키", "baseCode": "100", "volume": "700ml", "alcohol": "40.8"},
+        {"code": "2", "type": "진", "baseCode": "600", "volume": "1L", "alcohol": "47.0"},
+        {"code": "3", "type": "라이 위스키", "baseCode": "100", "volume": "750ml", "alcohol": "45.0"},
+        {"code": "4", "type": "위스키", "baseCode": "100", "volume": "1.8L", "alcohol": "43.0"},
+        {"code": "5", "type": "사케", "baseCode": "930", "volume": "", "alcohol": ""},
+    ]
+
+
+class TestProductTable:
+    """ProductTable 클래스 테스트"""
+
+    def test_columns(self, products):
+        """문자열 속성이 숫자/범주 컬럼으로 변환되는지 테스트"""
+        table = ProductTable(products)
+
+        assert table.volume_ml[:4].tolist() == [700.0, 1000.0, 750.0, 1800.0]
+        assert math.isnan(table.alcohol[4])
+        assert table.type_labels == ["위스키", "진", "라이 위스키", "사케"]
+
+    def test_search_type_substring(self, products):
+        """타입 부분 문자열 검색이 카탈로그 순서를 유지하는지 테스트"""
+        table = ProductTable(products)
+
+        assert [drink["code"] for drink in table.search_type("위스키")] == ["1", "3", "4"]
+
+    def test_filter_combines_conditions(self, products):
+        """타입, 베이스, 도수, 용량 조건을 모두 만족하는 음료만 반환하는지 테스트"""
+        table = ProductTable(products)
+
+        results, _ = table.filter(types=["위스키", "라이 위스키"], bases=["100"], abv_min=40.8, volume_max=1000)
+
+        # 40.8도는 float32 경계에서도 포함되고, 1.8L는 용량 범위에서 제외됨
+        assert [drink["code"] for drink in results] == ["1", "3"]
+
+    def test_facets_exclude_own_dimension(self, products):
+        """타입 패싯은 타입 조건을 제외한 나머지 조건으로 집계하는지 테스트"""
+        table = ProductTable(products)
+
+        results, facets = table.filter(types=["진"], abv_min=40)
+
+        assert [drink["code"] for drink in results] == ["2"]
+        assert facets["type"] == [
+            {"value": "위스키", "count": 2},
+            {"value": "진", "count": 1},
+            {"value": "라이 위스키", "count": 1},
+        ]
+        assert facets["baseCode"] == [{"value": "600", "count": 1}]
+        assert facets["alcohol"] == {"min": 47.0, "max": 47.0}
+
+    def test_range_excludes_unknown_values(self, products):
+        """범위 조건이 있으면 값이 없는 음료는 제외하는지 테스트"""
+        table = ProductTable(products)
+
+        results, facets = table.filter(volume_min=0)
+
+        assert "5" not in [drink["code"] for drink in results]
+        assert facets["volume_ml"] == {"min": 700.0, "max": 1800.0}
+
+    def test_parse_volume(self):
+        """용량 문자열 변환 테스트"""
+        assert parse_volume("1.8L") == 1800.0
+        assert parse_volume("125ml") == 125.0
+        assert math.isnan(parse_volume("대용량"))
+        assert math.isnan(parse_volume(None))
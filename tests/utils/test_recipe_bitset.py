@@ -0,0 +1,116 @@
+"""
+RecipeBitset 유틸리티 테스트
+"""
+
+import numpy as np
+from app.utils.recipe_bitset import RecipeBitset, popcount_rows
+
+
+class TestRecipeBitset:
+    """RecipeBitset 클래스 테스트"""
+
+    def test_find_makeable(self, sample_recipes_list):
+        """보유 재료로 만들 수 있는 레시피만 반환하는지 테스트"""
+        bitset = RecipeBitset(sample_recipes_list)
+
+        results = bitset.find_makeable(["300", "600", "400"])
+
+        assert [recipe["code"] for recipe in results] == ["300600"]
+
+    def test_find_makeable_keeps_catalog_order(self, sample_recipes_list):
+        """모든 재료를 보유하면 카탈로그 순서대로 모두 반환하는지 테스트"""
+        bitset = RecipeBitset(sample_recipes_list)
+
+        results = bitset.find_makeable(["601", "500", "600", "300"])
+
+        assert [recipe["code"] for recipe in results] == ["300600", "500601"]
+
+    def test_unknown_codes_ignored(self, sample_recipes_list):
+        """레시피에 쓰이지 않는 코드는 결과에 영향을 주지 않는지 테스트"""
+        bitset = RecipeBitset(sample_recipes_list)
+
+        assert bitset.find_makeable(["999", "888"]) == []
+
+    def test_many_ingredients_span_multiple_words(self):
+        """재료가 64개를 넘어도 여러 워드로 정확히 판단하는지 테스트"""
+        # Given: 0~69번 재료를 각각 쓰는 레시피와 모든 재료를 쓰는 레시피
+        recipes = [{"code": f"R{i}", "ingredients": [{"code": str(i)}]} for i in range(70)]
+        recipes.append({"code": "ALL", "ingredients": [{"code": str(i)} for i in range(70)]})
+        bitset = RecipeBitset(recipes)
+
+        # When: 65, 69번 재료만 보유
+        results = bitset.find_makeable(["65", "69"])
+
+        # Then: 해당 단일 재료 레시피만 반환됨
+        assert bitset.num_words == 2
+        assert [recipe["code"] for recipe in results] == ["R65", "R69"]
+
+    def test_ingredient_without_code_never_matches(self):
+        """코드가 없는 재료를 가진 레시피는 만들 수 없는 것으로 판단하는지 테스트"""
+        recipes = [{"code": "R1", "ingredients": [{"name": "설탕"}, {"code": "300"}]}]
+        bitset = RecipeBitset(recipes)
+
+        assert bitset.find_makeable(["300", "None"]) == []
+
+    def test_find_near_misses_decodes_missing_codes(self):
+        """부족한 재료 코드를 여러 워드에 걸쳐 정확히 복원하는지 테스트"""
+        recipes = [{"code": "BIG", "ingredients": [{"code": str(i)} for i in range(70)]}]
+        bitset = RecipeBitset(recipes)
+
+        results = bitset.find_near_misses([str(i) for i in range(68)], 3)
+
+        assert len(results) == 1
+        assert results[0][1] == ["68", "69"]
+
+    def test_popcount_rows(self):
+        """행별 set bit 개수를 계산하는지 테스트"""
+        masks = np.array([[0, 0], [0b1011, 1 << 63]], dtype=np.uint64)
+
+        assert popcount_rows(masks).tolist() == [0, 4]
+
+    def test_rank_next_ingredients(self):
+        """하나만 더 사면 만들 수 있는 레시피 수로 재료를 순위화하는지 테스트"""
+        recipes = [
+            {"code": "A", "ingredients": [{"code": "1"}, {"code": "2"}]},
+            {"code": "B", "ingredients": [{"code": "1"}, {"code": "3"}]},
+            {"code": "C", "ingredients": [{"code": "3"}, {"code": "4"}]},
+            {"code": "D", "ingredients": [{"code": "1"}, {"code": "3"}, {"code": "5"}]},
+        ]
+        bitset = RecipeBitset(recipes)
+
+        ranking = bitset.rank_next_ingredients(["1", "4"])
+
+        # 3번 재료는 B, C를, 2번 재료는 A를 새로 만들 수 있게 함
+        assert [(bitset.code_of[bit], [r["code"] for r in unlocked]) for bit, unlocked in ranking] == [
+            ("3", ["B", "C"]),
+            ("2", ["A"]),
+        ]
+
+    def test_plan_purchase_uses_progress_for_multi_step(self):
+        """한 번에 완성되지 않아도 남은 구매로 완성할 수 있는 재료를 고르는지 테스트"""
+        recipes = [
+            {"code": "A", "ingredients": [{"code": "1"}, {"code": "2"}, {"code": "3"}]},
+            {"code": "B", "ingredients": [{"code": "1"}, {"code": "9"}]},
+        ]
+        bitset = RecipeBitset(recipes)
+
+        steps = bitset.plan_purchase(["1"], 3)
+
+        # B를 완성하는 9번이 먼저 선택되고, 남은 두 번의 구매로 A를 완성함
+        assert [bitset.code_of[bit] for bit, _ in steps] == ["9", "2", "3"]
+        assert [[r["code"] for r in unlocked] for _, unlocked in steps] == [["B"], [], ["A"]]
+
+    def test_plan_purchase_skips_unreachable_recipes(self):
+        """남은 구매 횟수로 완성할 수 없는 레시피만 남으면 중단하는지 테스트"""
+        recipes = [{"code": "A", "ingredients": [{"code": "1"}, {"code": "2"}, {"code": "3"}]}]
+        bitset = RecipeBitset(recipes)
+
+        assert bitset.plan_purchase(["1"], 1) == []
+
+    def test_plan_purchase_stops_when_nothing_helps(self, sample_recipes_list):
+        """더 이상 도움이 되는 재료가 없으면 중단하는지 테스트"""
+        bitset = RecipeBitset(sample_recipes_list)
+
+        steps = bitset.plan_purchase(["300", "600", "500", "601"], 3)
+
+        assert steps == []
@@ -0,0 +1,75 @@
+"""
+레시피 이미지 매핑 유틸리티 테스트
+"""
+
+import logging
+import unicodedata
+import pytest
+from app.utils.recipe_images import RecipeImageMap, normalize_key
+
+RECIPES = [
+    {"code": "1", "korean_name": "진 토닉", "english_name": "Gin-Tonic"},
+    {"code": "2", "korean_name": "모히또", "english_name": "Mojito"},
+    {"code": "3", "korean_name": "모히또", "english_name": "Virgin-Mojito"},
+    {"code": "4", "korean_name": "1", "english_name": "Missing"},
+]
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    """Missing을 제외한 레시피 이미지가 있는 디렉토리"""
+    for name in ("Gin-Tonic", "Mojito", "Virgin-Mojito"):
+        (tmp_path / f"{name}.png").write_bytes(b"image")
+    return tmp_path
+
+
+class TestNormalizeKey:
+    """normalize_key 함수 테스트"""
+
+    def test_ignores_case_and_separators(self):
+        """대소문자와 공백/하이픈/밑줄을 무시하고 NFD 한글을 합치는지 테스트"""
+        assert normalize_key(" Gin Tonic ") == normalize_key("gin-tonic") == normalize_key("GIN_TONIC") == "gintonic"
+        assert normalize_key("진 토닉") == normalize_key("진토닉")
+        assert normalize_key(unicodedata.normalize("NFD", "모히또")) == "모히또"
+        assert normalize_key(None) == ""
+
+
+class TestRecipeImageMap:
+    """RecipeImageMap 클래스 테스트"""
+
+    def test_resolve(self, image_dir):
+        """코드/한국어 이름/영어 이름으로 레시피 코드와 이미지 파일을 찾는지 테스트"""
+        image_map = RecipeImageMap(RECIPES, str(image_dir))
+
+        assert image_map.resolve("진토닉") == image_map.resolve("gin tonic") == "1"
+        assert image_map.resolve("virgin mojito") == "3"
+        assert image_map.filename("3") == "Virgin-Mojito.png"
+        assert image_map.resolve("없는 칵테일") is None
+        assert image_map.resolve(" ") is None
+
+    def test_deterministic_priority(self, image_dir):
+        """코드가 이름보다 우선하고 같은 이름은 카탈로그 순서상 첫 번째 레시피를 사용하는지 테스트"""
+        image_map = RecipeImageMap(RECIPES, str(image_dir))
+
+        # 한국어 이름이 "1"인 레시피(4)보다 코드 "1"인 레시피가 우선
+        assert image_map.resolve("1") == "1"
+        # 같은 한국어 이름(모히또)은 먼저 나온 레시피(2)
+        assert image_map.resolve("모히또") == "2"
+
+    def test_reports_missing_images(self, image_dir, caplog):
+        """이미지 파일이 없는 레시피를 모으고 경고 로그를 남기는지 테스트"""
+        with caplog.at_level(logging.WARNING, logger="app.utils.recipe_images"):
+            image_map = RecipeImageMap(RECIPES, str(image_dir))
+
+        assert [record["code"] for record in image_map.missing] == ["4"]
+        assert image_map.resolve("missing") == "4"
+        assert image_map.filename("4") is None
+        assert len(image_map) == 3
+        assert "Missing" in caplog.text
+
+    def test_missing_directory(self, tmp_path):
+        """이미지 디렉토리가 없으면 모든 레시피를 이미지 없음으로 처리하는지 테스트"""
+        image_map = RecipeImageMap(RECIPES, str(tmp_path / "missing"))
+
+        assert len(image_map.missing) == len(RECIPES)
+        assert image_map.resolve("모히또") == "2"
@@ -0,0 +1,204 @@
+"""
+추천 결과 캐시 유틸리티 테스트
+"""
+
+import itertools
+import json
+import threading
+import pytest
+from app.utils.recommendation_cache import RecommendationCache, make_recommendation_key
+
+
+def wait_for_refill(cache):
+    """백그라운드 보충이 끝날 때까지 기다립니다."""
+    if cache._executor is not None:
+        cache._executor.shutdown(wait=True)
+        cache._executor = None
+
+
+@pytest.fixture
+def cache():
+    """pool 크기 3의 추천 결과 캐시"""
+    cache = RecommendationCache(pool_size=3, ttl=60)
+    yield cache
+    wait_for_refill(cache)
+
+
+def make_call():
+    """호출할 때마다 다른 추천 결과를 반환하는 함수와 호출 횟수 카운터"""
+    counter = itertools.count(1)
+    calls = []
+
+    def call():
+        number = next(counter)
+        calls.append(number)
+        return {"recommendation": [{"name": f"칵테일{number}"}]}
+
+    return call, calls
+
+
+def test_key_ignores_cocktail_order_and_spacing():
+    """보유 칵테일 순서/공백/대소문자가 달라도 같은 키를 만드는지 테스트"""
+    # Given
+    first = make_recommendation_key("feeling", "페르소나", json.dumps(["진토닉", "Mojito"]))
+    second = make_recommendation_key("feeling", " 페르소나 ", json.dumps(["mojito", "진 토닉"]))
+    comma = make_recommendation_key("feeling", "페르소나", "Mojito, 진토닉")
+
+    # Then
+    assert first == second == comma
+
+
+def test_key_differs_by_endpoint_and_context():
+    """엔드포인트와 상황 정보가 다르면 다른 키를 만드는지 테스트"""
+    cocktails = json.dumps(["진토닉"])
+
+    assert make_recommendation_key("feeling", "p", cocktails) != make_recommendation_key("situation", "p", cocktails)
+    assert make_recommendation_key("default", "p", cocktails, "가을", "저녁", "눈") != \
+        make_recommendation_key("default", "p", cocktails, "가을", "저녁", "비")
+
+
+def test_get_or_call_fills_pool_and_rotates(cache):
+    """첫 요청은 직접 호출하고, 응답 후 백그라운드로 pool을 채운 뒤 결과를 차례로 돌려주는지 테스트"""
+    # Given
+    call, calls = make_call()
+
+    # When: 첫 요청 후 보충 완료
+    first = cache.get_or_call("key", call)
+    wait_for_refill(cache)
+    rotated = [cache.get_or_call("key", call) for _ in range(6)]
+
+    # Then: LLM 호출은 pool 크기만큼만, 첫 결과 다음부터 순서대로 반복
+    assert first["recommendation"][0]["name"] == "칵테일1"
+    assert len(calls) == 3
+    assert [result["recommendation"][0]["name"] for result in rotated] == ["칵테일2", "칵테일3", "칵테일1"] * 2
+
+
+def test_consecutive_calls_return_different_results(cache):
+    """연속된 두 요청이 보충 완료 여부와 관계없이 서로 다른 결과를 받는지 테스트"""
+    # Given
+    call, calls = make_call()
+
+    # When: 보충을 기다리지 않고 연속 요청
+    first = cache.get_or_call("key", call)
+    second = cache.get_or_call("key", call)
+
+    # Then
+    assert first != second
+
+
+def test_served_result_is_skipped(cache):
+    """응답한 결과로 추가한 결과는 다음 next()에서 다시 돌려주지 않는지 테스트"""
+    # Given: 보관된 결과 하나
+    cache.add("key", {"recommendation": [{"name": "진토닉"}]})
+
+    # When: 다른 결과와, 보관된 결과와 같은 칵테일의 결과를 응답한 결과로 추가
+    cache.add("key", {"recommendation": [{"name": "모히토"}]}, served=True)
+    after_served = cache.next("key")
+
+    # Then: 응답한 결과 다음(첫 결과)부터 반환
+    assert after_served["recommendation"][0]["name"] == "진토닉"
+    assert cache.add("key", {"recommendation": [{"name": "진 토닉"}]}, served=True) is False
+    assert cache.next("key")["recommendation"][0]["name"] == "모히토"
+
+
+def test_error_result_not_cached(cache):
+    """에러 결과는 보관하지 않고 다음 요청에서 다시 호출하는지 테스트"""
+    # Given
+    calls = []
+
+    def failing_call():
+        calls.append(1)
+        return {"error": "추천 생성에 실패했습니다."}
+
+    # When
+    cache.get_or_call("key", failing_call)
+    cache.get_or_call("key", failing_call)
+
+    # Then
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_duplicate_result_stops_refill(cache):
+    """보충 결과가 이미 있는 결과와 같은 칵테일을 추천하면 보충을 멈추는지 테스트"""
+    # Given: 설명만 다르고 항상 같은 칵테일을 추천
+    calls = []
+
+    def same_call():
+        calls.append(1)
+        return {"recommendation": [{"name": "진토닉", "reason": f"이유{len(calls)}"}]}
+
+    # When: 첫 요청 후 보충 완료
+    cache.get_or_call("key", same_call)
+    wait_for_refill(cache)
+
+    # Then: 첫 호출 + 중복 보충 1번
+    assert len(calls) == 2
+    assert cache.needs_refill("key") is True
+
+
+def test_duplicate_compares_recommended_names(cache):
+    """추천 이름의 표기만 다른 결과는 중복, 다른 칵테일을 추천한 결과는 새 결과로 보관하는지 테스트"""
+    # Given
+    cache.add("key", {"recommendation": [{"name": "Gin Tonic", "reason": "상쾌함"}]})
+
+    # When / Then
+    assert cache.add("key", {"recommendation": [{"name": "gin-tonic", "reason": "가벼움"}]}) is False
+    assert cache.add("key", {"recommendation": [{"name": "모히토", "reason": "상쾌함"}]}) is True
+
+
+def test_expired_pool_is_rebuilt(cache, monkeypatch):
+    """TTL이 지난 pool은 버리고 새로 호출하는지 테스트"""
+    # Given: pool이 가득 찬 키
+    call, calls = make_call()
+    now = [1000.0]
+    monkeypatch.setattr("app.utils.recommendation_cache.time.monotonic", lambda: now[0])
+    for _ in range(3):
+        cache.add("key", call())
+
+    # When: TTL 경과
+    now[0] += 61
+    result = cache.next("key")
+
+    # Then
+    assert result is None
+    assert cache.needs_refill("key") is False
+
+
+def test_lru_eviction():
+    """최대 키 수를 넘으면 가장 오래 사용하지 않은 키를 제거하는지 테스트"""
+    # Given
+    cache = RecommendationCache(pool_size=1, max_entries=2)
+    cache.add("a", {"n": 1})
+    cache.add("b", {"n": 2})
+    cache.next("a")
+
+    # When
+    cache.add("c", {"n": 3})
+
+    # Then
+    assert cache.next("a") == {"n": 1}
+    assert cache.next("b") is None
+    assert cache.next("c") == {"n": 3}
+
+
+def test_refill_runs_once_per_key(cache):
+    """같은 키의 보충은 동시에 하나만 실행되는지 테스트"""
+    # Given: 보충 호출이 멈춰 있는 상태
+    release = threading.Event()
+    call, calls = make_call()
+
+    def slow_call():
+        release.wait(5)
+        return call()
+
+    cache.add("key", {"recommendation": []})
+
+    # When: 보충을 여러 번 요청
+    for _ in range(5):
+        cache.schedule_refill("key", slow_call)
+    release.set()
+    wait_for_refill(cache)
+
+    # Then: pool을 채우는 데 필요한 만큼만 호출
+    assert len(calls) == 2
@@ -0,0 +1,298 @@
+"""
+응답 캐시 유틸리티 테스트
+"""
+
+import gzip
+import json
+from datetime import datetime, timezone
+import brotli
+import pytest
+from flask import Flask
+from app.utils.data_loader import data_loader
+from app.utils.response_cache import (
+    WARM_ENVIRON_KEY,
+    CachedResponse,
+    ResponseCache,
+    cache_response,
+    response_cache,
+)
+from app.utils.response_helper import ResponseHelper
+
+
+@pytest.fixture
+def app():
+    """응답 캐시가 켜진 Flask 애플리케이션 fixture"""
+    app = Flask(__name__)
+    app.config["RESPONSE_CACHE_ENABLED"] = True
+    app.config["JSON_COMPACT"] = True
+    calls = {"count": 0}
+
+    @app.route("/items")
+    @cache_response
+    def items():
+        calls["count"] += 1
+        return ResponseHelper.json_response([{"code": "1", "name": "진"}])
+
+    @app.route("/large")
+    @cache_response
+    def large():
+        calls["count"] += 1
+        return ResponseHelper.json_response([{"code": str(i), "name": "진"} for i in range(200)])
+
+    @app.route("/missing")
+    @cache_response
+    def missing():
+        calls["count"] += 1
+        return ResponseHelper.not_found_response("항목")
+
+    app.calls = calls
+    response_cache.clear()
+    yield app
+    response_cache.clear()
+
+
+class TestResponseCache:
+    """ResponseCache 클래스 테스트"""
+
+    def test_get_requires_same_version(self):
+        """데이터 버전이 다르면 캐시 항목을 사용하지 않는지 테스트"""
+        cache = ResponseCache()
+        cache.put("key", 1, CachedResponse(b"[]", 200, "application/json"))
+
+        assert cache.get("key", 1).body == b"[]"
+        assert cache.get("key", 2) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 제거하는지 테스트"""
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, 0, CachedResponse(key.encode(), 200, "application/json"))
+
+        cache.get("a", 0)
+        cache.put("c", 0, CachedResponse(b"c", 200, "application/json"))
+
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) is not None
+
+
+class TestCacheResponseDecorator:
+    """cache_response 데코레이터 테스트"""
+
+    def test_serves_cached_bytes(self, app):
+        """두 번째 요청은 뷰를 실행하지 않고 같은 바이트를 반환하는지 테스트"""
+        client = app.test_client()
+
+        first = client.get("/items")
+        second = client.get("/items")
+
+        assert app.calls["count"] == 1
+        assert second.data == first.data
+        assert second.content_type == "application/json; charset=utf-8"
+        # compact 모드는 공백 없이 인코딩
+        assert first.data == json.dumps([{"code": "1", "name": "진"}], separators=(",", ":"), ensure_ascii=False).encode()
+
+    def test_version_change_invalidates(self, app, monkeypatch):
+        """데이터 버전이 바뀌면 응답을 다시 만드는지 테스트"""
+        client = app.test_client()
+        client.get("/items")
+
+        monkeypatch.setattr(data_loader, "version", data_loader.version + 1)
+        client.get("/items")
+
+        assert app.calls["count"] == 2
+
+    def test_conditional_get(self, app):
+        """ETag가 일치하는 요청에는 뷰를 실행하지 않고 304를 반환하는지 테스트"""
+        client = app.test_client()
+        response_cache.clear()
+        app.config["RESPONSE_CACHE_ENABLED"] = False
+
+        first = client.get("/items")
+        second = client.get("/items", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.headers["Last-Modified"]
+        assert second.status_code == 304
+        assert second.data == b""
+        assert app.calls["count"] == 1
+
+    def test_etag_depends_on_data_fingerprint(self, app, monkeypatch):
+        """원본 데이터가 바뀌면 ETag도 바뀌는지 테스트"""
+        client = app.test_client()
+        first = client.get("/items")
+
+        monkeypatch.setattr(data_loader, "get_validators", lambda: ("changed", None))
+        second = client.get("/items", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+    def test_image_change_invalidates_cache_and_etag(self, app, monkeypatch):
+        """이미지 fingerprint가 바뀌면 캐싱된 응답(이미지 해시 URL 포함)과 ETag를 새로 만드는지 테스트"""
+        from app.utils.image_cache import image_cache
+
+        # Given: 이미지 캐시의 파일 목록 fingerprint
+        app.config["IMAGE_CACHE_ENABLED"] = True
+        monkeypatch.setattr(image_cache, "fingerprint", lambda: "images-v1")
+        client = app.test_client()
+        first = client.get("/items")
+
+        # When: 이미지가 바뀌어 fingerprint 변경
+        monkeypatch.setattr(image_cache, "fingerprint", lambda: "images-v2")
+        second = client.get("/items", headers={"If-None-Match": first.headers["ETag"]})
+
+        # Then: 304 대신 새 응답을 만들어 반환
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert app.calls["count"] == 2
+
+    def test_format_change_invalidates_etag(self, app, monkeypatch):
+        """응답 형식 버전이 바뀌면 원본 파일이 그대로여도 조건부 요청에 새 응답을 보내는지 테스트"""
+        from app.utils import response_cache as module
+
+        client = app.test_client()
+        app.config["RESPONSE_CACHE_ENABLED"] = False
+        data_mtime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        monkeypatch.setattr(data_loader, "get_validators", lambda: ("same", data_mtime))
+        first = client.get("/items")
+        headers = {"If-None-Match": first.headers["ETag"], "If-Modified-Since": first.headers["Last-Modified"]}
+        assert client.get("/items", headers=headers).status_code == 304
+
+        # When: 응답 형식 버전 변경
+        monkeypatch.setattr(module, "RESPONSE_FORMAT_VERSION", module.RESPONSE_FORMAT_VERSION + 1)
+        second = client.get("/items", headers=headers)
+
+        # Then: If-None-Match가 If-Modified-Since보다 우선하므로 새 응답
+        assert second.status_code == 200
+        assert second.last_modified == data_mtime
+
+    def test_unknown_query_params_share_entry(self, app):
+        """알 수 없는 쿼리 파라미터와 파라미터 순서는 캐시 키와 ETag에 영향을 주지 않는지 테스트"""
+        client = app.test_client()
+
+        # When
+        first = client.get("/items?limit=1&fields=code")
+        second = client.get("/items?fields=code&junk=1&limit=1")
+        third = client.get("/items?limit=2")
+
+        # Then: 같은 응답으로 처리하고, 사용하는 파라미터가 다르면 새로 만듦
+        assert first.headers["ETag"] == second.headers["ETag"] != third.headers["ETag"]
+        assert app.calls["count"] == 2
+        assert len(response_cache) == 2
+
+    def test_error_responses_not_cached(self, app):
+        """200이 아닌 응답은 캐싱하지 않는지 테스트"""
+        client = app.test_client()
+
+        assert client.get("/missing").status_code == 404
+        client.get("/missing")
+
+        assert app.calls["count"] == 2
+
+    def test_disabled(self, app):
+        """RESPONSE_CACHE_ENABLED가 False이면 캐싱하지 않는지 테스트"""
+        app.config["RESPONSE_CACHE_ENABLED"] = False
+        client = app.test_client()
+
+        client.get("/items")
+        client.get("/items")
+
+        assert app.calls["count"] == 2
+
+
+class TestCompression:
+    """Accept-Encoding 협상 및 미리 압축한 응답 테스트"""
+
+    def test_gzip(self, app):
+        """gzip만 허용하면 gzip으로 압축한 본문을 반환하는지 테스트"""
+        client = app.test_client()
+        plain = client.get("/large")
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == plain.data
+
+    def test_brotli_preferred(self, app):
+        """br과 gzip을 모두 허용하면 br을 선택하는지 테스트"""
+        client = app.test_client()
+        plain = client.get("/large")
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, deflate, br"})
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert brotli.decompress(response.data) == plain.data
+        assert app.calls["count"] == 1
+
+    def test_quality_values(self, app):
+        """q 값이 더 높은 인코딩을 선택하고, q=0이면 제외하는지 테스트"""
+        client = app.test_client()
+
+        assert client.get("/large", headers={"Accept-Encoding": "br;q=0.5, gzip"}).headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in client.get("/large", headers={"Accept-Encoding": "gzip;q=0"}).headers
+
+    def test_small_response_not_compressed(self, app):
+        """작은 응답은 압축하지 않고 Vary만 추가하는지 테스트"""
+        client = app.test_client()
+
+        response = client.get("/items", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_etag_per_encoding(self, app):
+        """압축 방식마다 다른 ETag를 사용하고, 같은 방식이면 304를 반환하는지 테스트"""
+        client = app.test_client()
+        plain = client.get("/large")
+        gzipped = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert gzipped.headers["ETag"] != plain.headers["ETag"]
+        # Given: gzip 표현의 ETag로 조건부 요청
+        headers = {"If-None-Match": gzipped.headers["ETag"]}
+
+        # When/Then: 같은 인코딩이면 304, 다른 인코딩이면 200
+        assert client.get("/large", headers={**headers, "Accept-Encoding": "gzip"}).status_code == 304
+        assert client.get("/large", headers={**headers, "Accept-Encoding": "br"}).status_code == 200
+
+    @pytest.fixture
+    def compress_calls(self, monkeypatch):
+        """_compress 호출의 (인코딩, 최대 압축 여부)를 기록하는 fixture"""
+        import app.utils.response_cache as module
+
+        calls = []
+        original = module._compress
+
+        def compress(body, encoding, best=False):
+            calls.append((encoding, best))
+            return original(body, encoding, best)
+
+        monkeypatch.setattr(module, "_compress", compress)
+        return calls
+
+    def test_compressed_once_per_encoding(self, app, compress_calls):
+        """요청 중 만든 항목은 요청된 인코딩만, 인코딩별로 한 번씩 속도 우선 수준으로 압축하는지 테스트"""
+        calls = compress_calls
+        client = app.test_client()
+
+        # When: 압축 없이 요청한 뒤 gzip만 반복 요청
+        client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert calls == []
+        for _ in range(3):
+            client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Then: gzip만 한 번 압축
+        assert calls == [("gzip", False)]
+
+    def test_warm_request_precompresses_best(self, app, compress_calls):
+        """미리 채우는 요청은 모든 인코딩을 최대 압축률로 미리 압축하는지 테스트"""
+        calls = compress_calls
+        client = app.test_client()
+
+        # When: 미리 채우기 요청 후 인코딩별 요청
+        client.get("/large", environ_base={WARM_ENVIRON_KEY: True})
+        for encoding in ("gzip", "br"):
+            client.get("/large", headers={"Accept-Encoding": encoding})
+
+        # Then
+        assert sorted(calls) == [("br", True), ("gzip", True)]
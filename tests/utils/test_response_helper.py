@@ -5,6 +5,7 @@ ResponseHelper 유틸리티 테스트
 import json
 import pytest
 from flask import Flask
+from app.utils.pagination import FieldColumns
 from app.utils.response_helper import ResponseHelper
 
 
@@ -34,6 +35,28 @@ class TestResponseHelper:
             response_data = json.loads(response.data)
             assert response_data == test_data
 
+    def test_batch_response(self, app):
+        """batch_response가 입력 순서를 유지하고 없는 코드를 missing에 담는지 테스트"""
+        with app.app_context():
+            # Given: 두 번째 코드는 없는 코드
+            records = [{"code": "1", "name": "진", "type": "술"}, {"code": "2", "name": "럼", "type": "술"}]
+            codes = ["2", "x", "1"]
+            items = [records[1], None, records[0]]
+
+            # When: name 필드만 선택해 응답 생성
+            response = ResponseHelper.batch_response(codes, items, ["name"], FieldColumns(records))
+
+            # Then: 코드별 결과와 누락 코드 반환
+            response_data = json.loads(response.data)
+            assert response_data["total_count"] == 3
+            assert response_data["found_count"] == 2
+            assert response_data["results"] == [
+                {"code": "2", "item": {"name": "럼"}},
+                {"code": "x", "item": None},
+                {"code": "1", "item": {"name": "진"}},
+            ]
+            assert response_data["missing"] == ["x"]
+
     def test_json_response_with_custom_status_code(self, app):
         """json_response 커스텀 상태 코드 테스트"""
         with app.app_context():
@@ -293,3 +316,97 @@ class TestResponseHelper:
             assert response_data["message"] == "입력 데이터가 유효하지 않습니다."
             assert response_data["error_code"] == "VALIDATION_ERROR"
             assert response_data["errors"] == errors
+
+    def test_make_etag_depends_on_parts(self):
+        """make_etag가 입력 값에 따라 결정적인 ETag를 만드는지 테스트"""
+        assert ResponseHelper.make_etag("v1", "/drink/all") == ResponseHelper.make_etag("v1", "/drink/all")
+        assert ResponseHelper.make_etag("v1", "/drink/all") != ResponseHelper.make_etag("v2", "/drink/all")
+
+    def test_is_not_modified(self, app):
+        """If-None-Match가 현재 ETag와 일치할 때만 304 대상으로 판단하는지 테스트"""
+        with app.test_request_context(headers={"If-None-Match": '"abc"'}):
+            assert ResponseHelper.is_not_modified("abc") is True
+            assert ResponseHelper.is_not_modified("def") is False
+
+        with app.test_request_context():
+            assert ResponseHelper.is_not_modified("abc") is False
+
+    def test_not_modified_response(self, app):
+        """304 응답에 검증자 헤더가 포함되는지 테스트"""
+        with app.app_context():
+            response = ResponseHelper.not_modified_response("abc")
+
+            assert response.status_code == 304
+            assert response.headers["ETag"] == '"abc"'
+            assert response.data == b""
+
+    def test_file_etag_uses_content(self, tmp_path):
+        """파일 ETag가 수정 시각이 아닌 내용으로 결정되는지 테스트"""
+        # Given: 내용이 같은 두 파일
+        (tmp_path / "a.png").write_bytes(b"image")
+        (tmp_path / "b.png").write_bytes(b"image")
+
+        # Then: 같은 ETag, 내용이 바뀌면 다른 ETag
+        etag = ResponseHelper.file_etag(str(tmp_path), "a.png")
+        assert etag == ResponseHelper.file_etag(str(tmp_path), "b.png")
+        (tmp_path / "a.png").write_bytes(b"changed image")
+        assert ResponseHelper.file_etag(str(tmp_path), "a.png") != etag
+        assert ResponseHelper.file_etag(str(tmp_path), "../a.png") is None
+
+
+class TestImageResponse:
+    """image_response 메서드 테스트"""
+
+    @pytest.fixture(params=[False, True], ids=["disk", "cache"])
+    def image_app(self, request, app, tmp_path):
+        """이미지 캐시 사용 여부별 Flask 애플리케이션 fixture"""
+        from app.utils.image_cache import image_cache
+
+        image_cache.clear()
+        app.config.update(IMAGE_CACHE_ENABLED=request.param, IMAGE_VARIANT_DIR=str(tmp_path / "variants"))
+        (tmp_path / "a.png").write_bytes(b"image")
+        yield app
+        image_cache.clear()
+
+    def test_content_hash_etag(self, image_app, tmp_path):
+        """내용 해시 ETag와 no-cache로 반환하고 ETag가 일치하면 304로 응답하는지 테스트"""
+        etag = ResponseHelper.file_etag(str(tmp_path), "a.png")
+
+        with image_app.test_request_context("/image"):
+            response = ResponseHelper.image_response(str(tmp_path), "a.png")
+            response.direct_passthrough = False
+
+            assert response.status_code == 200
+            assert response.get_data() == b"image"
+            assert response.mimetype == "image/png"
+            assert response.headers["ETag"] == f'"{etag}"'
+            assert response.cache_control.no_cache
+            assert not response.cache_control.immutable
+
+        with image_app.test_request_context("/image", headers={"If-None-Match": f'"{etag}"'}):
+            assert ResponseHelper.image_response(str(tmp_path), "a.png").status_code == 304
+
+    def test_hashed_url_immutable(self, image_app, tmp_path):
+        """v가 현재 ETag와 같을 때만 Cache-Control: immutable로 응답하는지 테스트"""
+        etag = ResponseHelper.file_etag(str(tmp_path), "a.png")
+
+        with image_app.test_request_context(f"/image?v={etag}"):
+            response = ResponseHelper.image_response(str(tmp_path), "a.png")
+
+            assert response.cache_control.immutable
+            assert response.cache_control.public
+            assert response.cache_control.max_age == 365 * 24 * 60 * 60
+            assert not response.cache_control.no_cache
+
+        with image_app.test_request_context("/image?v=stale"):
+            response = ResponseHelper.image_response(str(tmp_path), "a.png")
+
+            assert not response.cache_control.immutable
+            assert response.cache_control.no_cache
+
+    def test_missing_image(self, image_app, tmp_path):
+        """없는 이미지와 디렉토리 밖 경로는 404로 응답하는지 테스트"""
+        with image_app.test_request_context("/image"):
+            assert not ResponseHelper.image_exists(str(tmp_path), "missing.png")
+            assert ResponseHelper.image_response(str(tmp_path), "missing.png").status_code == 404
+            assert ResponseHelper.image_response(str(tmp_path), "../a.png").status_code == 404
@@ -0,0 +1,215 @@
+"""
+요청 병합(single-flight) 유틸리티 테스트
+"""
+
+import os
+import threading
+import time
+import pytest
+from app.utils import single_flight as single_flight_module
+from app.utils.single_flight import SingleFlight, make_key
+
+
+def run_concurrently(count, target):
+    """target을 count개 스레드에서 동시에 실행하고 결과 목록을 반환합니다."""
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_make_key_ignores_dict_key_order():
+    """인자의 딕셔너리 키 순서가 달라도 같은 키를 만드는지 테스트"""
+    assert make_key("persona", [{"a": 1, "b": 2}]) == make_key("persona", [{"b": 2, "a": 1}])
+    assert make_key("persona", "x") != make_key("embedding", "x")
+
+
+def test_concurrent_calls_share_one_result():
+    """같은 키의 동시 호출이 함수 한 번의 결과를 공유하는지 테스트"""
+    # Given: 느린 함수
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"recommendation": "진토닉"}
+
+    # When: 10개 스레드에서 동시에 호출
+    results, errors = run_concurrently(10, lambda: flight.do("key", slow))
+
+    # Then
+    assert len(calls) == 1
+    assert errors == [None] * 10
+    assert all(result == {"recommendation": "진토닉"} for result in results)
+    assert len(flight) == 0
+
+
+def test_error_is_shared_and_not_remembered():
+    """leader의 예외를 대기 중인 호출도 받고, 다음 호출은 다시 실행하는지 테스트"""
+    # Given
+    flight = SingleFlight()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        time.sleep(0.1)
+        raise ValueError("API 호출 실패")
+
+    # When
+    _, errors = run_concurrently(5, lambda: flight.do("key", failing))
+
+    # Then: 모두 같은 예외, 이후 호출은 새로 실행
+    assert len(calls) == 1
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_different_keys_run_independently():
+    """다른 키의 호출은 병합하지 않는지 테스트"""
+    flight = SingleFlight()
+
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+@pytest.mark.skipif(single_flight_module.fcntl is None, reason="fcntl이 없는 플랫폼")
+def test_cross_process_result_shared_through_lock_file(tmp_path):
+    """다른 프로세스(별도 인스턴스)가 기다리는 동안 기록된 결과를 잠금 파일로 공유하는지 테스트"""
+    # Given: 같은 잠금 디렉토리를 쓰는 두 인스턴스 (워커 프로세스 두 개에 해당)
+    first = SingleFlight(str(tmp_path))
+    second = SingleFlight(str(tmp_path))
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append("first")
+        started.set()
+        time.sleep(0.3)
+        return ["임베딩", 0.5]
+
+    # When: 첫 번째가 실행 중일 때 두 번째가 호출
+    thread = threading.Thread(target=lambda: first.do("key", slow))
+    thread.start()
+    started.wait(2)
+    shared = second.do("key", lambda: calls.append("second") or ["다른 결과"])
+    thread.join(5)
+
+    # Then: 두 번째는 함수를 실행하지 않고 첫 번째 결과를 사용
+    assert shared == ["임베딩", 0.5]
+    assert calls == ["first"]
+
+    # When: 이전에 기록된 결과는 이후 호출에서 재사용하지 않음
+    assert second.do("key", lambda: "새 결과") == "새 결과"
+
+    # Then: 끝난 호출의 잠금 파일은 남지 않음
+    assert os.listdir(tmp_path) == []
+
+
+def test_follower_wait_times_out():
+    """leader가 timeout 안에 끝나지 않으면 대기 중인 호출이 TimeoutError를 받는지 테스트"""
+    # Given: 멈춰 있는 leader
+    flight = SingleFlight(timeout=0.1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def stuck():
+        started.set()
+        release.wait(5)
+        return "늦은 결과"
+
+    thread = threading.Thread(target=lambda: flight.do("key", stuck))
+    thread.start()
+    started.wait(2)
+
+    # When / Then
+    with pytest.raises(TimeoutError):
+        flight.do("key", lambda: "다른 결과")
+    release.set()
+    thread.join(5)
+
+
+def test_started_flight_shared_with_do():
+    """start로 등록한 호출이 끝나면 같은 키의 do 호출이 그 결과를 받는지 테스트"""
+    # Given: 스트리밍 등으로 직접 등록한 호출
+    flight = SingleFlight()
+    handle, leader = flight.start("key")
+    results = []
+    thread = threading.Thread(target=lambda: results.append(flight.do("key", lambda: "다른 결과")))
+    thread.start()
+
+    # When: leader가 결과와 함께 끝냄
+    time.sleep(0.05)
+    flight.finish("key", handle, "스트림 결과")
+    thread.join(5)
+
+    # Then: do 호출은 fn을 실행하지 않고 같은 결과를 받고, 진행 중인 호출은 남지 않음
+    assert leader is True
+    assert results == ["스트림 결과"]
+    assert len(flight) == 0
+
+
+@pytest.mark.skipif(single_flight_module.fcntl is None, reason="fcntl이 없는 플랫폼")
+def test_cross_process_lock_wait_times_out(tmp_path):
+    """다른 프로세스의 호출이 timeout 안에 끝나지 않으면 TimeoutError를 받는지 테스트"""
+    # Given: 첫 번째 인스턴스가 잠금을 쥐고 멈춰 있는 상태
+    first = SingleFlight(str(tmp_path))
+    second = SingleFlight(str(tmp_path), timeout=0.1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def stuck():
+        started.set()
+        release.wait(5)
+        return "늦은 결과"
+
+    thread = threading.Thread(target=lambda: first.do("key", stuck))
+    thread.start()
+    started.wait(2)
+
+    # When / Then
+    with pytest.raises(TimeoutError):
+        second.do("key", lambda: "다른 결과")
+    release.set()
+    thread.join(5)
+
+
+@pytest.mark.skipif(single_flight_module.fcntl is None, reason="fcntl이 없는 플랫폼")
+def test_cross_process_retry_after_leader_failure(tmp_path):
+    """다른 프로세스의 leader가 실패하면 기다리던 호출이 직접 실행하고 잠금 파일을 남기지 않는지 테스트"""
+    # Given: 실패하는 leader
+    first = SingleFlight(str(tmp_path))
+    second = SingleFlight(str(tmp_path))
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("API 호출 실패")
+
+    def run_first():
+        with pytest.raises(ValueError):
+            first.do("key", failing)
+
+    thread = threading.Thread(target=run_first)
+    thread.start()
+    started.wait(2)
+
+    # When
+    result = second.do("key", lambda: "직접 실행")
+    thread.join(5)
+
+    # Then
+    assert result == "직접 실행"
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,24 @@
+"""
+Server-Sent Events 유틸리티 테스트
+"""
+
+from app.utils.json_encoder import get_json_encoder
+from app.utils.sse import format_event, iter_sse
+
+
+def test_format_event():
+    """이벤트 이름과 compact JSON 데이터로 SSE 이벤트를 만드는지 테스트"""
+    encoder = get_json_encoder("stdlib")
+
+    event = format_event("recommendation", {"name": "진토닉", "reason": "줄\n바꿈"}, encoder)
+
+    assert event == 'event: recommendation\ndata: {"name":"진토닉","reason":"줄\\n바꿈"}\n\n'.encode("utf-8")
+
+
+def test_iter_sse():
+    """이벤트마다 하나의 청크를 내보내는지 테스트"""
+    encoder = get_json_encoder("stdlib")
+
+    chunks = list(iter_sse([("recommendation", {"n": 1}), ("done", {})], encoder))
+
+    assert chunks == [b'event: recommendation\ndata: {"n":1}\n\n', b"event: done\ndata: {}\n\n"]
@@ -0,0 +1,91 @@
+"""
+NgramIndex 유틸리티 테스트
+"""
+
+import unicodedata
+import pytest
+from app.utils.text_index import NgramIndex, normalize_text
+
+
+@pytest.fixture
+def drinks():
+    """테스트용 음료 리스트"""
+    return [
+        {"code": "1", "name": "스카치블루 21년"},
+        {"code": "2", "name": "Absolut Vodka"},
+        {"code": "3", "name": "스카치블루 17년"},
+        {"code": "4", "name": "Absolut Citron"},
+    ]
+
+
+class TestNgramIndex:
+    """NgramIndex 클래스 테스트"""
+
+    def test_search_korean_substring(self, drinks):
+        """한글 부분 문자열 검색 결과가 카탈로그 순서를 유지하는지 테스트"""
+        index = NgramIndex(drinks, ("name",))
+
+        results = index.search("카치블")
+
+        assert [drink["code"] for drink in results] == ["1", "3"]
+
+    def test_search_short_queries(self, drinks):
+        """1~2글자 질의도 검색되는지 테스트"""
+        index = NgramIndex(drinks, ("name",))
+
+        assert [drink["code"] for drink in index.search("년")] == ["1", "3"]
+        assert [drink["code"] for drink in index.search("21")] == ["1"]
+
+    def test_search_case_insensitive(self, drinks):
+        """영문 검색이 대소문자를 구분하지 않는지 테스트"""
+        index = NgramIndex(drinks, ("name",))
+
+        assert [drink["code"] for drink in index.search("ABSOLUT")] == ["2", "4"]
+
+    def test_search_verifies_substring(self):
+        """n-gram이 모두 있어도 실제로 포함되지 않으면 제외하는지 테스트"""
+        # Given: "abcab"는 "bca"의 trigram들을 갖지만 "abcabc"는 포함하지 않음
+        index = NgramIndex([{"name": "abcab"}], ("name",))
+
+        assert index.search("abcabc") == []
+        assert index.search("bca") == [{"name": "abcab"}]
+
+    def test_search_multiple_fields(self, sample_recipes_list):
+        """여러 필드 중 하나라도 포함하면 검색되는지 테스트"""
+        index = NgramIndex(sample_recipes_list, ("korean_name", "english_name"))
+
+        assert [recipe["code"] for recipe in index.search("모히")] == ["500601"]
+        assert [recipe["code"] for recipe in index.search("tonic")] == ["300600"]
+
+    def test_search_decomposed_hangul(self, drinks):
+        """자모가 분리된(NFD) 한글 질의도 검색되는지 테스트"""
+        index = NgramIndex(drinks, ("name",))
+        decomposed = unicodedata.normalize("NFD", "스카치")
+
+        assert [drink["code"] for drink in index.search(decomposed)] == ["1", "3"]
+
+    def test_search_no_match_or_empty(self, drinks):
+        """매칭되지 않거나 빈 질의는 빈 리스트를 반환하는지 테스트"""
+        index = NgramIndex(drinks, ("name",))
+
+        assert index.search("진토닉") == []
+        assert index.search("") == []
+        assert index.search(None) == []
+
+    def test_search_fallback_uses_first_present_field(self):
+        """fallback이면 레코드가 가진 첫 번째 필드만 검색하는지 테스트"""
+        # Given: title과 name을 모두 가진 레코드와 name만 가진 레코드
+        records = [
+            {"id": "1", "title": "주간 챌린지", "name": "테이스팅 마스터"},
+            {"id": "2", "name": "홈텐딩 마스터"},
+        ]
+        index = NgramIndex(records, ("title", "name"), fallback=True)
+
+        # When / Then: title이 있는 레코드는 name으로 검색되지 않음
+        assert [record["id"] for record in index.search("마스터")] == ["2"]
+        assert [record["id"] for record in index.search("주간")] == ["1"]
+
+    def test_normalize_text(self):
+        """텍스트 정규화 테스트"""
+        assert normalize_text("Gin") == "gin"
+        assert normalize_text(None) == ""